@@ -3,18 +3,22 @@
 '''
 '''
 
+import os
 import sys
 import random
 from random import randint
 
 from PyQt5 import Qt
 from PyQt5 import QtCore
-from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 from PyQt5.QtGui import QColor
 from PyQt5.QtGui import QPalette
 
 from guiDemo import Ui_MainWindow
+from slideSwitchBuilder import SlideSwitchBuilder
+from slideSwitchTheme import SlideSwitchTheme
+from slideSwitchTheme import SlideSwitchThemeRegistry
+from slideSwitchTheme import applyThemes
 
 
 class AppDemo(Ui_MainWindow):
@@ -27,83 +31,37 @@ class AppDemo(Ui_MainWindow):
 
         super(AppDemo, self).setupUi(MW)
 
-        self.palette01 = QPalette()
-        self.palette01.setColor(QPalette.Highlight, QColor(0, 136, 0))
-        self.palette01.setColor(QPalette.Shadow, QColor(128, 0, 0))
+        builder = SlideSwitchBuilder.fromFile(os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'appDemo.json'))
 
-        self.palette02 = QPalette()
-        self.palette02.setColor(QPalette.Highlight, QColor(239, 120, 55))
-        self.palette02.setColor(QPalette.Shadow, QColor(53, 53, 53))
-
-        self.palette03 = QPalette()
-        self.palette03.setColor(QPalette.Highlight, QColor(133, 104, 238))
-        self.palette03.setColor(QPalette.Shadow, QColor(200, 200, 200))
-        self.palette03.setColor(QPalette.HighlightedText, QColor(255, 255, 0))
-        self.palette03.setColor(QPalette.Text, QColor(255, 255, 255))
-
-        self.palette04 = QPalette()
-        self.palette04.setColor(QPalette.Highlight, QColor(0, 0, 255))
-        self.palette04.setColor(QPalette.Shadow, QColor(188, 160, 199))
-
-        self.slideSwitch01.setPalette(self.palette01)
-        self.slideSwitch02.setPalette(self.palette02)
-        self.slideSwitch03.setPalette(self.palette03)
-        self.slideSwitch03.setThumbText('On', 'Off')
-        self.slideSwitch04.setPalette(self.palette04)
-        self.slideSwitch04.setThumbText('✔', '✕')
+        self.palette01 = builder.palette('palette01')
+        self.palette02 = builder.palette('palette02')
+        self.palette03 = builder.palette('palette03')
+        self.palette04 = builder.palette('palette04')
 
         self.default_palette = self.slideSwitch05.palette()
 
-        int_anim_dur = 120
-
-        for i in range(0, 8):
-
-            str_obj_slide_switch = 'slideSwitch'
-
-            str_obj_lbl = 'label'
-
-            str_no = str(i+1).zfill(2)
-
-            str_obj_slide_switch += str_no
-
-            obj_slide_switch = getattr(self, str_obj_slide_switch)
-
-            if (i+1) <= 4:
-
-                str_obj_lbl += str_no
-
-                obj_lbl = getattr(self, str_obj_lbl)
-
-                obj_slide_switch.toggled['bool'].connect(obj_lbl.setEnabled)
+        # styles, texts, directions, durations and label bindings all come
+        # from the description
+        self.switch_group = builder.apply(self.centralwidget, parent=MW)
 
-                obj_lbl.setEnabled(obj_slide_switch.isChecked())
+        self.themes = SlideSwitchThemeRegistry.instance()
 
-            else:
+        self.themes.register('palette01', self.palette01)
+        self.themes.register('palette02', self.palette02)
+        self.themes.register('palette03', self.palette03)
+        self.themes.register('palette04', self.palette04)
+        self.themes.register('default', self.default_palette)
 
-                pass
-
-            if (i+1) >= 5:
-
-                int_anim_dur += int_anim_dur
-
-                obj_slide_switch.setDirection('v')
-
-                obj_slide_switch.setThumbText('是', '否')
-
-                obj_slide_switch.setTrackRadius(8)
-
-                obj_slide_switch.setAnimDur(int_anim_dur)
-
-                font = QtGui.QFont()
-                font.setFamily("Microsoft YaHei")
-                font.setPointSize(6)
-                obj_slide_switch.setFont(font)
-
-                obj_slide_switch.update()
-
-            else:
-
-                pass
+        # the theme of each switch when the colours are reset
+        self.default_themes = [
+            ('palette01', [self.slideSwitch01]),
+            ('palette02', [self.slideSwitch02]),
+            ('palette03', [self.slideSwitch03]),
+            ('palette04', [self.slideSwitch04]),
+            ('default', [self.slideSwitch05, self.slideSwitch06,
+                         self.slideSwitch07, self.slideSwitch08]),
+        ]
 
         self.allOn()
 
@@ -117,49 +75,18 @@ class AppDemo(Ui_MainWindow):
         '''
         '''
 
-        for i in range(0, 8):
-
-            str_no = str(i+1).zfill(2)
-
-            str_obj_slide_switch = 'slideSwitch'
-
-            str_obj_palette = 'palette'
-
-            str_obj_slide_switch += str_no
-
-            str_obj_palette += str_no
-
-            obj_slide_switch = getattr(self, str_obj_slide_switch)
-
-            if (i+1) <= 4:
-
-                obj_palette = getattr(self, str_obj_palette)
-
-                obj_slide_switch.setPalette(obj_palette)
-
-                obj_slide_switch.update()
-
-            else:
-
-                obj_slide_switch.setPalette(self.default_palette)
-
-                obj_slide_switch.update()
+        applyThemes([(self.themes.theme(name), switches)
+                     for name, switches in self.default_themes])
 
     def shuffleColors(self):
         '''
         '''
 
-        for i in range(0, 8):
-
-            str_obj = 'slideSwitch'
+        random.seed()
 
-            str_no = str(i+1).zfill(2)
+        assignments = []
 
-            str_obj += str_no
-
-            obj = getattr(self, str_obj)
-
-            random.seed()
+        for obj in self.switch_group.switches():
 
             palette_temp = QPalette()
 
@@ -176,41 +103,23 @@ class AppDemo(Ui_MainWindow):
             palette_temp.setColor(
                 QPalette.Shadow, QColor(int_rs, int_gs, int_bs))
 
-            obj.setPalette(palette_temp)
+            assignments.append(
+                (SlideSwitchTheme.fromPalette(palette_temp), [obj]))
 
-            obj.update()
+        # one pass and one repaint for all the switches
+        applyThemes(assignments)
 
     def allOn(self):
         '''
         '''
 
-        for i in range(0, 8):
-
-            str_obj = 'slideSwitch'
-
-            str_no = str(i+1).zfill(2)
-
-            str_obj += str_no
-
-            obj = getattr(self, str_obj)
-
-            obj.setChecked(True)
+        self.switch_group.setAll(True)
 
     def allOff(self):
         '''
         '''
 
-        for i in range(0, 8):
-
-            str_obj = 'slideSwitch'
-
-            str_no = str(i+1).zfill(2)
-
-            str_obj += str_no
-
-            obj = getattr(self, str_obj)
-
-            obj.setChecked(False)
+        self.switch_group.setAll(False)
 
 
 def main():
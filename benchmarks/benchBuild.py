@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+'''
+Build benchmark for :code:`SlideSwitchBuilder`.
+
+Generates a JSON panel description with :code:`count` individually listed
+switches spread over a few palettes, styles, directions and texts, then
+times parsing it, building the panel and showing its first frame in a
+scroll area. The run fails (exit status 1) if the total exceeds the time
+budget. Results are written as JSON, e.g.::
+
+    python benchmarks/benchBuild.py --count 10000 --output build.json
+'''
+
+import argparse
+import json
+import sys
+
+from benchCommon import application, timer, writeResults
+
+from PyQt5.QtWidgets import QScrollArea
+
+from slideSwitchBuilder import SlideSwitchBuilder
+
+
+def makeDescription(count):
+    '''
+    JSON text of a panel with :code:`count` switches.
+    '''
+
+    switches = []
+
+    for i in range(count):
+
+        entry = {
+            'name': 'switch{0}'.format(i),
+            'style': ('small', 'large')[i % 2],
+            'palette': ('green', 'orange', 'blue')[i % 3],
+            'checked': i % 5 == 0,
+        }
+
+        if i % 7 == 0:
+
+            entry['thumb_texts'] = ['Off', 'On']
+
+        if i % 11 == 0:
+
+            entry['enabled'] = False
+
+        switches.append(entry)
+
+    return json.dumps({
+        'palettes': {
+            'green': {'highlight': '#008800', 'shadow': '#800000'},
+            'orange': {'highlight': '#ef7837', 'shadow': '#353535'},
+            'blue': {'highlight': [0, 0, 255], 'shadow': [188, 160, 199]},
+        },
+        'styles': {
+            'small': {'track_radius': 8, 'thumb_radius': 12},
+            'large': {'track_radius': 10, 'thumb_radius': 12},
+        },
+        'panel': {'style': 'small', 'columns': 32, 'spacing': 4},
+        'switches': switches,
+    })
+
+
+def timeBuild(text, repeat):
+    '''
+    Best-of-:code:`repeat` parse, build and first frame times, in
+    seconds.
+    '''
+
+    app = application()
+
+    best = None
+
+    for _ in range(repeat):
+
+        start = timer()
+
+        builder = SlideSwitchBuilder.fromJson(text)
+
+        parsed = timer()
+
+        scroll_area = QScrollArea()
+
+        panel = builder.build(scroll_area)
+
+        panel.resize(panel.sizeHint())
+
+        scroll_area.setWidget(panel)
+
+        built = timer()
+
+        scroll_area.resize(800, 600)
+
+        scroll_area.show()
+
+        app.processEvents()
+
+        app.processEvents()
+
+        first = timer()
+
+        times = (parsed - start, built - parsed, first - built, first - start)
+
+        if best is None or times[-1] < best[-1]:
+
+            best = times
+
+        scroll_area.close()
+
+        scroll_area.deleteLater()
+
+        app.processEvents()
+
+    return best
+
+
+def run(count, repeat, budget):
+
+    text = makeDescription(count)
+
+    parse_s, build_s, first_frame_s, total_s = timeBuild(text, repeat)
+
+    return [{
+        'name': 'build',
+        'count': count,
+        'repeat': repeat,
+        'description_bytes': len(text),
+        'parse_s': parse_s,
+        'build_s': build_s,
+        'first_frame_s': first_frame_s,
+        'total_s': total_s,
+        'budget_s': budget,
+        'within_budget': total_s <= budget,
+    }]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--count', type=int, default=10000,
+                        help='switches in the panel (default: 10000)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='repetitions, the best one is kept (default: 3)')
+
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help='time budget for parse, build and first frame,'
+                             ' in seconds (default: 0.5)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.repeat, args.budget)
+
+    writeResults('build', results, args.output)
+
+    if not results[0]['within_budget']:
+
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+'''
+Helpers shared by the slide switch benchmarks.
+
+The benchmarks are meant to run headless, so the :code:`offscreen` QPA
+platform is selected unless :code:`QT_QPA_PLATFORM` is already set.
+'''
+
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+from PyQt5.QtWidgets import QApplication
+
+import slideSwitch
+
+timer = time.perf_counter
+
+# the application created by application(), kept alive for the whole run
+_app = None
+
+
+def application():
+    '''
+    Return the running :code:`QApplication`, creating one if needed.
+    '''
+
+    global _app
+
+    app = QApplication.instance()
+
+    if app is None:
+
+        app = _app = QApplication([sys.argv[0]])
+
+    return app
+
+
+def metadata():
+    '''
+    Environment information stored next to the benchmark results.
+    '''
+
+    return {
+        'slide_switch_version': slideSwitch.__version__,
+        'python': platform.python_version(),
+        'qt': QT_VERSION_STR,
+        'pyqt': PYQT_VERSION_STR,
+        'qpa_platform': application().platformName(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def writeResults(name, results, output=None):
+    '''
+    Write :code:`results` as JSON to :code:`output` (or stdout if None).
+    '''
+
+    document = {
+        'benchmark': name,
+        'meta': metadata(),
+        'results': results,
+    }
+
+    text = json.dumps(document, indent=2, sort_keys=True)
+
+    if output is None or output == '-':
+
+        sys.stdout.write(text + '\n')
+
+    else:
+
+        with open(output, 'w') as f:
+
+            f.write(text + '\n')
+
+    return document
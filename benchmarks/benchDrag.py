@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+'''
+Thumb drag benchmark.
+
+Drags the thumbs of 50 switches one after the other with mouse moves
+sent every millisecond, like a 1000 Hz gaming mouse, through the window
+so that they take the same path as real input. It reports the time spent
+handling a move, the number of thumb updates per frame while dragging
+(coalescing keeps it at most 1) and the longest stall of the event loop,
+i.e. the longest time between two moves. Results are written as JSON, e.g.::
+
+    python benchmarks/benchDrag.py --output drag.json
+'''
+
+import argparse
+
+from benchCommon import application, timer, writeResults
+
+from PyQt5.QtCore import QPoint, Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QGridLayout, QWidget
+
+from slideSwitch import SlideSwitch, SlideSwitchDragger
+from slideSwitchMetrics import SlideSwitchMetrics
+
+COLUMNS = 10
+
+
+def wait(app, until):
+
+    while timer() < until:
+
+        app.processEvents()
+
+
+def dragSwitch(app, window, switch, duration, rate):
+    '''
+    Drag the thumb of :code:`switch` to its other end and back for
+    :code:`duration` seconds with :code:`rate` moves per second. Returns
+    the number of moves, the time spent handling them, the longest time
+    between two moves (both in seconds) and the number of thumb updates
+    until the release.
+    '''
+
+    metrics = SlideSwitchMetrics.instance()
+
+    updates = metrics.switchCounters(switch)['offset_updates']
+
+    geometry = switch.switchGeometry()
+
+    radius = geometry.thumb_size / 2.0
+
+    start = switch.mapTo(window, QPoint(
+        int(geometry.origin_x + radius + geometry.axis_x * switch.offset),
+        int(geometry.origin_y + radius + geometry.axis_y * switch.offset)))
+
+    low, high = min(geometry.travel), max(geometry.travel)
+
+    sign = 1 if switch.offset == low else -1
+
+    handle = window.windowHandle()
+
+    QTest.mousePress(handle, Qt.LeftButton, Qt.NoModifier, start)
+
+    moves = int(duration * rate)
+
+    handling = 0.0
+
+    max_gap = 0.0
+
+    last = timer()
+
+    for i in range(1, moves + 1):
+
+        # there and back again along the switch direction
+        phase = 2.0 * i / moves
+
+        travel = (high - low) * (phase if phase <= 1.0 else 2.0 - phase)
+
+        delta = int(sign * travel)
+
+        pos = start + QPoint(delta * geometry.axis_x,
+                             delta * geometry.axis_y)
+
+        begin = timer()
+
+        max_gap = max(max_gap, begin - last)
+
+        QTest.mouseMove(handle, pos)
+
+        last = timer()
+
+        handling += last - begin
+
+        wait(app, begin + 1.0 / rate)
+
+    updates = metrics.switchCounters(switch)['offset_updates'] - updates
+
+    QTest.mouseRelease(handle, Qt.LeftButton, Qt.NoModifier, start)
+
+    return moves, handling, max_gap, updates
+
+
+def run(count, duration, rate):
+
+    app = application()
+
+    window = QWidget()
+
+    layout = QGridLayout(window)
+
+    switches = []
+
+    for i in range(count):
+
+        switch = SlideSwitch(window)
+
+        layout.addWidget(switch, *divmod(i, COLUMNS))
+
+        switches.append(switch)
+
+    window.show()
+
+    app.processEvents()
+
+    dragger = SlideSwitchDragger.instance()
+
+    metrics = SlideSwitchMetrics.instance()
+
+    metrics.enable()
+
+    metrics.reset()
+
+    total_moves = 0
+
+    handling = 0.0
+
+    max_gap = 0.0
+
+    drag_updates = 0
+
+    for switch in switches:
+
+        moves, switch_handling, switch_gap, updates = dragSwitch(
+            app, window, switch, duration, rate)
+
+        total_moves += moves
+
+        handling += switch_handling
+
+        max_gap = max(max_gap, switch_gap)
+
+        drag_updates += updates
+
+    # let the snap animations finish
+    wait(app, timer() + 0.3)
+
+    counters = metrics.aggregate()
+
+    metrics.disable()
+
+    interval = dragger._timer.interval()
+
+    frames = count * duration * 1000.0 / interval
+
+    window.close()
+
+    return [{
+        'name': 'drag',
+        'switches': count,
+        'moves': total_moves,
+        'move_rate_hz': rate,
+        'move_us': handling / total_moves * 1e6,
+        'max_stall_ms': max_gap * 1000.0,
+        'frame_interval_ms': interval,
+        'drag_offset_updates': drag_updates,
+        'drag_offset_updates_per_frame': drag_updates / frames,
+        'offset_updates': counters['offset_updates'],
+        'paints': counters['paints'],
+    }]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--count', type=int, default=50,
+                        help='switches dragged one after the other'
+                             ' (default: 50)')
+
+    parser.add_argument('--duration', type=float, default=0.1,
+                        help='drag time per switch, in seconds'
+                             ' (default: 0.1)')
+
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help='mouse moves per second (default: 1000)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    writeResults('drag', run(args.count, args.duration, args.rate),
+                 args.output)
+
+
+if __name__ == '__main__':
+
+    main()
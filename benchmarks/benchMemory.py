@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+'''
+Memory benchmark for :code:`SlideSwitch`.
+
+Creates 1k, 10k and 100k switches (sized and painted once, so painters
+and their caches exist) and reports the memory they take per switch: the
+Python allocations traced by :code:`tracemalloc` and the growth of the
+resident set size of the process, which includes the Qt objects. It also
+checks that dropped switches are freed by reference counting alone, i.e.
+without the cycle collector. The run fails (exit status 1) if the traced
+bytes per switch exceed :code:`--max-bytes`. Results are written as JSON,
+e.g.::
+
+    python benchmarks/benchMemory.py --output memory.json
+'''
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+import weakref
+
+from benchCommon import application, writeResults
+
+from PyQt5.QtGui import QImage
+
+from slideSwitch import SlideSwitch
+
+COUNTS = (1000, 10000, 100000)
+
+
+def residentBytes():
+    '''
+    Resident set size of the process in bytes, or None if unknown.
+    '''
+
+    try:
+
+        with open('/proc/self/statm') as f:
+
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    except (IOError, OSError, ValueError):
+
+        pass
+
+    try:
+
+        import resource
+
+    except ImportError:
+
+        return None
+
+    # peak rather than current size, in kilobytes on Linux and in bytes
+    # on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def makeSwitches(count, image):
+
+    switches = []
+
+    for i in range(count):
+
+        switch = SlideSwitch(thumb_txt_true='On', thumb_txt_false='Off')
+
+        switch.resize(switch.sizeHint())
+
+        switch.setChecked(i % 2 == 0)
+
+        switches.append(switch)
+
+    # a few paints create the shared painters and their cached pixmaps
+    for switch in switches[:4]:
+
+        switch.render(image)
+
+    return switches
+
+
+def measure(count):
+
+    app = application()
+
+    image = QImage(128, 64, QImage.Format_ARGB32_Premultiplied)
+
+    # warm up: class level caches are not part of the cost per switch
+    makeSwitches(4, image)
+
+    app.processEvents()
+
+    gc.collect()
+
+    rss_before = residentBytes()
+
+    tracemalloc.start()
+
+    traced_before = tracemalloc.get_traced_memory()[0]
+
+    switches = makeSwitches(count, image)
+
+    gc.collect()
+
+    traced_after = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    rss_after = residentBytes()
+
+    ref = weakref.ref(switches[-1])
+
+    gc.disable()
+
+    try:
+
+        del switches
+
+        freed_without_gc = ref() is None
+
+    finally:
+
+        gc.enable()
+
+    gc.collect()
+
+    app.processEvents()
+
+    result = {
+        'name': 'memory',
+        'count': count,
+        'traced_bytes_per_switch': (traced_after - traced_before) / count,
+        'freed_without_gc': freed_without_gc,
+    }
+
+    if rss_before is not None:
+
+        result['rss_bytes_per_switch'] = (rss_after - rss_before) / count
+
+    return result
+
+
+def run(counts):
+
+    return [measure(count) for count in counts]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--counts', type=int, nargs='+', default=COUNTS,
+                        help='numbers of switches (default: 1000 10000'
+                             ' 100000)')
+
+    parser.add_argument('--max-bytes', type=float, default=None,
+                        help='fail if the traced Python bytes per switch'
+                             ' exceed this (default: no limit)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    results = run(args.counts)
+
+    if args.max_bytes is not None:
+
+        for result in results:
+
+            result['max_bytes'] = args.max_bytes
+
+            result['within_budget'] = \
+                result['traced_bytes_per_switch'] <= args.max_bytes
+
+    writeResults('memory', results, args.output)
+
+    if not all(result.get('within_budget', True) for result in results):
+
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+'''
+Paint benchmark for :code:`SlideSwitch`.
+
+Times :code:`paintEvent` per widget for every combination of direction,
+enabled status and thumb text, across several widget counts, full
+animation sweeps driven by the :code:`offset` property, and the
+:code:`SlideSwitchGeometry` mapping from offset to thumb and dirty
+rectangles. Results are written as JSON, e.g.::
+
+    python benchmarks/benchPaint.py --output paint.json
+'''
+
+import argparse
+import itertools
+
+from benchCommon import application, timer, writeResults
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QWidget
+
+from slideSwitch import SlideSwitch, SlideSwitchGeometry, SlideSwitchStyle
+
+
+def makeSwitches(count, direction, enabled, text, pixmap_cache,
+                 frame_strips=0):
+    '''
+    Create :code:`count` sized, unshown switches under one container.
+    '''
+
+    container = QWidget()
+
+    switches = []
+
+    for i in range(count):
+
+        sw = SlideSwitch(container, direction=direction,
+                         pixmap_cache=pixmap_cache,
+                         frame_strips=frame_strips)
+
+        if text:
+
+            sw.setThumbText('On', 'Off')
+
+        if direction == 'v':
+
+            sw.resize(40, 80)
+
+        else:
+
+            sw.resize(80, 40)
+
+        sw.setChecked(bool(i % 2))
+
+        sw.setEnabled(enabled)
+
+        switches.append(sw)
+
+    return container, switches
+
+
+def timePaint(switches, repeat):
+    '''
+    Best-of-:code:`repeat` time to paint every switch once, in seconds.
+    '''
+
+    size = switches[0].size()
+
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+
+    best = None
+
+    for _ in range(repeat):
+
+        image.fill(Qt.transparent)
+
+        start = timer()
+
+        for sw in switches:
+
+            sw.render(image)
+
+        elapsed = timer() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def timeSweep(switches, frames, repeat):
+    '''
+    Best-of-:code:`repeat` time to animate every switch from one end of
+    the track to the other in :code:`frames` steps of the :code:`offset`
+    property, painting each step, in seconds.
+    '''
+
+    size = switches[0].size()
+
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+
+    best = None
+
+    for _ in range(repeat):
+
+        start = timer()
+
+        for sw in switches:
+
+            begin, end = sw.switchGeometry().travel
+
+            if sw.isChecked():
+
+                begin, end = end, begin
+
+            for frame in range(frames + 1):
+
+                sw.setProperty(
+                    'offset', int(begin + (end - begin) * frame / frames))
+
+                sw.render(image)
+
+        elapsed = timer() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def timeGeometry(direction, calls, repeat):
+    '''
+    Best-of-:code:`repeat` time to map :code:`calls` offsets to a thumb
+    rectangle and a dirty rectangle, in seconds.
+    '''
+
+    style = SlideSwitchStyle(direction=direction)
+
+    size = style.naturalSize()
+
+    geometry = SlideSwitchGeometry(style, size.width(), size.height())
+
+    begin, end = geometry.travel
+
+    step = (end - begin) / float(calls)
+
+    best = None
+
+    for _ in range(repeat):
+
+        start = timer()
+
+        offset = begin
+
+        for _ in range(calls):
+
+            geometry.thumbRect(offset)
+
+            geometry.dirtyRect(offset, offset + step)
+
+            offset += step
+
+        elapsed = timer() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def run(counts, repeat, frames, sweep_count, pixmap_cache, frame_strips=0):
+
+    app = application()
+
+    results = []
+
+    for direction in ('h', 'v'):
+
+        calls = 10000
+
+        elapsed = timeGeometry(direction, calls, repeat)
+
+        results.append({
+            'name': 'geometry',
+            'direction': direction,
+            'count': calls,
+            'repeat': repeat,
+            'total_s': elapsed,
+            'per_call_us': 1e6 * elapsed / calls,
+        })
+
+    for direction, enabled, text in itertools.product(
+            ('h', 'v'), (True, False), (False, True)):
+
+        case = {
+            'direction': direction,
+            'enabled': enabled,
+            'thumb_text': text,
+            'pixmap_cache': pixmap_cache,
+            'frame_strips': frame_strips,
+        }
+
+        for count in counts:
+
+            container, switches = makeSwitches(
+                count, direction, enabled, text, pixmap_cache, frame_strips)
+
+            app.processEvents()
+
+            elapsed = timePaint(switches, repeat)
+
+            result = dict(case)
+
+            result.update({
+                'name': 'paint',
+                'count': count,
+                'repeat': repeat,
+                'total_s': elapsed,
+                'per_widget_us': 1e6 * elapsed / count,
+            })
+
+            results.append(result)
+
+            container.deleteLater()
+
+            app.processEvents()
+
+        container, switches = makeSwitches(
+            sweep_count, direction, enabled, text, pixmap_cache,
+            frame_strips)
+
+        app.processEvents()
+
+        elapsed = timeSweep(switches, frames, repeat)
+
+        result = dict(case)
+
+        result.update({
+            'name': 'animation_sweep',
+            'count': sweep_count,
+            'frames': frames,
+            'repeat': repeat,
+            'total_s': elapsed,
+            'per_sweep_ms': 1e3 * elapsed / sweep_count,
+            'per_frame_us': 1e6 * elapsed / (sweep_count * (frames + 1)),
+        })
+
+        results.append(result)
+
+        container.deleteLater()
+
+        app.processEvents()
+
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--counts', type=int, nargs='+',
+                        default=[1, 100, 10000],
+                        help='widget counts to paint (default: 1 100 10000)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='repetitions, the best one is kept (default: 3)')
+
+    parser.add_argument('--frames', type=int, default=30,
+                        help='frames per animation sweep (default: 30)')
+
+    parser.add_argument('--sweep-count', type=int, default=100,
+                        help='switches per animation sweep (default: 100)')
+
+    parser.add_argument('--pixmap-cache', action='store_true',
+                        help='enable the shared pixmap cache')
+
+    parser.add_argument('--frame-strips', type=int, default=0,
+                        help='frames per pre-rendered transition strip'
+                             ' (default: 0, i.e., off)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    results = run(args.counts, args.repeat, args.frames, args.sweep_count,
+                  args.pixmap_cache, args.frame_strips)
+
+    writeResults('paint', results, args.output)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+'''
+Startup benchmark for large panels of slide switches.
+
+Builds a window with tabs of scroll areas holding :code:`count` switches
+in total, once eagerly (one :code:`SlideSwitch` per switch, with its own
+:code:`QFont` and :code:`QSizePolicy` like code generated by
+:code:`pyuic5`) and once with :code:`SlideSwitchPanel`, and times the
+construction and the time until the first frame is painted. Results are
+written as JSON, e.g.::
+
+    python benchmarks/benchStartup.py --output startup.json
+'''
+
+import argparse
+
+from benchCommon import application, timer, writeResults
+
+from PyQt5 import QtGui, QtWidgets
+
+from slideSwitch import SlideSwitch, SlideSwitchStyle
+from slideSwitchPanel import SlideSwitchPanel
+
+COLUMNS = 16
+
+SPACING = 4
+
+
+def buildEager(count, tabs):
+    '''
+    Window with :code:`count` eagerly constructed switches over
+    :code:`tabs` tabs.
+    '''
+
+    window = QtWidgets.QTabWidget()
+
+    style = SlideSwitchStyle.fromPalette(window.palette())
+
+    size = style.naturalSize()
+
+    per_tab = -(-count // tabs)
+
+    for tab in range(tabs):
+
+        scroll_area = QtWidgets.QScrollArea()
+
+        container = QtWidgets.QWidget()
+
+        for i in range(min(per_tab, count - tab * per_tab)):
+
+            sw = SlideSwitch(container, style=style)
+
+            sizePolicy = QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Expanding,
+                QtWidgets.QSizePolicy.Minimum)
+
+            sizePolicy.setHeightForWidth(sw.sizePolicy().hasHeightForWidth())
+
+            sw.setSizePolicy(sizePolicy)
+
+            font = QtGui.QFont()
+
+            font.setFamily('Consolas')
+
+            font.setPointSize(6)
+
+            sw.setFont(font)
+
+            row, column = divmod(i, COLUMNS)
+
+            sw.setGeometry(column * (size.width() + SPACING),
+                           row * (size.height() + SPACING),
+                           size.width(), size.height())
+
+        rows = -(-per_tab // COLUMNS)
+
+        container.resize(COLUMNS * (size.width() + SPACING),
+                         rows * (size.height() + SPACING))
+
+        scroll_area.setWidget(container)
+
+        window.addTab(scroll_area, 'Tab {0}'.format(tab))
+
+    return window
+
+
+def buildLazy(count, tabs):
+    '''
+    Window with :code:`count` switches recorded in one
+    :code:`SlideSwitchPanel` per tab.
+    '''
+
+    window = QtWidgets.QTabWidget()
+
+    style = SlideSwitchStyle.fromPalette(window.palette())
+
+    per_tab = -(-count // tabs)
+
+    panels = []
+
+    for tab in range(tabs):
+
+        scroll_area = QtWidgets.QScrollArea()
+
+        panel = SlideSwitchPanel(columns=COLUMNS, style=style,
+                                 spacing=SPACING)
+
+        panel.addSwitches(min(per_tab, count - tab * per_tab))
+
+        panel.resize(panel.sizeHint())
+
+        scroll_area.setWidget(panel)
+
+        window.addTab(scroll_area, 'Tab {0}'.format(tab))
+
+        panels.append(panel)
+
+    window.panels = panels
+
+    return window
+
+
+def timeStartup(build, count, tabs, repeat):
+    '''
+    Best-of-:code:`repeat` construction and time-to-first-frame, in
+    seconds, and the number of widgets created after the first frame.
+    '''
+
+    app = application()
+
+    best_build = best_first = None
+
+    widgets = 0
+
+    for _ in range(repeat):
+
+        start = timer()
+
+        window = build(count, tabs)
+
+        built = timer()
+
+        window.resize(800, 600)
+
+        window.show()
+
+        # the first frame, then the lazy panels create their widgets
+        app.processEvents()
+
+        app.processEvents()
+
+        first = timer()
+
+        widgets = len(window.findChildren(SlideSwitch))
+
+        window.close()
+
+        window.deleteLater()
+
+        app.processEvents()
+
+        best_build = built - start if best_build is None \
+            else min(best_build, built - start)
+
+        best_first = first - start if best_first is None \
+            else min(best_first, first - start)
+
+    return best_build, best_first, widgets
+
+
+def run(counts, tabs, repeat):
+
+    results = []
+
+    for count in counts:
+
+        for name, build in (('eager', buildEager), ('lazy', buildLazy)):
+
+            build_s, first_frame_s, widgets = timeStartup(
+                build, count, tabs, repeat)
+
+            results.append({
+                'name': name,
+                'count': count,
+                'tabs': tabs,
+                'repeat': repeat,
+                'build_s': build_s,
+                'first_frame_s': first_frame_s,
+                'widgets_created': widgets,
+            })
+
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--counts', type=int, nargs='+',
+                        default=[100, 1000, 10000],
+                        help='switch counts (default: 100 1000 10000)')
+
+    parser.add_argument('--tabs', type=int, default=4,
+                        help='tabs the switches are spread over (default: 4)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='repetitions, the best one is kept (default: 3)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    results = run(args.counts, args.tabs, args.repeat)
+
+    writeResults('startup', results, args.output)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+'''
+State model benchmark and cross-check for :code:`SlideSwitchStateModel`.
+
+Runs the same sequence of whole-array operations (setMask, invert, diff,
+where) on models of 10k and 1M entries, once through NumPy and once
+through the pure Python big integer path (:code:`use_numpy=False`). Every
+result and the statuses after every operation are compared between the
+two paths and with a plain Python loop over a list, so a divergence of
+the fallback does not go unnoticed on machines that have NumPy. The run
+fails (exit status 1) on any mismatch. Results are written as JSON,
+e.g.::
+
+    python benchmarks/benchStateModel.py --output statemodel.json
+'''
+
+import argparse
+import random
+import sys
+
+from benchCommon import application, timer, writeResults
+
+from slideSwitchStateModel import SlideSwitchStateModel, numpy
+
+COUNTS = (10000, 1000000)
+
+
+def operations(count, seed):
+    '''
+    The operations of one run: (name, method name, arguments, reference)
+    where :code:`reference(states)` computes the expected result from a
+    list of statuses and updates the list in place.
+    '''
+
+    rng = random.Random(seed)
+
+    def flags():
+
+        return bytes(bytearray(rng.getrandbits(1) for _ in range(count)))
+
+    initial = flags()
+
+    mask_on = flags()
+
+    mask_off = flags()
+
+    mask_invert = flags()
+
+    values = flags()
+
+    def replace(states, new):
+
+        changed = [i for i in range(count) if states[i] != new[i]]
+
+        states[:] = new
+
+        return changed
+
+    return [
+        ('set_states', 'setStates', (initial,),
+         lambda s: replace(s, list(initial))),
+        ('set_mask_on', 'setMask', (mask_on, True),
+         lambda s: replace(s, [a | b for a, b in zip(s, mask_on)])),
+        ('set_mask_off', 'setMask', (mask_off, False),
+         lambda s: replace(s, [a & (b ^ 1) for a, b in zip(s, mask_off)])),
+        ('invert', 'invert', (),
+         lambda s: replace(s, [a ^ 1 for a in s])),
+        ('invert_mask', 'invert', (mask_invert,),
+         lambda s: replace(s, [a ^ b for a, b in zip(s, mask_invert)])),
+        ('diff', 'diff', (values,),
+         lambda s: [i for i in range(count) if s[i] != values[i]]),
+        ('where_on', 'where', (True,),
+         lambda s: [i for i in range(count) if s[i]]),
+        ('where_off', 'where', (False,),
+         lambda s: [i for i in range(count) if not s[i]]),
+        ('count_on', 'count', (True,),
+         lambda s: sum(s)),
+    ]
+
+
+def normalize(result):
+
+    if isinstance(result, int):
+
+        return result
+
+    return [int(index) for index in result]
+
+
+def run(counts, seed):
+
+    application()
+
+    backends = [False] + ([True] if numpy is not None else [])
+
+    results = []
+
+    mismatches = 0
+
+    for count in counts:
+
+        models = dict(
+            (use_numpy, SlideSwitchStateModel(count, use_numpy=use_numpy))
+            for use_numpy in backends)
+
+        reference = [0] * count
+
+        for name, method, args, expected in operations(count, seed):
+
+            expected = expected(reference)
+
+            result = {'name': name, 'count': count}
+
+            matches = True
+
+            for use_numpy, model in models.items():
+
+                start = timer()
+
+                value = getattr(model, method)(*args)
+
+                elapsed = timer() - start
+
+                result['numpy_s' if use_numpy else 'python_s'] = elapsed
+
+                matches = (matches
+                           and normalize(value) == expected
+                           and model.states() == bytes(reference))
+
+            result['matches'] = matches
+
+            mismatches += not matches
+
+            results.append(result)
+
+    return results, mismatches
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--counts', type=int, nargs='+', default=COUNTS,
+                        help='numbers of entries (default: 10000 1000000)')
+
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random statuses (default: 0)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    results, mismatches = run(args.counts, args.seed)
+
+    writeResults('statemodel', results, args.output)
+
+    if mismatches:
+
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+'''
+Swipe benchmark for :code:`SlideSwitchSwipe`.
+
+Places 1k and 10k switches in a grid, times building the spatial index
+and then drags across the grid with move events at 1 px intervals, like a
+1000 Hz mouse, timing the gesture handling per move event. Results are
+written as JSON, e.g.::
+
+    python benchmarks/benchSwipe.py --output swipe.json
+'''
+
+import argparse
+
+from benchCommon import application, timer, writeResults
+
+from PyQt5.QtCore import QEvent, QPointF, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QWidget
+
+from slideSwitch import SlideSwitch, SlideSwitchStyle
+from slideSwitchSwipe import SlideSwitchSwipe
+
+COUNTS = (1000, 10000)
+
+COLUMNS = 100
+
+SPACING = 4
+
+
+def buildGrid(count):
+
+    container = QWidget()
+
+    style = SlideSwitchStyle.fromPalette(container.palette())
+
+    size = style.naturalSize()
+
+    switches = []
+
+    for i in range(count):
+
+        row, column = divmod(i, COLUMNS)
+
+        switch = SlideSwitch(container, style=style)
+
+        switch.setGeometry(column * (size.width() + SPACING),
+                           row * (size.height() + SPACING),
+                           size.width(), size.height())
+
+        switches.append(switch)
+
+    rows = -(-count // COLUMNS)
+
+    container.resize(COLUMNS * (size.width() + SPACING),
+                     rows * (size.height() + SPACING))
+
+    return container, switches
+
+
+def send(switch, etype, x, y, button, buttons):
+
+    application().sendEvent(switch, QMouseEvent(
+        etype, QPointF(x, y), button, buttons, Qt.NoModifier))
+
+
+def run(counts, repeat):
+
+    app = application()
+
+    results = []
+
+    for count in counts:
+
+        container, switches = buildGrid(count)
+
+        container.show()
+
+        app.processEvents()
+
+        start = timer()
+
+        swipe = SlideSwitchSwipe(container, animate=False)
+
+        index_s = timer() - start
+
+        # diagonal drag from the first switch to the last one
+        first = switches[0]
+
+        last = switches[-1]
+
+        dx = last.x() - first.x()
+
+        dy = last.y() - first.y()
+
+        moves = max(abs(dx), abs(dy))
+
+        best = None
+
+        for _ in range(repeat):
+
+            send(first, QEvent.MouseButtonPress, 2, 2,
+                 Qt.LeftButton, Qt.LeftButton)
+
+            begin = timer()
+
+            for i in range(1, moves + 1):
+
+                send(first, QEvent.MouseMove,
+                     2 + dx * i // moves, 2 + dy * i // moves,
+                     Qt.NoButton, Qt.LeftButton)
+
+            elapsed = timer() - begin
+
+            send(first, QEvent.MouseButtonRelease, 2 + dx, 2 + dy,
+                 Qt.LeftButton, Qt.NoButton)
+
+            if best is None or elapsed < best:
+
+                best = elapsed
+
+        results.append({
+            'name': 'swipe',
+            'count': count,
+            'index_s': index_s,
+            'moves': moves,
+            'move_us': best / moves * 1e6,
+            'moves_per_s': moves / best,
+        })
+
+        swipe.deleteLater()
+
+        container.close()
+
+        container.deleteLater()
+
+        app.processEvents()
+
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+
+    parser.add_argument('--counts', type=int, nargs='+', default=COUNTS,
+                        help='numbers of switches (default: 1000 10000)')
+
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='repetitions, the best one is kept (default: 3)')
+
+    parser.add_argument('--output', default=None,
+                        help='JSON output file (default: stdout)')
+
+    args = parser.parse_args(argv)
+
+    writeResults('swipe', run(args.counts, args.repeat), args.output)
+
+
+if __name__ == '__main__':
+
+    main()
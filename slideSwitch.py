@@ -16,20 +16,1645 @@ The notable changes are the following.
 This version is maintained by Dr. Gāo， Sī Yǔ
 '''
 
-from PyQt5.QtCore import QPropertyAnimation, QRectF, QSize, Qt, pyqtProperty
+import weakref
+from collections import OrderedDict, deque
+
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    QElapsedTimer,
+    QEvent,
+    QObject,
+    QPointF,
+    QPropertyAnimation,
+    QRectF,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtProperty,
+)
+from PyQt5.QtGui import QBrush
+from PyQt5.QtGui import QFont
 from PyQt5.QtGui import QPainter
 from PyQt5.QtGui import QPalette
 from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmapCache
+from PyQt5.QtGui import QStaticText
+from PyQt5.QtGui import QTransform
+
+from PyQt5.QtWidgets import (
+    QAbstractButton,
+    QApplication,
+    QHBoxLayout,
+    QSizePolicy,
+    QWidget,
+)
+
+__version__ = '1.0.0'
+
+
+class SlideSwitchStyle(object):
+    '''
+    Immutable and hashable appearance of a slide switch.
+
+    Styles are interned. Creating a style equal to an existing one returns
+    the existing object, so switches that look alike share one instance
+    instead of each carrying its own colour, text and geometry data.
+
+    Use :code:`replace()` to derive a modified style and
+    :code:`SlideSwitch.replaceStyle()` to move every switch using one
+    style over to another.
+
+    Colours are stored as ARGB integers, in the order (off, on).
+    '''
+
+    _fields = (
+        'track_radius',
+        'thumb_radius',
+        'track_opacity',
+        'thumb_opacity',
+        'text_opacity',
+        'font_size_gain',
+        'direction',
+        'track_colors',
+        'thumb_colors',
+        'text_colors',
+        'thumb_texts',
+    )
+
+    __slots__ = (
+        '_values', '_hash',
+        'margin', 'base_offset',
+        '_track_brushes', '_thumb_brushes', '_text_colors',
+        '__weakref__',
+    )
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, track_radius=10, thumb_radius=18,
+                track_opacity=0.5, thumb_opacity=1.0, text_opacity=1.0,
+                font_size_gain=1.0, direction='h',
+                track_colors=(0, 0), thumb_colors=(0, 0),
+                text_colors=(0, 0), thumb_texts=('', '')):
+
+        direction = direction.lower()
+
+        if not (direction == 'h' or direction == 'v'):
+
+            direction = 'h'
+
+        else:
+
+            pass
+
+        values = (
+            track_radius, thumb_radius,
+            track_opacity, thumb_opacity, text_opacity,
+            font_size_gain, direction,
+            tuple(track_colors), tuple(thumb_colors),
+            tuple(text_colors), tuple(thumb_texts),
+        )
+
+        style = cls._interned.get(values)
+
+        if style is not None:
+
+            return style
+
+        style = super(SlideSwitchStyle, cls).__new__(cls)
+
+        init = super(SlideSwitchStyle, style).__setattr__
+
+        init('_values', values)
+        init('_hash', hash(values))
+        init('margin', max(0, thumb_radius - track_radius))
+        init('base_offset', max(thumb_radius, track_radius))
+        init('_track_brushes',
+             tuple(QBrush(QColor.fromRgba(c)) for c in track_colors))
+        init('_thumb_brushes',
+             tuple(QBrush(QColor.fromRgba(c)) for c in thumb_colors))
+        init('_text_colors',
+             tuple(QColor.fromRgba(c) for c in text_colors))
+
+        cls._interned[values] = style
+
+        return style
+
+    @classmethod
+    def fromPalette(cls, palette, **kwargs):
+        '''
+        Create a style whose colours are taken from a :code:`QPalette`.
+        The roles used are the same as those described for the
+        :code:`color_palette` argument of :code:`SlideSwitch`.
+        '''
+
+        kwargs['track_colors'] = (
+            palette.shadow().color().rgba(),
+            palette.highlight().color().rgba(),
+        )
+
+        kwargs['thumb_colors'] = kwargs['track_colors']
+
+        kwargs['text_colors'] = (
+            palette.text().color().rgba(),
+            palette.highlightedText().color().rgba(),
+        )
+
+        return cls(**kwargs)
+
+    @classmethod
+    def fromColorPalette(cls, color_palette, default, **kwargs):
+        '''
+        Create a style from the :code:`color_palette` argument of the
+        slide switch classes: a :code:`QPalette`, or None to take the
+        colours from :code:`default` (e.g. the inherited palette of the
+        widget).
+        '''
+
+        if color_palette:
+
+            if not isinstance(color_palette, QPalette):
+
+                raise ValueError(
+                    'Input argument "color_palette"'
+                    + ' must be None or a QPalette object')
+
+            default = color_palette
+
+        return cls.fromPalette(default, **kwargs)
+
+    def replace(self, **kwargs):
+        '''
+        Return the (interned) style with the given fields changed.
+        '''
+
+        values = dict(zip(self._fields, self._values))
+
+        values.update(kwargs)
+
+        return SlideSwitchStyle(**values)
+
+    def withPalette(self, palette):
+        '''
+        Return the (interned) style with the colours of :code:`palette`.
+        '''
+
+        values = dict(zip(self._fields, self._values))
+
+        return SlideSwitchStyle.fromPalette(palette, **values)
+
+    def trackBrush(self, checked):
+
+        return self._track_brushes[checked]
+
+    def thumbBrush(self, checked):
+
+        return self._thumb_brushes[checked]
+
+    def textColor(self, checked):
+
+        return self._text_colors[checked]
+
+    def thumbText(self, checked):
+
+        return self._values[10][checked]
+
+    def naturalSize(self):
+        '''
+        Size that just fits a switch of this style: twice the track
+        diameter along the switch direction and one thumb (or track)
+        diameter across it.
+        '''
+
+        length = 4 * self.track_radius + 2 * self.margin
+
+        width = 2 * self.track_radius + 2 * self.margin
+
+        if self._values[6] == 'v':
+
+            return QSize(width, length)
+
+        else:
+
+            return QSize(length, width)
+
+    def endOffset(self, checked, width, height):
+        '''
+        Offset of the thumb centre at the end of the track for the given
+        status, along the switch direction.
+        '''
+
+        if self._values[6] == 'h':
+
+            return width - self.base_offset if checked else self.base_offset
+
+        else:
+
+            return self.base_offset if checked else height - self.base_offset
+
+    def __setattr__(self, name, value):
+
+        raise AttributeError('SlideSwitchStyle is immutable')
+
+    def __hash__(self):
+
+        return self._hash
+
+    def __eq__(self, other):
+
+        if not isinstance(other, SlideSwitchStyle):
+
+            return NotImplemented
+
+        return self._values == other._values
+
+    def __ne__(self, other):
+
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+
+            return result
+
+        return not result
+
+    def __reduce__(self):
+
+        return (SlideSwitchStyle, self._values)
+
+    def __repr__(self):
+
+        return 'SlideSwitchStyle({0})'.format(', '.join(
+            '{0}={1!r}'.format(name, value)
+            for name, value in zip(self._fields, self._values)))
+
+
+def _styleField(index):
+
+    return property(lambda self: self._values[index])
+
+
+for _index, _name in enumerate(SlideSwitchStyle._fields):
+
+    setattr(SlideSwitchStyle, _name, _styleField(_index))
+
+del _index, _name
+
+
+class SlideSwitchGeometry(object):
+    '''
+    Geometry of a slide switch of one style and size.
+
+    Everything that only depends on the style and the size (track
+    rectangle, thumb size, thumb travel range, text placement) is computed
+    once. The thumb position for an offset is then a single affine mapping
+    :code:`origin + offset * axis`, where :code:`axis` is (1, 0) for
+    horizontal and (0, 1) for vertical switches, so both directions share
+    one code path for painting, dirty rectangles and hit-testing.
+    '''
+
+    __slots__ = (
+        'style', 'width', 'height',
+        'track_rect', 'thumb_size', 'travel',
+        'origin_x', 'origin_y', 'axis_x', 'axis_y',
+    )
+
+    def __init__(self, style, width, height):
+
+        self.style = style
+
+        self.width = width
+
+        self.height = height
+
+        margin = style.margin
+
+        radius = style.thumb_radius
+
+        self.track_rect = QRectF(
+            margin, margin, width - 2 * margin, height - 2 * margin)
+
+        self.thumb_size = 2 * radius
+
+        # (off, on) offsets of the thumb centre along the direction
+        self.travel = (
+            style.endOffset(False, width, height),
+            style.endOffset(True, width, height),
+        )
+
+        # top left corner of the thumb whose centre is at offset 0
+        if style.direction == 'v':
+
+            self.origin_x = width/2.0 - radius
+
+            self.origin_y = -radius
+
+            self.axis_x, self.axis_y = 0, 1
+
+        else:
+
+            self.origin_x = -radius
+
+            self.origin_y = height/2.0 - radius
+
+            self.axis_x, self.axis_y = 1, 0
+
+    def endOffset(self, checked):
+
+        return self.travel[checked]
+
+    def thumbPos(self, offset, x=0, y=0):
+        '''
+        Top left corner of the thumb whose centre is at :code:`offset`.
+        '''
+
+        return QPointF(x + self.origin_x + self.axis_x * offset,
+                       y + self.origin_y + self.axis_y * offset)
+
+    def thumbRect(self, offset, x=0, y=0):
+        '''
+        Bounding rectangle of the thumb whose centre is at :code:`offset`
+        along the switch direction.
+        '''
+
+        size = self.thumb_size
+
+        return QRectF(x + self.origin_x + self.axis_x * offset,
+                      y + self.origin_y + self.axis_y * offset,
+                      size, size)
+
+    def trackRect(self, x=0, y=0):
+
+        return self.track_rect.translated(x, y)
+
+    def dirtyRect(self, old_offset, new_offset, x=0, y=0):
+        '''
+        Smallest integer rectangle covering the thumb at both offsets,
+        i.e. everything that needs a repaint when the thumb moves. One
+        pixel is added on each side for antialiasing.
+        '''
+
+        return self.thumbRect(old_offset, x, y).united(
+            self.thumbRect(new_offset, x, y)).toAlignedRect().adjusted(
+                -1, -1, 1, 1)
+
+    def offsetAt(self, x, y):
+        '''
+        Offset of the thumb centre closest to the point :code:`(x, y)`,
+        clamped to the travel range.
+        '''
+
+        radius = self.thumb_size / 2.0
+
+        offset = ((x - self.origin_x - radius) * self.axis_x
+                  + (y - self.origin_y - radius) * self.axis_y)
+
+        low, high = min(self.travel), max(self.travel)
+
+        return min(high, max(low, offset))
+
+    def hitTest(self, x, y, offset):
+        '''
+        Whether the point :code:`(x, y)` is on the track or on the thumb
+        whose centre is at :code:`offset`. :code:`SlideSwitch` keeps the
+        hit testing of :code:`QAbstractButton`, so a click anywhere in
+        the widget toggles it; this is the exact shape test.
+        '''
+
+        if self.track_rect.contains(x, y):
+
+            return True
+
+        radius = self.thumb_size / 2.0
+
+        dx = x - (self.origin_x + radius + self.axis_x * offset)
+
+        dy = y - (self.origin_y + radius + self.axis_y * offset)
+
+        return dx * dx + dy * dy <= radius * radius
+
+    def sizeHint(self):
+        '''
+        Preferred size of a switch of this style, see
+        :code:`SlideSwitch.sizeHint()`.
+        '''
+
+        style = self.style
+
+        return QSize(
+            4 * style.track_radius + 2 * style.margin,
+            2 * style.track_radius + 2 * style.margin,
+        )
+
+
+class SlideSwitchPainter(object):
+    '''
+    Draws slide switches of one style and size onto any :code:`QPainter`.
+
+    This is the drawing logic of :code:`SlideSwitch`, kept apart from the
+    widget so that other views (e.g. :code:`SlideSwitchBank`) can paint
+    switches without creating one widget per switch.
+
+    A painter is bound to a style, a size, a font and a palette (the
+    palette only provides the colours of the disabled status), and holds
+    the matching :code:`SlideSwitchGeometry`. Create a new painter when any
+    of them changes.
+
+    With :code:`pixmap_cache`, the track and the thumb (text included) are
+    rendered once per size, radius, colour, opacity, font and device pixel
+    ratio into the shared :code:`QPixmapCache`, and painting only blits
+    the cached pixmaps.
+
+    With :code:`frame_strips` set to K, the whole switch is rendered once
+    at K thumb positions evenly spread over the travel range, per status,
+    into one pixmap (a frame strip), and painting blits the frame nearest
+    to the requested offset. Transitions then cost one blit per frame
+    instead of antialiased drawing. Strips are shared by all painters and
+    kept in a least recently used cache bounded to
+    :code:`frame_strip_cache_limit` bytes.
+    '''
+
+    # keys put into the global QPixmapCache by slide switch painters, least
+    # recently inserted first and bounded like the static texts; a key
+    # dropped from here is removed from QPixmapCache as well
+    _pixmap_cache_keys = OrderedDict()
+
+    pixmap_cache_key_limit = 1024
+
+    # (text, font key) -> prepared QStaticText, shared by all painters and
+    # bounded to the most recently used entries
+    _static_texts = OrderedDict()
+
+    static_text_cache_size = 256
+
+    # key -> (frame strip pixmap, size in bytes), least recently used first
+    _frame_strips = OrderedDict()
+
+    _frame_strip_bytes = 0
+
+    frame_strip_cache_limit = 8 * 1024 * 1024
+
+    __slots__ = (
+        'style', 'width', 'height', 'geometry',
+        'font', 'palette', 'pixmap_cache', 'frame_strips',
+        '_thumb_font', '_thumb_texts', '_text_pos', '_blits',
+        '__weakref__',
+    )
+
+    # key -> painter, see shared()
+    _shared = weakref.WeakValueDictionary()
+
+    def __init__(self, style, width, height, font=None, palette=None,
+                 pixmap_cache=False, frame_strips=0):
+
+        self.style = style
+
+        self.width = width
+
+        self.height = height
+
+        self.geometry = SlideSwitchGeometry(style, width, height)
+
+        self.font = QFont() if font is None else font
+
+        self.palette = QPalette() if palette is None else palette
+
+        self.pixmap_cache = pixmap_cache
+
+        if frame_strips and frame_strips < 2:
+
+            raise ValueError(
+                'Input argument "frame_strips"'
+                + ' must be 0 or at least 2')
+
+        self.frame_strips = frame_strips
+
+        self._thumb_font = None
+
+        self._thumb_texts = {}
+
+        # checked -> position of the text relative to the thumb corner
+        self._text_pos = {}
+
+        self._blits = {}
+
+    @classmethod
+    def shared(cls, style, width, height, font, palette, pixmap_cache=False,
+               frame_strips=0):
+        '''
+        A painter for the given arguments, shared with every caller
+        asking for an equal one while it is in use. Painters only cache
+        what is derived from their arguments, so switches that look
+        alike can draw through one painter.
+        '''
+
+        key = (style, width, height, font.key(), palette.cacheKey(),
+               pixmap_cache, frame_strips)
+
+        painter = cls._shared.get(key)
+
+        if painter is None:
+
+            painter = cls._shared[key] = cls(
+                style, width, height, font=font, palette=palette,
+                pixmap_cache=pixmap_cache, frame_strips=frame_strips)
+
+        return painter
+
+    @classmethod
+    def evictPixmapCache(cls):
+        '''
+        Remove every pixmap rendered by slide switch painters from the
+        shared :code:`QPixmapCache`.
+        '''
+
+        for key in cls._pixmap_cache_keys:
+
+            QPixmapCache.remove(key)
+
+        cls._pixmap_cache_keys.clear()
+
+        cls._frame_strips.clear()
+
+        cls._frame_strip_bytes = 0
+
+    def thumbFont(self):
+        '''
+        The font of the thumb text, scaled by the font size gain.
+        '''
+
+        font = self._thumb_font
+
+        if font is None:
+
+            font = self._thumb_font = QFont(self.font)
+
+            font.setPixelSize(max(1, int(
+                self.style.font_size_gain * self.style.thumb_radius)))
+
+        return font
+
+    def thumbStaticText(self, checked):
+        '''
+        The thumb text for the given status, laid out once with
+        :code:`QStaticText`. The layout is shared by every painter showing
+        the same text with the same font and pixel size.
+        '''
+
+        static_text = self._thumb_texts.get(checked)
+
+        if static_text is None:
+
+            font = self.thumbFont()
+
+            text = self.style.thumbText(checked)
+
+            key = (text, font.key())
+
+            cache = SlideSwitchPainter._static_texts
+
+            static_text = cache.get(key)
+
+            if static_text is None:
+
+                static_text = QStaticText(text)
+
+                static_text.setTextFormat(Qt.PlainText)
+
+                static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+
+                static_text.prepare(QTransform(), font)
+
+                cache[key] = static_text
+
+                while len(cache) > SlideSwitchPainter.static_text_cache_size:
+
+                    cache.popitem(last=False)
+
+            else:
+
+                cache[key] = cache.pop(key)
+
+            self._thumb_texts[checked] = static_text
+
+        return static_text
+
+    def drawThumbText(self, p, thumb_pos, checked, text_color):
+        '''
+        Draw the thumb text centred in the thumb whose top left corner is
+        at :code:`thumb_pos`.
+        '''
+
+        static_text = self.thumbStaticText(checked)
+
+        text_pos = self._text_pos.get(checked)
+
+        if text_pos is None:
+
+            size = static_text.size()
+
+            half = self.geometry.thumb_size / 2.0
+
+            text_pos = self._text_pos[checked] = QPointF(
+                half - size.width()/2.0, half - size.height()/2.0)
+
+        p.setPen(text_color)
+
+        p.setFont(self.thumbFont())
+
+        p.drawStaticText(thumb_pos + text_pos, static_text)
+
+    def colors(self, checked, enabled):
+        '''
+        Return :code:`(track_brush, thumb_brush, text_color, track_opacity)`
+        for the given status.
+        '''
+
+        style = self.style
+
+        if enabled:
+
+            return (
+                style.trackBrush(checked),
+                style.thumbBrush(checked),
+                style.textColor(checked),
+                style.track_opacity,
+            )
+
+        else:
+
+            return (
+                self.palette.shadow(),
+                self.palette.mid(),
+                self.palette.shadow().color(),
+                style.track_opacity * 0.8,
+            )
+
+    def trackRect(self, x=0, y=0):
+
+        return self.geometry.trackRect(x, y)
+
+    def thumbRect(self, offset, x=0, y=0):
+
+        return self.geometry.thumbRect(offset, x, y)
+
+    def paint(self, p, x, y, offset, checked, enabled, dpr=1.0,
+              exposed=None):
+        '''
+        Paint a switch whose top left corner is at :code:`(x, y)` and whose
+        thumb centre is at :code:`offset`.
+
+        If :code:`exposed` (a :code:`QRect` or :code:`QRectF`) is given,
+        the track and the thumb are only drawn where they intersect it.
+        '''
+
+        geometry = self.geometry
+
+        paint_track = True
+
+        paint_thumb = True
+
+        if self.frame_strips:
+
+            frame, strip = self._frameStrip(offset, checked, enabled, dpr)
+
+            width = self.width
+
+            height = self.height
+
+            p.drawPixmap(
+                QRectF(x, y, width, height), strip,
+                QRectF(frame * width * dpr, 0, width * dpr, height * dpr))
+
+            return
+
+        if exposed is not None:
+
+            exposed = QRectF(exposed)
+
+            paint_track = exposed.intersects(geometry.trackRect(x, y))
+
+            paint_thumb = exposed.intersects(geometry.thumbRect(offset, x, y))
+
+        if self.pixmap_cache:
+
+            blit = self._blits.get((checked, enabled, dpr))
+
+            if blit is None:
+
+                blit = self._blit(checked, enabled, dpr)
+
+            if blit:
+
+                track_pixmap, thumb_pixmap = blit
+
+                if paint_track:
+
+                    p.drawPixmap(geometry.track_rect.topLeft() + QPointF(x, y),
+                                 track_pixmap)
+
+                if paint_thumb:
+
+                    p.drawPixmap(geometry.thumbPos(offset, x, y), thumb_pixmap)
+
+                return
+
+        style = self.style
+
+        track_brush, thumb_brush, text_color, track_opacity = \
+            self.colors(checked, enabled)
+
+        p.setRenderHint(QPainter.Antialiasing, True)
+
+        p.setPen(Qt.NoPen)
+
+        if paint_track:
+
+            p.setBrush(track_brush)
+
+            p.setOpacity(track_opacity)
+
+            p.drawRoundedRect(
+                geometry.trackRect(x, y),
+                style.track_radius,
+                style.track_radius,
+            )
+
+        if paint_thumb:
+
+            thumb_rect = geometry.thumbRect(offset, x, y)
+
+            p.setBrush(thumb_brush)
+
+            p.setOpacity(style.thumb_opacity)
+
+            p.drawEllipse(thumb_rect)
+
+            if style.thumbText(checked):
+
+                p.setOpacity(style.text_opacity)
+
+                self.drawThumbText(
+                    p, thumb_rect.topLeft(), checked, text_color)
+
+            p.setPen(Qt.NoPen)
+
+        p.setOpacity(1.0)
+
+    def frameOffset(self, offset):
+        '''
+        The offset actually painted for :code:`offset`: the offset of the
+        nearest frame with :code:`frame_strips`, else :code:`offset`.
+        '''
+
+        if not self.frame_strips:
+
+            return offset
+
+        return self._frameOffset(self._frameIndex(offset))
+
+    def thumbDirtyRect(self, old_offset, new_offset, x=0, y=0):
+
+        return self.geometry.dirtyRect(
+            self.frameOffset(old_offset), self.frameOffset(new_offset), x, y)
+
+    def _frameIndex(self, offset):
+
+        off, on = self.geometry.travel
+
+        if on == off:
+
+            return 0
+
+        last = self.frame_strips - 1
+
+        return min(last, max(0, int(round(
+            (offset - off) * last / float(on - off)))))
+
+    def _frameOffset(self, frame):
+
+        off, on = self.geometry.travel
+
+        return off + (on - off) * frame / float(self.frame_strips - 1)
+
+    def _frameStrip(self, offset, checked, enabled, dpr):
+        '''
+        Return the frame index for :code:`offset` and the frame strip for
+        the given status, rendering the strip on a miss.
+        '''
+
+        frame = self._frameIndex(offset)
+
+        palette = self.palette
+
+        key = (self.style, self.width, self.height, self.thumbFont().key(),
+               palette.shadow().color().rgba(), palette.mid().color().rgba(),
+               checked, enabled, dpr, self.frame_strips)
+
+        cls = SlideSwitchPainter
+
+        strips = cls._frame_strips
+
+        entry = strips.pop(key, None)
+
+        if entry is None:
+
+            strip = self._renderFrameStrip(checked, enabled, dpr)
+
+            entry = (strip, strip.width() * strip.height() * 4)
+
+            cls._frame_strip_bytes += entry[1]
+
+            # the new strip is kept even if it alone exceeds the limit
+            while strips and (cls._frame_strip_bytes
+                              > cls.frame_strip_cache_limit):
+
+                cls._frame_strip_bytes -= strips.popitem(last=False)[1][1]
+
+        strips[key] = entry
+
+        return frame, entry[0]
+
+    def _renderFrameStrip(self, checked, enabled, dpr):
+
+        width = self.width
+
+        height = self.height
+
+        strip = QPixmap(
+            max(1, int(round(width * self.frame_strips * dpr))),
+            max(1, int(round(height * dpr))),
+        )
+
+        strip.setDevicePixelRatio(dpr)
+
+        strip.fill(Qt.transparent)
+
+        # frames are drawn exactly like live paints without strips
+        painter = SlideSwitchPainter(
+            self.style, width, height, font=self.font, palette=self.palette)
+
+        p = QPainter(strip)
+
+        for frame in range(self.frame_strips):
+
+            p.setClipRect(QRectF(frame * width, 0, width, height))
+
+            painter.paint(p, frame * width, 0, self._frameOffset(frame),
+                          checked, enabled, dpr)
+
+        p.end()
+
+        return strip
+
+    @classmethod
+    def _cachedPixmap(cls, key, width, height, dpr, draw):
+        '''
+        Fetch the pixmap stored under :code:`key`, rendering it with
+        :code:`draw(painter)` on a miss.
+        '''
+
+        pixmap = QPixmapCache.find(key)
+
+        if pixmap is None or pixmap.isNull():
+
+            pixmap = QPixmap(
+                max(1, int(round(width * dpr))),
+                max(1, int(round(height * dpr))),
+            )
+
+            pixmap.setDevicePixelRatio(dpr)
+
+            pixmap.fill(Qt.transparent)
+
+            p = QPainter(pixmap)
+
+            p.setRenderHint(QPainter.Antialiasing, True)
+
+            p.setPen(Qt.NoPen)
+
+            draw(p)
+
+            p.end()
+
+            QPixmapCache.insert(key, pixmap)
+
+            keys = SlideSwitchPainter._pixmap_cache_keys
+
+            keys.pop(key, None)
+
+            keys[key] = None
+
+            while len(keys) > SlideSwitchPainter.pixmap_cache_key_limit:
+
+                QPixmapCache.remove(keys.popitem(last=False)[0])
+
+        return pixmap
+
+    def _blit(self, checked, enabled, dpr):
+        '''
+        Render (or fetch from :code:`QPixmapCache`) the track and thumb
+        pixmaps for the given status and remember them for later paints.
+        Returns False for gradient or texture brushes, which cannot be keyed
+        by colour and are drawn directly.
+        '''
+
+        style = self.style
+
+        track_brush, thumb_brush, text_color, track_opacity = \
+            self.colors(checked, enabled)
+
+        if (track_brush.style() != Qt.SolidPattern
+                or thumb_brush.style() != Qt.SolidPattern):
+
+            blit = self._blits[(checked, enabled, dpr)] = False
+
+            return blit
+
+        width = self.geometry.track_rect.width()
+
+        height = self.geometry.track_rect.height()
+
+        track_radius = style.track_radius
+
+        key = 'SlideSwitch/track/{0}x{1}/{2}/{3:08x}/{4}/{5}'.format(
+            width, height, track_radius,
+            track_brush.color().rgba(), track_opacity, dpr)
+
+        def draw_track(p):
+
+            p.setBrush(track_brush)
+
+            p.setOpacity(track_opacity)
+
+            p.drawRoundedRect(
+                QRectF(0, 0, width, height), track_radius, track_radius)
+
+        track_pixmap = self._cachedPixmap(key, width, height, dpr, draw_track)
+
+        size = self.geometry.thumb_size
+
+        text = style.thumbText(checked)
+
+        key = ('SlideSwitch/thumb/{0}/{1:08x}/{2}/{3}/{4:08x}/{5}/{6}/{7}'
+               .format(style.thumb_radius, thumb_brush.color().rgba(),
+                       style.thumb_opacity, text, text_color.rgba(),
+                       style.text_opacity, self.thumbFont().key(), dpr))
+
+        def draw_thumb(p):
+
+            p.setBrush(thumb_brush)
+
+            p.setOpacity(style.thumb_opacity)
+
+            p.drawEllipse(QRectF(0, 0, size, size))
+
+            if text:
+
+                p.setOpacity(style.text_opacity)
+
+                self.drawThumbText(p, QPointF(0, 0), checked, text_color)
+
+        thumb_pixmap = self._cachedPixmap(key, size, size, dpr, draw_thumb)
+
+        blit = self._blits[(checked, enabled, dpr)] = (
+            track_pixmap, thumb_pixmap)
+
+        return blit
+
+
+class SlideSwitchAnimPolicy(object):
+    '''
+    Adaptive animation policy for slide switches.
+
+    Switches with a policy are animated by the shared
+    :code:`SlideSwitchAnimator`, which measures the actual time between
+    its frames. While that frame time exceeds :code:`frame_budget`, the
+    thumbs only move every :code:`degraded_interval` milliseconds; above
+    :code:`snap_budget` they jump straight to their ends. With
+    :code:`skip_hidden`, switches that are not visible on screen jump to
+    their end without animating at all.
+
+    Set it per switch with :code:`SlideSwitch.setAnimDur()` or
+    :code:`SlideSwitch.setAnimPolicy()`, or for every switch without its
+    own policy with :code:`SlideSwitch.setDefaultAnimPolicy()`.
+    '''
+
+    __slots__ = (
+        'frame_budget', 'degraded_interval', 'snap_budget', 'skip_hidden')
+
+    def __init__(self, frame_budget=25.0, degraded_interval=50,
+                 snap_budget=100.0, skip_hidden=True):
+        '''
+        Constructor of the SlideSwitchAnimPolicy object.
+
+        Parameters
+        -----------
+        frame_budget : float
+
+            Frame time, in milliseconds, above which the animation frame
+            rate is cut.
+
+            Default = 25.0
+
+        degraded_interval : int
+
+            Time between two thumb updates, in milliseconds, while the
+            frame budget is exceeded.
+
+            Default = 50
+
+        snap_budget : float
+
+            Frame time, in milliseconds, above which animations jump to
+            their end.
+
+            Default = 100.0
+
+        skip_hidden : bool
+
+            Whether switches that are not visible jump to their end
+            instead of animating.
+
+            Default = True
+        '''
+
+        self.frame_budget = frame_budget
+
+        self.degraded_interval = degraded_interval
+
+        self.snap_budget = snap_budget
+
+        self.skip_hidden = skip_hidden
+
+
+class SlideSwitchAnimator(QObject):
+    '''
+    Shared animation driver for slide switches.
+
+    Instead of one :code:`QPropertyAnimation` (and one timer) per toggle,
+    every switch animated through the driver is advanced by a single frame
+    clock. On each tick the thumb offsets of all the moving switches are
+    updated; their repaints are only posted, so Qt paints them in one pass
+    per window. Switches whose animation has
+    finished are dropped from the active set and the clock stops when
+    nothing moves.
+
+    Opt in with :code:`SlideSwitch.setAnimDriver(SlideSwitchAnimator.instance())`
+    or, for every new switch, with :code:`SlideSwitch.setDefaultAnimDriver()`.
+    '''
+
+    _instance = None
+
+    def __init__(self, parent=None, interval=16):
+        '''
+        Constructor of the SlideSwitchAnimator object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the driver
+
+            Default = None
+
+        interval : int
+
+            Time between two frames, in milliseconds.
+
+            Default = 16
+        '''
+
+        super(SlideSwitchAnimator, self).__init__(parent)
+
+        # switch -> [start offset, end offset, start time, duration,
+        #            policy, time of the last thumb update]
+        self._active = {}
+
+        # smoothed time between two frames while animating, in ms
+        self._frame_time = 0.0
+
+        self._last_tick = None
+
+        # frame times measured since the clock last started from idle
+        self._run_frames = 0
+
+        self._clock = QElapsedTimer()
+
+        self._clock.start()
+
+        self._timer = QTimer(self)
+
+        self._timer.setTimerType(Qt.PreciseTimer)
+
+        self._timer.setInterval(interval)
+
+        self._timer.timeout.connect(self._tick)
+
+    @classmethod
+    def instance(cls):
+        '''
+        Return the application wide driver, creating it on first use.
+        '''
+
+        if cls._instance is None or sip.isdeleted(cls._instance):
+
+            cls._instance = cls(QApplication.instance())
+
+        return cls._instance
+
+    def setInterval(self, interval):
+
+        self._timer.setInterval(interval)
+
+    def animate(self, switch, end, duration, policy=None):
+        '''
+        Move the thumb of :code:`switch` from its current offset to
+        :code:`end` within :code:`duration` milliseconds, following the
+        :code:`SlideSwitchAnimPolicy` :code:`policy` if given. An animation
+        of the same switch already in flight is replaced.
+        '''
+
+        start = switch.offset
+
+        if duration <= 0 or start == end:
+
+            self.stop(switch)
+
+            switch.offset = end
+
+            return
+
+        now = self._clock.elapsed()
+
+        self._active[switch] = [start, end, now, duration, policy, now]
+
+        if not self._timer.isActive():
+
+            self._last_tick = None
+
+            self._run_frames = 0
+
+            self._timer.start()
+
+    def stop(self, switch):
+        '''
+        Stop the animation of :code:`switch`, leaving its thumb where it is.
+        '''
+
+        self._active.pop(switch, None)
+
+        if not self._active:
+
+            self._timer.stop()
+
+    def isAnimating(self, switch):
+
+        return switch in self._active
+
+    def activeCount(self):
+
+        return len(self._active)
+
+    def frameTime(self):
+        '''
+        Smoothed time between two animation frames, in milliseconds, as
+        last measured while animating.
+        '''
+
+        return self._frame_time
+
+    def _tick(self):
+
+        now = self._clock.elapsed()
+
+        # the time between ticks includes painting and whatever else kept
+        # the GUI thread busy, i.e. it is the actual frame time
+        if self._last_tick is not None:
+
+            if self._run_frames:
+
+                self._frame_time = (0.7 * self._frame_time
+                                    + 0.3 * (now - self._last_tick))
+
+            else:
+
+                # a frame time left from an earlier run says nothing
+                # about the machine now
+                self._frame_time = float(now - self._last_tick)
+
+            self._run_frames += 1
+
+        self._last_tick = now
+
+        # the policies only act on frame times measured in this run
+        frame_time = self._frame_time if self._run_frames else 0.0
+
+        finished = []
+
+        # the offset setter only posts (dirty rect) updates, which Qt then
+        # paints together in one pass per window
+        for switch, anim in self._active.items():
+
+            if sip.isdeleted(switch):
+
+                finished.append(switch)
+
+                continue
+
+            start, end, started, duration, policy, last_update = anim
+
+            progress = (now - started) / float(duration)
+
+            if policy is not None:
+
+                if frame_time > policy.snap_budget:
+
+                    progress = 1.0
+
+                elif (frame_time > policy.frame_budget
+                        and progress < 1.0
+                        and now - last_update < policy.degraded_interval):
+
+                    continue
+
+                anim[5] = now
+
+            if progress >= 1.0:
+
+                switch.offset = end
+
+                finished.append(switch)
+
+            else:
+
+                switch.offset = int(start + (end - start) * progress)
+
+        for switch in finished:
+
+            del self._active[switch]
+
+        if not self._active:
+
+            self._timer.stop()
+
+
+class SlideSwitchDragger(QObject):
+    '''
+    Lets the thumb of slide switches be dragged with the pointer.
+
+    Once the pointer pressed on a switch has moved along the switch
+    direction by more than :code:`QApplication.startDragDistance()`, the
+    thumb follows it within its travel range. Mice may send move events
+    at 1000 Hz or more; a move only records the pointer position and the
+    thumb is moved to the latest one once per frame. On release the switch
+    snaps to the end the thumb is thrown towards if it moves faster than
+    :code:`fling_velocity`, otherwise to the nearer end, in the time the
+    thumb takes at its release speed (at most the animation duration of
+    the switch).
+
+    There is one pointer, so a single dragger serves every switch: use the
+    application wide :code:`instance()`.
+    '''
+
+    _instance = None
+
+    def __init__(self, parent=None, interval=16, fling_velocity=0.3):
+        '''
+        Constructor of the SlideSwitchDragger object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the dragger
+
+            Default = None
+
+        interval : int
+
+            Time between two thumb updates while dragging, in
+            milliseconds.
+
+            Default = 16
+
+        fling_velocity : float
+
+            Thumb speed at release, in pixels per millisecond, above which
+            the switch snaps in the direction of the throw.
+
+            Default = 0.3
+        '''
+
+        super(SlideSwitchDragger, self).__init__(parent)
+
+        self.fling_velocity = fling_velocity
+
+        self._enabled = True
+
+        # the pressed switch, the pointer position relative to the thumb
+        # centre at the press, the press position, whether the drag has
+        # started and the pointer position not applied yet
+        self._switch = None
+
+        self._grab = None
+
+        self._press = None
+
+        self._dragging = False
+
+        self._pending = None
+
+        # (time in ms, offset under the pointer) at the press and at the
+        # last thumb updates
+        self._samples = deque(maxlen=8)
+
+        self._clock = QElapsedTimer()
+
+        self._clock.start()
+
+        self._timer = QTimer(self)
+
+        self._timer.setTimerType(Qt.PreciseTimer)
+
+        self._timer.setInterval(interval)
+
+        self._timer.timeout.connect(self._tick)
+
+    @classmethod
+    def instance(cls):
+        '''
+        Return the application wide dragger, creating it on first use.
+        '''
+
+        if cls._instance is None or sip.isdeleted(cls._instance):
+
+            cls._instance = cls(QApplication.instance())
+
+        return cls._instance
+
+    def setInterval(self, interval):
+
+        self._timer.setInterval(interval)
+
+    def isEnabled(self):
+
+        return self._enabled
+
+    def setEnabled(self, enabled):
+        '''
+        Turn thumb dragging on or off for every switch. While it is off,
+        switches only toggle on click.
+        '''
+
+        self._enabled = bool(enabled)
+
+        if not enabled:
+
+            self._cancel()
+
+    def isDragging(self, switch=None):
+        '''
+        Whether a thumb (the thumb of :code:`switch` if given) is being
+        dragged.
+        '''
+
+        return self._dragging and (switch is None or switch is self._switch)
+
+    def press(self, switch, pos):
+        '''
+        Start tracking a press on :code:`switch` at :code:`pos`.
+        '''
+
+        if not self._enabled:
+
+            return
+
+        self._cancel()
+
+        geometry = switch.switchGeometry()
+
+        radius = geometry.thumb_size / 2.0
+
+        offset = switch.offset
+
+        self._grab = (
+            pos.x() - (geometry.origin_x + radius + geometry.axis_x * offset),
+            pos.y() - (geometry.origin_y + radius + geometry.axis_y * offset),
+        )
+
+        self._switch = switch
+
+        self._press = (pos.x(), pos.y())
+
+        self._dragging = False
+
+        self._pending = None
+
+        self._samples.clear()
+
+        self._samples.append((self._clock.elapsed(), offset))
+
+    def move(self, switch, pos):
+        '''
+        Record a pointer move over the pressed :code:`switch`. Returns
+        whether the thumb is being dragged, i.e. the move is handled.
+        '''
+
+        if switch is not self._switch:
+
+            return False
+
+        if not self._dragging:
+
+            geometry = switch.switchGeometry()
+
+            distance = abs((pos.x() - self._press[0]) * geometry.axis_x
+                           + (pos.y() - self._press[1]) * geometry.axis_y)
+
+            if distance < QApplication.startDragDistance():
+
+                return False
+
+            self._dragging = True
+
+            switch._stopAnimation()
+
+            self._samples.append(
+                (self._clock.elapsed(), self._pointerOffset(pos.x(), pos.y())))
+
+        self._pending = (pos.x(), pos.y())
+
+        if not self._timer.isActive():
+
+            self._timer.start()
+
+        return True
+
+    def release(self, switch, pos):
+        '''
+        End the press on :code:`switch`. If its thumb was dragged, the
+        switch snaps to its new status and True is returned; otherwise the
+        release is a click, left to the switch.
+        '''
+
+        if switch is not self._switch:
+
+            return False
+
+        dragging = self._dragging
+
+        if dragging:
+
+            self._pending = (pos.x(), pos.y())
+
+            self._apply()
+
+        velocity = self._velocity()
+
+        self._reset()
+
+        if dragging:
+
+            self._snap(switch, velocity)
+
+        return dragging
+
+    def cancel(self, switch=None):
+        '''
+        Abandon the press in progress (the press on :code:`switch` if
+        given), e.g. when another gesture takes over the pointer. A
+        dragged thumb returns to the end of the current status.
+        '''
+
+        if switch is None or switch is self._switch:
+
+            self._cancel()
+
+    def _reset(self):
+
+        self._switch = None
+
+        self._dragging = False
+
+        self._pending = None
+
+        self._timer.stop()
+
+    def _cancel(self):
+        '''
+        Abandon the drag in progress, if any, returning its thumb to the
+        end of the current status.
+        '''
+
+        switch = self._switch
+
+        dragging = self._dragging
+
+        self._reset()
+
+        if dragging and not sip.isdeleted(switch):
+
+            switch._animateTo(switch._endOffset(switch.isChecked()))
+
+    def _tick(self):
+
+        if self._pending is None:
+
+            self._timer.stop()
+
+            return
 
-from PyQt5.QtWidgets import (
-    QAbstractButton,
-    QApplication,
-    QHBoxLayout,
-    QSizePolicy,
-    QWidget,
-)
+        if sip.isdeleted(self._switch):
 
-__version__ = '1.0.0'
+            self._reset()
+
+            return
+
+        self._apply()
+
+    def _apply(self):
+
+        x, y = self._pending
+
+        self._pending = None
+
+        offset = self._pointerOffset(x, y)
+
+        self._switch.offset = offset
+
+        self._samples.append((self._clock.elapsed(), offset))
+
+    def _pointerOffset(self, x, y):
+        '''
+        Offset putting the thumb under the pointer at :code:`(x, y)` the
+        way it was grabbed, clamped to the travel range.
+        '''
+
+        return int(round(self._switch.switchGeometry().offsetAt(
+            x - self._grab[0], y - self._grab[1])))
+
+    def _velocity(self):
+        '''
+        Thumb speed over the last 100 ms, in pixels per millisecond, along
+        the switch direction.
+        '''
+
+        samples = self._samples
+
+        if len(samples) < 2:
+
+            return 0.0
+
+        last_time, last_offset = samples[-1]
+
+        # the oldest sample of the last 100 ms, but never the last one
+        for first_time, first_offset in list(samples)[:-1]:
+
+            if last_time - first_time <= 100:
+
+                break
+
+        if last_time <= first_time:
+
+            return 0.0
+
+        return (last_offset - first_offset) / float(last_time - first_time)
+
+    def _snap(self, switch, velocity):
+
+        offset = switch.offset
+
+        off_offset, on_offset = switch.switchGeometry().travel
+
+        if abs(velocity) >= self.fling_velocity:
+
+            checked = velocity * (on_offset - off_offset) > 0
+
+        else:
+
+            checked = abs(offset - on_offset) < abs(offset - off_offset)
+
+        end = on_offset if checked else off_offset
+
+        remaining = abs(end - offset)
+
+        duration = switch.animate_dur
+
+        if velocity * (end - offset) > 0:
+
+            # keep the speed of the throw
+            duration = min(duration, remaining / abs(velocity))
+
+        elif off_offset != on_offset:
+
+            duration = duration * remaining / abs(on_offset - off_offset)
+
+        if switch.isChecked() != checked:
+
+            super(SlideSwitch, switch).setChecked(checked)
+
+        switch._animateTo(end, int(duration))
 
 
 class SlideSwitch(QAbstractButton):
@@ -37,6 +1662,16 @@ class SlideSwitch(QAbstractButton):
     Android style slide switch class. Inherited from :code:`QAbstractButton`.
     '''
 
+    # every live switch, for replaceStyle(); weak, so that dropped
+    # switches are still freed by reference counting
+    _live = weakref.WeakSet()
+
+    # driver given to new switches, None for a QPropertyAnimation per toggle
+    _default_anim_driver = None
+
+    # policy of the switches that have none of their own
+    _default_anim_policy = None
+
     def __init__(self, parent=None,
                  track_radius=10, thumb_radius=18,
                  track_opacity=0.5,
@@ -44,7 +1679,8 @@ class SlideSwitch(QAbstractButton):
                  color_palette=None,
                  thumb_txt_true='', thumb_txt_false='',
                  animate_dur=120, font_size_gain=1.0,
-                 direction='h'):
+                 direction='h', pixmap_cache=False, style=None,
+                 frame_strips=0):
         '''
         Constructor of the SlideSwitch object.
 
@@ -145,168 +1781,459 @@ class SlideSwitch(QAbstractButton):
             "v" for vertical switch direction.
 
             Default = 'h'
+
+        pixmap_cache : bool
+
+            If True, the track and the thumb (text included) are rendered
+            once into the shared :code:`QPixmapCache` and later paints
+            only blit the cached pixmaps. Useful when many switches are
+            shown at once.
+
+            Default = False
+
+        style : SlideSwitchStyle
+
+            A shared style object. If given, it takes the place of
+            :code:`track_radius`, :code:`thumb_radius`,
+            :code:`track_opacity`, :code:`thumb_opacity`,
+            :code:`text_opacity`, :code:`color_palette`,
+            :code:`thumb_txt_true`, :code:`thumb_txt_false`,
+            :code:`font_size_gain` and :code:`direction`.
+
+            Default = None
+
+        frame_strips : int
+
+            If not 0, the number of frames a transition is pre-rendered
+            into. Each paint then blits the frame nearest to the thumb
+            offset, which is much cheaper than antialiased drawing on
+            slow machines. See :code:`SlideSwitchPainter`.
+
+            Default = 0
         '''
 
         super(SlideSwitch, self).__init__(parent=parent)
 
+        SlideSwitch._live.add(self)
+
+        self._pixmap_cache = pixmap_cache
+
+        self._frame_strips = frame_strips
+
+        self._switch_painter = None
+
+        self._style = None
+
         self.setCheckable(True)
 
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
-        self._track_radius = track_radius
+        self.animate_dur = animate_dur
 
-        self._thumb_radius = thumb_radius
+        self._anim_driver = SlideSwitch._default_anim_driver
 
-        self._margin       = max(0, self._thumb_radius - self._track_radius)
+        # the one QPropertyAnimation of this switch, created on first use
+        self._anim = None
 
-        self._base_offset  = max(self._thumb_radius, self._track_radius)
+        self._anim_policy = None
 
-        self._offset = self._base_offset
+        if style is None:
 
-        self.thumb_opacity = thumb_opacity
+            style = SlideSwitchStyle.fromColorPalette(
+                color_palette, self.palette(),
+                track_radius=track_radius,
+                thumb_radius=thumb_radius,
+                track_opacity=track_opacity,
+                thumb_opacity=thumb_opacity,
+                text_opacity=text_opacity,
+                font_size_gain=font_size_gain,
+                direction=direction,
+                thumb_texts=(thumb_txt_false, thumb_txt_true),
+            )
 
-        self.text_opacity = text_opacity
+        elif not isinstance(style, SlideSwitchStyle):
 
-        self._track_opacity = track_opacity
+            raise ValueError(
+                'Input argument "style"'
+                + ' must be None or a SlideSwitchStyle object')
 
-        self.animate_dur = animate_dur
+        self.setSwitchStyle(style)
 
-        self.font_size_gain = font_size_gain
+        self._offset = style.base_offset
 
-        if color_palette:
+    def switchStyle(self):
+        '''
+        Return the :code:`SlideSwitchStyle` of the switch.
+        '''
 
-            if isinstance(color_palette, QPalette):
+        return self._style
 
-                palette = color_palette
+    def setSwitchStyle(self, style):
+        '''
+        Use :code:`style`, a :code:`SlideSwitchStyle`, for the switch.
+        '''
 
-            else:
+        old_style = self._style
 
-                raise ValueError(
-                    'Input argument "color_palette"'
-                    + ' must be None or a QPalette object')
+        if style is old_style:
 
-        else:
+            return
 
-            palette = self.palette()
+        self._style = style
 
-        self._track_color = None
-        self._thumb_color = None
-        self._text_color = None
+        self._invalidatePixmapCache()
 
-        self.setPalette(palette=palette)
+        if old_style is not None:
 
-        self._thumb_text = None
+            if (old_style.direction != style.direction
+                    or old_style.base_offset != style.base_offset):
 
-        self.setThumbText(text_true=thumb_txt_true, text_false=thumb_txt_false)
+                self._offset = self._endOffset(self.isChecked())
 
-        self.direction = direction.lower()
+            self.update()
 
-        if not (self.direction.lower() == 'h' or self.direction.lower() == 'v'):
+    @classmethod
+    def instances(cls, style=None):
+        '''
+        Every live slide switch, or those using :code:`style`.
+        '''
 
-            self.direction = 'h'
+        return [switch for switch in list(SlideSwitch._live)
+                if isinstance(switch, cls) and not sip.isdeleted(switch)
+                and (style is None or switch._style is style)]
 
-        else:
+    @classmethod
+    def replaceStyle(cls, old_style, new_style):
+        '''
+        Switch every slide switch that uses :code:`old_style` over to
+        :code:`new_style`. Returns the number of switches restyled.
+        '''
 
-            pass
+        switches = cls.instances(old_style)
 
-        if self.direction == 'h':
+        for switch in switches:
 
-            self._end_offset = {
-                True: (lambda: self.width() - self._base_offset),
-                False: (lambda: self._base_offset),
-            }
+            switch.setSwitchStyle(new_style)
 
-        else:
+        return len(switches)
+
+    def _replaceStyle(self, **kwargs):
+
+        self.setSwitchStyle(self._style.replace(**kwargs))
+
+    def _endOffset(self, checked):
+
+        return self._switchPainter().geometry.travel[checked]
+
+    def switchGeometry(self):
+        '''
+        Return the :code:`SlideSwitchGeometry` for the current size and
+        style.
+        '''
 
-            self._end_offset = {
-                True: (lambda: self._base_offset),
-                False: (lambda: self.height() - self._base_offset),
-            }
+        return self._switchPainter().geometry
+
+    @property
+    def direction(self):
+
+        return self._style.direction
+
+    @direction.setter
+    def direction(self, direction):
+
+        self._replaceStyle(direction=direction)
+
+    @property
+    def thumb_opacity(self):
+
+        return self._style.thumb_opacity
+
+    @thumb_opacity.setter
+    def thumb_opacity(self, thumb_opacity):
+
+        self._replaceStyle(thumb_opacity=thumb_opacity)
+
+    @property
+    def text_opacity(self):
+
+        return self._style.text_opacity
+
+    @text_opacity.setter
+    def text_opacity(self, text_opacity):
+
+        self._replaceStyle(text_opacity=text_opacity)
+
+    @property
+    def font_size_gain(self):
+
+        return self._style.font_size_gain
+
+    @font_size_gain.setter
+    def font_size_gain(self, font_size_gain):
+
+        self._replaceStyle(font_size_gain=font_size_gain)
 
     def setTrackRadius(self, track_radius):
         '''
         '''
 
-        self._track_radius = track_radius
+        self._replaceStyle(track_radius=track_radius)
 
     def setThumbRadius(self, thumb_radius):
         '''
         '''
 
-        self._thumb_radius = thumb_radius
+        self._replaceStyle(thumb_radius=thumb_radius)
 
     def setFontSizeGain(self, font_size_gain):
         '''
         '''
 
-        self.font_size_gain = font_size_gain
+        self._replaceStyle(font_size_gain=font_size_gain)
 
     def setTrackOpacity(self, track_opacity):
         '''
         '''
 
-        self._track_opacity = track_opacity
+        self._replaceStyle(track_opacity=track_opacity)
 
     def setThumbText(self, text_true, text_false):
         '''
         '''
 
-        self._thumb_text = {
-                True: text_true,
-                False: text_false,
-            }
+        self._replaceStyle(thumb_texts=(text_false, text_true))
 
     def setPalette(self, palette):
         '''
         '''
 
-        self._track_color = {
-            True: palette.highlight(),
-            False: palette.shadow(),
-        }
+        self.setSwitchStyle(self._style.withPalette(palette))
 
-        self._thumb_color = {
-            True: palette.highlight(),
-            False: palette.shadow(),
-        }
+    def setDirection(self, direction):
 
-        self._text_color = {
-            True: palette.highlightedText().color(),
-            False: palette.text().color(),
-        }
+        self._replaceStyle(direction=direction)
 
-    def setDirection(self, direction):
+    def setAnimDur(self, animate_dur, policy=None):
+        '''
+        Set the animation duration and, if given, the
+        :code:`SlideSwitchAnimPolicy` of the switch.
+        '''
 
-        self.direction = direction.lower()
+        self.animate_dur = animate_dur
 
-        if not (self.direction.lower() == 'h' or self.direction.lower() == 'v'):
+        if policy is not None:
 
-            self.direction = 'h'
+            self.setAnimPolicy(policy)
 
-        else:
+    def setAnimPolicy(self, policy):
+        '''
+        Animate adaptively following :code:`policy`, a
+        :code:`SlideSwitchAnimPolicy`. None falls back to the default
+        policy set with :code:`setDefaultAnimPolicy()`.
+        '''
 
-            pass
+        self._stopAnimation()
 
-        if self.direction == 'h':
+        self._anim_policy = policy
 
-            # 终点位置
-            self._end_offset = {
-                True: (lambda: self.width() - self._base_offset),
-                False: (lambda: self._base_offset),
-            }
+    def animPolicy(self):
+        '''
+        Return the policy in effect for the switch, or None.
+        '''
 
-        else:
+        if self._anim_policy is not None:
 
-            self._end_offset = {
-                True: (lambda: self._base_offset),
-                False: (lambda: self.height() - self._base_offset),
-            }
+            return self._anim_policy
 
-    def setAnimDur(self, animate_dur):
+        return SlideSwitch._default_anim_policy
+
+    @classmethod
+    def setDefaultAnimPolicy(cls, policy):
         '''
+        Policy of every switch without a policy of its own. None turns
+        adaptive animation off for those switches.
         '''
 
-        self.animate_dur = animate_dur
+        cls._default_anim_policy = policy
+
+    def setAnimDriver(self, driver):
+        '''
+        Animate the thumb through :code:`driver`, a
+        :code:`SlideSwitchAnimator`, instead of a
+        :code:`QPropertyAnimation` per toggle. None restores the latter.
+        '''
+
+        self._stopAnimation()
+
+        self._anim_driver = driver
+
+    @classmethod
+    def setDefaultAnimDriver(cls, driver):
+        '''
+        Driver given to slide switches created from now on. See
+        :code:`setAnimDriver()`.
+        '''
+
+        cls._default_anim_driver = driver
+
+    def setPixmapCache(self, enabled):
+        '''
+        Turn the shared pixmap cache for the track and the thumb on or off.
+        '''
+
+        self._pixmap_cache = enabled
+
+        self._invalidatePixmapCache()
+
+        self.update()
+
+    def setFrameStrips(self, frames):
+        '''
+        Paint from pre-rendered frame strips of :code:`frames` frames, or
+        draw every paint if :code:`frames` is 0.
+        '''
+
+        self._frame_strips = frames
+
+        self._invalidatePixmapCache()
+
+        self.update()
+
+    def frameStrips(self):
+
+        return self._frame_strips
+
+    @classmethod
+    def evictPixmapCache(cls):
+        '''
+        Remove every pixmap rendered by slide switches from the shared
+        :code:`QPixmapCache`, frame strips included. Entries are
+        otherwise evicted by the cache itself (least recently used first)
+        once :code:`QPixmapCache.cacheLimit()` is exceeded. Switches that are
+        already painting from cached pixmaps keep their own reference
+        until their size, style, font or palette changes.
+        '''
+
+        SlideSwitchPainter.evictPixmapCache()
+
+    def _invalidatePixmapCache(self):
+        '''
+        Drop the painter of this switch. The next paint creates a fresh one
+        from the current size, style, font and palette.
+        '''
+
+        self._switch_painter = None
+
+    def _switchPainter(self):
+
+        painter = self._switch_painter
+
+        if painter is None:
+
+            painter = self._switch_painter = SlideSwitchPainter.shared(
+                self._style, self.width(), self.height(),
+                self.font(), self.palette(),
+                pixmap_cache=self._pixmap_cache,
+                frame_strips=self._frame_strips)
+
+        return painter
+
+    def _animateTo(self, end, duration=None):
+        '''
+        Move the thumb from its current offset to :code:`end` within
+        :code:`duration` milliseconds (the animation duration of the
+        switch if None). A switch owns at most one animation: a toggle
+        during a running animation retargets it from where the thumb
+        currently is.
+        '''
+
+        if duration is None:
+
+            duration = self.animate_dur
+
+        policy = self.animPolicy()
+
+        if policy is not None:
+
+            if policy.skip_hidden and (not self.isVisible()
+                                       or self.visibleRegion().isEmpty()):
+
+                self._stopAnimation()
+
+                self.offset = end
+
+                return
+
+            # the shared driver is the one measuring frame times
+            driver = self._anim_driver or SlideSwitchAnimator.instance()
+
+            if self._anim is not None:
+
+                self._anim.stop()
+
+            driver.animate(self, end, duration, policy)
+
+            return
+
+        if self._anim_driver is not None:
+
+            self._anim_driver.animate(self, end, duration)
+
+            return
+
+        anim = self._anim
+
+        if anim is None:
+
+            anim = self._anim = QPropertyAnimation(self, b'offset', self)
+
+        anim.stop()
+
+        anim.setDuration(duration)
+
+        anim.setStartValue(self.offset)
+
+        anim.setEndValue(end)
+
+        anim.start()
+
+    def _stopAnimation(self):
+
+        if self._anim is not None:
+
+            self._anim.stop()
+
+        if self._anim_driver is not None:
+
+            self._anim_driver.stop(self)
+
+        elif (SlideSwitchAnimator._instance is not None
+                and not sip.isdeleted(SlideSwitchAnimator._instance)):
+
+            # adaptive animations run on the shared driver
+            SlideSwitchAnimator._instance.stop(self)
+
+    def isAnimating(self):
+        '''
+        Whether the thumb is travelling, whatever drives it.
+        '''
+
+        if (self._anim is not None
+                and self._anim.state() == QPropertyAnimation.Running):
+
+            return True
+
+        driver = self._anim_driver
+
+        if driver is None:
+
+            driver = SlideSwitchAnimator._instance
+
+            if driver is None or sip.isdeleted(driver):
+
+                return False
+
+        return driver.isAnimating(self)
 
     @pyqtProperty(int)
     def offset(self):
@@ -316,171 +2243,151 @@ class SlideSwitch(QAbstractButton):
     @offset.setter
     def offset(self, value):
 
+        self._setOffset(value)
+
+    def _setOffset(self, value):
+
+        old_value = self._offset
+
         self._offset = value
 
-        self.update()
+        if old_value != value:
+
+            # only the area swept by the thumb changes
+            self.update(self._switchPainter().thumbDirtyRect(old_value, value))
 
     def sizeHint(self):
 
-        return QSize(
-            4 * self._track_radius + 2 * self._margin,
-            2 * self._track_radius + 2 * self._margin,
-        )
+        return self._switchPainter().geometry.sizeHint()
 
     def setChecked(self, checked):
 
-        super(SlideSwitch, self).setChecked(checked)
+        self.setState(checked)
 
-        self.offset = self._end_offset[checked]()
-
-    def resizeEvent(self, event):
+    def setState(self, checked, animate=False, notify=True):
+        '''
+        Set the status of the switch.
 
-        super(SlideSwitch, self).resizeEvent(event)
+        Parameters
+        -----------
+        checked : bool
 
-        self.offset = self._end_offset[self.isChecked()]()
+            The new status.
 
-    def paintEvent(self, event):
+        animate : bool
 
-        p = QPainter(self)
+            If True, the thumb travels to its new end like after a click,
+            otherwise it jumps there.
 
-        p.setRenderHint(QPainter.Antialiasing, True)
+            Default = False
 
-        p.setPen(Qt.NoPen)
+        notify : bool
 
-        track_opacity = self._track_opacity
+            If False, no signal (e.g. :code:`toggled`) is emitted for the
+            change. Used for bulk updates that notify once for many
+            switches.
 
-        thumb_opacity = self.thumb_opacity
+            Default = True
+        '''
 
-        text_opacity = self.text_opacity
+        changed = self.isChecked() != bool(checked)
 
-        if self.isEnabled():
+        if notify:
 
-            track_brush = self._track_color[self.isChecked()]
+            super(SlideSwitch, self).setChecked(checked)
 
-            thumb_brush = self._thumb_color[self.isChecked()]
+        else:
 
-            text_color = self._text_color[self.isChecked()]
+            blocked = self.blockSignals(True)
 
-        else:
+            super(SlideSwitch, self).setChecked(checked)
 
-            track_opacity *= 0.8
+            self.blockSignals(blocked)
 
-            track_brush = self.palette().shadow()
+        if animate:
 
-            thumb_brush = self.palette().mid()
+            self._animateTo(self._endOffset(checked))
 
-            text_color = self.palette().shadow().color()
+        else:
 
-        if self.direction.lower() == 'v':
+            self._stopAnimation()
 
-            p.setBrush(track_brush)
+            if changed:
 
-            p.setOpacity(track_opacity)
+                # a status change already repaints the whole switch
+                self._offset = self._endOffset(checked)
 
-            p.drawRoundedRect(
-                self._margin,
-                self._margin,
-                self.width() - 2 * self._margin,
-                self.height() - 2 * self._margin,
-                self._track_radius,
-                self._track_radius,
-            )
+            else:
 
-            p.setBrush(thumb_brush)
+                self.offset = self._endOffset(checked)
 
-            p.setOpacity(thumb_opacity)
+    def resizeEvent(self, event):
 
-            p.drawEllipse(
-                self.width()/2.0 - self._thumb_radius,
-                self.offset - self._thumb_radius,
-                2 * self._thumb_radius,
-                2 * self._thumb_radius,
-            )
+        super(SlideSwitch, self).resizeEvent(event)
 
-            p.setPen(text_color)
+        self._invalidatePixmapCache()
 
-            p.setOpacity(text_opacity)
+        self.offset = self._endOffset(self.isChecked())
 
-            font = p.font()
+    def changeEvent(self, event):
 
-            font.setPixelSize(self.font_size_gain * self._thumb_radius)
+        super(SlideSwitch, self).changeEvent(event)
 
-            p.setFont(font)
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange):
 
-            p.drawText(
-                QRectF(
-                    self.width()/2.0 - self._thumb_radius,
-                    self.offset - self._thumb_radius,
-                    2 * self._thumb_radius,
-                    2 * self._thumb_radius,
-                ),
-                Qt.AlignCenter,
-                self._thumb_text[self.isChecked()],
-            )
+            self._invalidatePixmapCache()
 
-        else:
+    def paintEvent(self, event):
 
-            p.setBrush(track_brush)
+        p = QPainter(self)
 
-            p.setOpacity(track_opacity)
+        self._switchPainter().paint(
+            p, 0, 0, self.offset, self.isChecked(), self.isEnabled(),
+            self.devicePixelRatioF(), exposed=event.rect())
 
-            p.drawRoundedRect(
-                self._margin,
-                self._margin,
-                self.width() - 2 * self._margin,
-                self.height() - 2 * self._margin,
-                self._track_radius,
-                self._track_radius,
-            )
+    def mousePressEvent(self, event):
 
-            p.setBrush(thumb_brush)
+        super(SlideSwitch, self).mousePressEvent(event)
 
-            p.setOpacity(thumb_opacity)
+        if event.button() == Qt.LeftButton and self.isDown():
 
-            p.drawEllipse(
-                self.offset - self._thumb_radius,
-                self.height()/2.0 - self._thumb_radius,
-                2 * self._thumb_radius,
-                2 * self._thumb_radius,
-            )
+            SlideSwitchDragger.instance().press(self, event.pos())
 
-            p.setPen(text_color)
+    def mouseMoveEvent(self, event):
 
-            p.setOpacity(text_opacity)
+        dragger = SlideSwitchDragger._instance
 
-            font = p.font()
+        # while dragging, a move only records the pointer position
+        if (dragger is not None and event.buttons() & Qt.LeftButton
+                and dragger.move(self, event.pos())):
 
-            font.setPixelSize(self.font_size_gain * self._thumb_radius)
+            event.accept()
 
-            p.setFont(font)
+            return
 
-            p.drawText(
-                QRectF(
-                    self.offset - self._thumb_radius,
-                    self.height()/2.0 - self._thumb_radius,
-                    2 * self._thumb_radius,
-                    2 * self._thumb_radius,
-                ),
-                Qt.AlignCenter,
-                self._thumb_text[self.isChecked()],
-            )
+        super(SlideSwitch, self).mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
 
-        super(SlideSwitch, self).mouseReleaseEvent(event)
+        dragger = SlideSwitchDragger._instance
 
-        if event.button() == Qt.LeftButton:
+        if (event.button() == Qt.LeftButton and dragger is not None
+                and dragger.release(self, event.pos())):
 
-            anim = QPropertyAnimation(self, b'offset', self)
+            # the drag decided the status instead of a click
+            self.setDown(False)
 
-            anim.setDuration(self.animate_dur)
-            # anim.setDuration(120)
+            self.released.emit()
 
-            anim.setStartValue(self.offset)
+            event.accept()
 
-            anim.setEndValue(self._end_offset[self.isChecked()]())
+            return
+
+        super(SlideSwitch, self).mouseReleaseEvent(event)
+
+        if event.button() == Qt.LeftButton:
 
-            anim.start()
+            self._animateTo(self._endOffset(self.isChecked()))
 
     def enterEvent(self, event):
 
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+'''
+A single widget that paints a grid of slide switches.
+
+One :code:`SlideSwitch` per toggle means one :code:`QObject` per toggle,
+which makes construction, layout and event dispatch grow linearly with
+the number of toggles. :code:`SlideSwitchBank` keeps the states and thumb
+offsets of all of its switches in flat arrays and draws every visible
+cell from a single :code:`paintEvent` through :code:`SlideSwitchPainter`,
+so the cells look exactly like :code:`SlideSwitch` widgets.
+'''
+
+from array import array
+
+from PyQt5.QtCore import QElapsedTimer, QTimer, Qt, pyqtSignal
+
+from slideSwitch import SlideSwitchPainter
+from slideSwitchGrid import SlideSwitchGrid
+
+
+class SlideSwitchBank(SlideSwitchGrid):
+    '''
+    Grid of slide switches painted by one widget.
+
+    Cells are numbered row by row, starting at 0. Clicking a cell toggles
+    it and emits :code:`toggled(index, checked)`.
+    '''
+
+    toggled = pyqtSignal(int, bool)
+
+    def __init__(self, parent=None, count=0, columns=16,
+                 style=None, color_palette=None,
+                 cell_size=None, spacing=4, animate_dur=120):
+        '''
+        Constructor of the SlideSwitchBank object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the bank
+
+            Default = None
+
+        count : int
+
+            Number of switches in the bank.
+
+            Default = 0
+
+        columns : int
+
+            Number of switches per row.
+
+            Default = 16
+
+        style : SlideSwitchStyle
+
+            The style shared by all the switches of the bank. If not given,
+            a default style is built from :code:`color_palette`.
+
+            Default = None
+
+        color_palette : QPalette
+
+            The colour palette used when :code:`style` is not given. See
+            :code:`SlideSwitch`.
+
+            Default = None, i.e., the inherited palette is used.
+
+        cell_size : QSize
+
+            Size of a single switch. If not given, it is derived from the
+            radii and direction of the style.
+
+            Default = None
+
+        spacing : int
+
+            Space between neighbouring switches, in pixels.
+
+            Default = 4
+
+        animate_dur : float
+
+            Time duration of the toggle animation of a cell.
+
+            Default = 120
+        '''
+
+        super(SlideSwitchBank, self).__init__(
+            parent=parent, columns=columns, style=style,
+            color_palette=color_palette, cell_size=cell_size,
+            spacing=spacing)
+
+        self.animate_dur = animate_dur
+
+        self._switch_painter = None
+
+        self._states = bytearray(count)
+
+        self._offsets = array('d', [self._endOffset(False)]) * count
+
+        # index -> (start offset, end offset, start time in ms)
+        self._anims = {}
+
+        self._clock = QElapsedTimer()
+
+        self._clock.start()
+
+        self._anim_timer = QTimer(self)
+
+        self._anim_timer.setInterval(16)
+
+        self._anim_timer.timeout.connect(self._animate)
+
+        self._pressed = -1
+
+    def setCount(self, count):
+        '''
+        Grow or shrink the bank to :code:`count` switches. New switches
+        are off.
+        '''
+
+        old_count = len(self._states)
+
+        if count < old_count:
+
+            del self._states[count:]
+
+            del self._offsets[count:]
+
+            for index in [i for i in self._anims if i >= count]:
+
+                del self._anims[index]
+
+        else:
+
+            self._states.extend(bytearray(count - old_count))
+
+            self._offsets.extend(
+                array('d', [self._endOffset(False)]) * (count - old_count))
+
+        self.updateGeometry()
+
+        self.update()
+
+    def setColumns(self, columns):
+
+        self._columns = max(1, columns)
+
+        self.updateGeometry()
+
+        self.update()
+
+    def setSwitchStyle(self, style):
+        '''
+        Use :code:`style`, a :code:`SlideSwitchStyle`, for every switch.
+        '''
+
+        self._style = style
+
+        self._anims.clear()
+
+        self._resetOffsets()
+
+        self.updateGeometry()
+
+        self.update()
+
+    def setPalette(self, palette):
+        '''
+        '''
+
+        self.setSwitchStyle(self._style.withPalette(palette))
+
+    def setAnimDur(self, animate_dur):
+        '''
+        '''
+
+        self.animate_dur = animate_dur
+
+    def setCellSize(self, cell_size):
+
+        self._cell_size = cell_size
+
+        self._resetOffsets()
+
+        self.updateGeometry()
+
+        self.update()
+
+    def isChecked(self, index):
+
+        return bool(self._states[index])
+
+    def setChecked(self, index, checked, animate=False):
+        '''
+        Set the status of the switch at :code:`index`. Emits
+        :code:`toggled` if the status changes.
+        '''
+
+        checked = bool(checked)
+
+        if bool(self._states[index]) == checked:
+
+            return
+
+        self._states[index] = checked
+
+        end = self._endOffset(checked)
+
+        if animate and self.animate_dur > 0:
+
+            self._anims[index] = (
+                self._offsets[index], end, self._clock.elapsed())
+
+            if not self._anim_timer.isActive():
+
+                self._anim_timer.start()
+
+        else:
+
+            self._anims.pop(index, None)
+
+            self._offsets[index] = end
+
+        self.update(self.cellRect(index))
+
+        self.toggled.emit(index, checked)
+
+    def toggle(self, index, animate=True):
+
+        self.setChecked(index, not self._states[index], animate=animate)
+
+    def states(self):
+        '''
+        Copy of the statuses of all the switches, one byte (0 or 1) per
+        switch.
+        '''
+
+        return bytes(self._states)
+
+    def _endOffset(self, checked):
+
+        return self._switchPainter().geometry.travel[checked]
+
+    def _resetOffsets(self):
+
+        self._switch_painter = None
+
+        on = self._endOffset(True)
+
+        off = self._endOffset(False)
+
+        self._offsets = array(
+            'd', [on if state else off for state in self._states])
+
+    def _switchPainter(self):
+
+        painter = self._switch_painter
+
+        if painter is None:
+
+            size = self.cellSize()
+
+            painter = self._switch_painter = SlideSwitchPainter(
+                self._style, size.width(), size.height(),
+                font=self.font(), palette=self.palette(), pixmap_cache=True)
+
+        return painter
+
+    def _animate(self):
+
+        now = self._clock.elapsed()
+
+        duration = float(max(1, self.animate_dur))
+
+        painter = self._switchPainter()
+
+        finished = []
+
+        for index, (start, end, started) in self._anims.items():
+
+            progress = (now - started) / duration
+
+            old_offset = self._offsets[index]
+
+            if progress >= 1.0:
+
+                new_offset = end
+
+                finished.append(index)
+
+            else:
+
+                new_offset = start + (end - start) * progress
+
+            self._offsets[index] = new_offset
+
+            cell = self.cellRect(index)
+
+            self.update(painter.thumbDirtyRect(
+                old_offset, new_offset, cell.x(), cell.y()))
+
+        for index in finished:
+
+            del self._anims[index]
+
+        if not self._anims:
+
+            self._anim_timer.stop()
+
+    def changeEvent(self, event):
+
+        super(SlideSwitchBank, self).changeEvent(event)
+
+        self._switch_painter = None
+
+    def _cellPainter(self, enabled, dpr, exposed):
+
+        paint = self._switchPainter().paint
+
+        states = self._states
+
+        offsets = self._offsets
+
+        def paintCell(p, index, x, y):
+
+            paint(p, x, y, offsets[index], states[index], enabled, dpr,
+                  exposed=exposed)
+
+        return paintCell
+
+    def mousePressEvent(self, event):
+
+        if event.button() == Qt.LeftButton:
+
+            self._pressed = self.indexAt(event.pos())
+
+        super(SlideSwitchBank, self).mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+
+        if event.button() == Qt.LeftButton:
+
+            index = self.indexAt(event.pos())
+
+            if index >= 0 and index == self._pressed:
+
+                self.toggle(index, animate=True)
+
+            self._pressed = -1
+
+        super(SlideSwitchBank, self).mouseReleaseEvent(event)
+
+    def enterEvent(self, event):
+
+        self.setCursor(Qt.PointingHandCursor)
+
+        super(SlideSwitchBank, self).enterEvent(event)
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+
+'''
+Build or configure panels of slide switches from a JSON description.
+
+Instead of configuring switches one at a time (:code:`setPalette`,
+:code:`setThumbText`, :code:`setDirection`, :code:`setAnimDur`, ...),
+:code:`SlideSwitchBuilder` reads a description of palettes, styles and
+switches, resolves every distinct appearance once into a shared
+:code:`SlideSwitchStyle` and then either creates the switches in bulk in
+a lazily materialized :code:`SlideSwitchPanel` (:code:`build()`) or
+configures existing switches found by object name (:code:`apply()`).
+
+A description looks like this::
+
+    {
+        "palettes": {
+            "green": {"highlight": "#008800", "shadow": [128, 0, 0]}
+        },
+        "styles": {
+            "small": {"palette": "green", "track_radius": 8,
+                      "thumb_texts": ["Off", "On"]}
+        },
+        "panel": {"style": "small", "columns": 16, "spacing": 4},
+        "switches": [
+            {"name": "pump", "checked": true, "label": "pumpLabel"},
+            {"style": "small", "checked": false, "count": 1000}
+        ]
+    }
+
+Palette roles are :code:`QPalette` colour roles (e.g. :code:`highlight`,
+:code:`shadow`, :code:`highlightedText`, :code:`text`), with colours given
+as names, :code:`#rrggbb` strings or :code:`[r, g, b(, a)]` lists. Styles
+and switches accept the style fields :code:`track_radius`,
+:code:`thumb_radius`, :code:`track_opacity`, :code:`thumb_opacity`,
+:code:`text_opacity`, :code:`font_size_gain`, :code:`direction` and
+:code:`thumb_texts` (off, on). Switches additionally accept
+:code:`name`, :code:`style`, :code:`palette`, :code:`checked`,
+:code:`enabled`, :code:`animate_dur`, :code:`font` (:code:`family`,
+:code:`point_size`), :code:`label` (object name of a widget enabled
+while the switch is on) and :code:`count` (number of alike switches,
+:code:`build()` only).
+'''
+
+import json
+
+from PyQt5.QtGui import QColor, QFont, QPalette
+from PyQt5.QtWidgets import QWidget
+
+from slideSwitch import SlideSwitch, SlideSwitchStyle
+from slideSwitchGroup import SlideSwitchGroup
+from slideSwitchPanel import SlideSwitchPanel
+
+_STYLE_FIELDS = (
+    'track_radius',
+    'thumb_radius',
+    'track_opacity',
+    'thumb_opacity',
+    'text_opacity',
+    'font_size_gain',
+    'direction',
+    'thumb_texts',
+)
+
+_SWITCH_KEYS = _STYLE_FIELDS + (
+    'name', 'style', 'palette', 'checked', 'enabled',
+    'animate_dur', 'font', 'label', 'count',
+)
+
+
+class SlideSwitchBuilder(object):
+    '''
+    Creates or configures slide switches from a panel description.
+    '''
+
+    def __init__(self, description):
+        '''
+        Constructor of the SlideSwitchBuilder object.
+
+        Parameters
+        -----------
+        description : dict
+
+            The panel description, see the module documentation.
+        '''
+
+        if not isinstance(description, dict):
+
+            raise ValueError(
+                'Input argument "description" must be a dict')
+
+        self.description = description
+
+        self._palettes = {}
+
+        # (style name, palette name, overrides, fallback palette key)
+        # -> SlideSwitchStyle
+        self._styles = {}
+
+        for name, entry in description.get('styles', {}).items():
+
+            self._checkKeys(entry, _STYLE_FIELDS + ('palette',),
+                            'style "{0}"'.format(name))
+
+        for entry in description.get('switches', ()):
+
+            self._checkKeys(entry, _SWITCH_KEYS, 'switch')
+
+    @classmethod
+    def fromJson(cls, text):
+
+        return cls(json.loads(text))
+
+    @classmethod
+    def fromFile(cls, path):
+
+        with open(path, 'rb') as f:
+
+            return cls(json.loads(f.read().decode('utf-8')))
+
+    def palette(self, name):
+        '''
+        The :code:`QPalette` described under :code:`name`. Roles not
+        described keep the colours of a default :code:`QPalette`.
+        '''
+
+        palette = self._palettes.get(name)
+
+        if palette is None:
+
+            try:
+
+                roles = self.description['palettes'][name]
+
+            except KeyError:
+
+                raise ValueError('Unknown palette "{0}"'.format(name))
+
+            palette = QPalette()
+
+            for role, color in roles.items():
+
+                palette.setColor(_colorRole(role), _color(color))
+
+            self._palettes[name] = palette
+
+        return palette
+
+    def style(self, entry, palette=None):
+        '''
+        The shared :code:`SlideSwitchStyle` of a switch entry (or of a
+        named style if :code:`entry` is a string). Colours come from the
+        palette named by the entry or its style, else from
+        :code:`palette`, else from the application palette.
+        '''
+
+        if isinstance(entry, str):
+
+            entry = {'style': entry}
+
+        style_name = entry.get('style',
+                               self.description.get('panel', {}).get('style'))
+
+        style_entry = {}
+
+        if style_name is not None:
+
+            try:
+
+                style_entry = self.description['styles'][style_name]
+
+            except KeyError:
+
+                raise ValueError('Unknown style "{0}"'.format(style_name))
+
+        palette_name = entry.get('palette', style_entry.get('palette'))
+
+        overrides = tuple(
+            (field, _hashable(entry[field]))
+            for field in _STYLE_FIELDS if field in entry)
+
+        key = (style_name, palette_name, overrides,
+               None if palette_name is not None or palette is None
+               else palette.cacheKey())
+
+        style = self._styles.get(key)
+
+        if style is None:
+
+            fields = dict(
+                (field, style_entry[field])
+                for field in _STYLE_FIELDS if field in style_entry)
+
+            fields.update(overrides)
+
+            if 'thumb_texts' in fields:
+
+                fields['thumb_texts'] = tuple(fields['thumb_texts'])
+
+            if palette_name is not None:
+
+                palette = self.palette(palette_name)
+
+            elif palette is None:
+
+                palette = QPalette()
+
+            style = self._styles[key] = SlideSwitchStyle.fromPalette(
+                palette, **fields)
+
+        return style
+
+    def build(self, parent=None, root=None):
+        '''
+        Create a :code:`SlideSwitchPanel` holding every switch of the
+        description, in order. Runs of alike switches are added in bulk
+        and no widget is created before its cell is first shown. Cells
+        are as large as the largest switch, so entries overriding the
+        direction or the radii keep their natural size.
+
+        Parameters
+        -----------
+        parent : QWidget
+
+            The parent widget for the panel
+
+            Default = None
+
+        root : QObject
+
+            Object whose children are searched for the labels named by
+            the switches.
+
+            Default = None, i.e., :code:`parent` is searched.
+
+        Returns the panel; :code:`panel.names` maps switch names to
+        indices.
+        '''
+
+        panel_entry = self.description.get('panel', {})
+
+        panel = SlideSwitchPanel(
+            parent,
+            columns=panel_entry.get('columns', 16),
+            style=self.style({}),
+            spacing=panel_entry.get('spacing', 4),
+        )
+
+        if 'font' in panel_entry:
+
+            panel.setFont(_font(panel_entry['font']))
+
+        fallback = panel.palette()
+
+        names = {}
+
+        labels = {}
+
+        root = parent if root is None else root
+
+        for entry in self.description.get('switches', ()):
+
+            kwargs = {}
+
+            if 'animate_dur' in entry:
+
+                kwargs['animate_dur'] = entry['animate_dur']
+
+            if 'font' in entry:
+
+                kwargs['font'] = _font(entry['font'])
+
+            indices = panel.addSwitches(
+                entry.get('count', 1),
+                checked=entry.get('checked', False),
+                enabled=entry.get('enabled', True),
+                style=self.style(entry, fallback),
+                **kwargs)
+
+            if 'name' in entry:
+
+                names[entry['name']] = indices[0]
+
+            if 'label' in entry:
+
+                label = _findLabel(root, entry['label'])
+
+                label.setEnabled(bool(entry.get('checked', False)))
+
+                for index in indices:
+
+                    labels[index] = label
+
+        panel.names = names
+
+        if labels:
+
+            def syncLabel(index, checked):
+
+                label = labels.get(index)
+
+                if label is not None:
+
+                    label.setEnabled(checked)
+
+            panel.toggled.connect(syncLabel)
+
+        return panel
+
+    def apply(self, root, parent=None):
+        '''
+        Configure existing switches found under :code:`root` by their
+        object names (the :code:`name` of each switch entry) and return
+        them as a :code:`SlideSwitchGroup`, in description order. Labels
+        follow their switch also through the bulk changes of the group.
+
+        Parameters
+        -----------
+        root : QObject
+
+            Object whose children are searched for the switches and the
+            labels.
+
+        parent : QObject
+
+            The parent object for the returned group
+
+            Default = None
+        '''
+
+        switches = []
+
+        bindings = []
+
+        for entry in self.description.get('switches', ()):
+
+            name = entry.get('name')
+
+            switch = root.findChild(SlideSwitch, name) if name else None
+
+            if switch is None:
+
+                raise ValueError(
+                    'No slide switch named "{0}"'.format(name))
+
+            switch.setSwitchStyle(self.style(entry, switch.palette()))
+
+            if 'font' in entry:
+
+                switch.setFont(_font(entry['font']))
+
+            if 'animate_dur' in entry:
+
+                switch.setAnimDur(entry['animate_dur'])
+
+            if 'enabled' in entry:
+
+                switch.setEnabled(entry['enabled'])
+
+            if 'checked' in entry:
+
+                switch.setState(entry['checked'], notify=False)
+
+            if 'label' in entry:
+
+                label = _findLabel(root, entry['label'])
+
+                switch.toggled.connect(label.setEnabled)
+
+                label.setEnabled(switch.isChecked())
+
+                bindings.append((switch, label))
+
+            switches.append(switch)
+
+        group = SlideSwitchGroup(switches, parent=parent)
+
+        if bindings:
+
+            # the group suspends toggled, so labels are synced from its
+            # single notification as well
+            def syncLabels(changed):
+
+                for switch, label in bindings:
+
+                    label.setEnabled(switch.isChecked())
+
+            group.statesChanged.connect(syncLabels)
+
+        return group
+
+    @staticmethod
+    def _checkKeys(entry, allowed, what):
+
+        unknown = set(entry) - set(allowed)
+
+        if unknown:
+
+            raise ValueError(
+                'Unknown keys in {0}: {1}'.format(
+                    what, ', '.join(sorted(unknown))))
+
+
+def _colorRole(name):
+
+    role = getattr(QPalette, name[:1].upper() + name[1:], None)
+
+    if not isinstance(role, QPalette.ColorRole):
+
+        raise ValueError('Unknown palette role "{0}"'.format(name))
+
+    return role
+
+
+def _color(value):
+
+    if isinstance(value, (list, tuple)):
+
+        return QColor(*value)
+
+    color = QColor(value)
+
+    if not color.isValid():
+
+        raise ValueError('Invalid colour "{0}"'.format(value))
+
+    return color
+
+
+def _font(entry):
+
+    font = QFont()
+
+    if 'family' in entry:
+
+        font.setFamily(entry['family'])
+
+    if 'point_size' in entry:
+
+        font.setPointSize(entry['point_size'])
+
+    return font
+
+
+def _findLabel(root, name):
+
+    label = root.findChild(QWidget, name) if root is not None else None
+
+    if label is None:
+
+        raise ValueError('No widget named "{0}"'.format(name))
+
+    return label
+
+
+def _hashable(value):
+
+    if isinstance(value, list):
+
+        return tuple(value)
+
+    return value
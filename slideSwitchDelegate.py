@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+'''
+Item delegate that shows boolean model data as slide switches.
+
+Putting a :code:`SlideSwitch` into every row with :code:`setIndexWidget`
+creates one widget per row and does not scale to large models.
+:code:`SlideSwitchDelegate` paints the switches with the same
+:code:`SlideSwitchPainter` used by :code:`SlideSwitch`, so views only paint
+the visible rows and no widget exists per row. Clicking a switch (or
+pressing space on the current index) writes the toggled value back through
+:code:`QAbstractItemModel.setData`.
+'''
+
+from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtWidgets import (QAbstractItemView, QApplication, QStyle,
+                             QStyledItemDelegate, QStyleOptionViewItem)
+
+from slideSwitch import SlideSwitchPainter, SlideSwitchStyle
+
+
+class SlideSwitchDelegate(QStyledItemDelegate):
+    '''
+    Renders the :code:`role` data of an index as a slide switch.
+    '''
+
+    def __init__(self, parent=None, style=None, color_palette=None,
+                 role=Qt.EditRole, alignment=Qt.AlignCenter):
+        '''
+        Constructor of the SlideSwitchDelegate object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the delegate, usually the view.
+
+            Default = None
+
+        style : SlideSwitchStyle
+
+            The style of the switches. If not given, a default style is
+            built from :code:`color_palette`.
+
+            Default = None
+
+        color_palette : QPalette
+
+            The colour palette used when :code:`style` is not given. See
+            :code:`SlideSwitch`.
+
+            Default = None, i.e., the application palette is used.
+
+        role : Qt.ItemDataRole
+
+            The model role holding the boolean value.
+
+            Default = Qt.EditRole
+
+        alignment : Qt.Alignment
+
+            Alignment of the switch inside the item rectangle.
+
+            Default = Qt.AlignCenter
+        '''
+
+        super(SlideSwitchDelegate, self).__init__(parent)
+
+        if style is None:
+
+            style = SlideSwitchStyle.fromColorPalette(
+                color_palette, QApplication.palette())
+
+        self._style = style
+
+        self.role = role
+
+        self.alignment = alignment
+
+        # the painter depends on the font and palette of the view, so the
+        # last one is kept together with the key it was made for
+        self._switch_painter = None
+
+        self._painter_key = None
+
+    def switchStyle(self):
+
+        return self._style
+
+    def setSwitchStyle(self, style):
+        '''
+        Use :code:`style`, a :code:`SlideSwitchStyle`, for the switches and
+        repaint the views using the delegate.
+        '''
+
+        self._style = style
+
+        self._switch_painter = None
+
+        for view in self.views():
+
+            view.viewport().update()
+
+    def views(self):
+        '''
+        The item views using this delegate, for all items or for a column.
+        '''
+
+        return [view for view, delegates in _viewDelegates()
+                if self in delegates]
+
+    @classmethod
+    def instances(cls):
+        '''
+        Every slide switch delegate set on a live item view, for all items
+        or for a column.
+        '''
+
+        found = []
+
+        for view, delegates in _viewDelegates():
+
+            for delegate in delegates:
+
+                if isinstance(delegate, cls) and delegate not in found:
+
+                    found.append(delegate)
+
+        return found
+
+    def setPalette(self, palette):
+        '''
+        '''
+
+        self.setSwitchStyle(self._style.withPalette(palette))
+
+    def switchRect(self, option):
+        '''
+        Rectangle of the switch inside the item rectangle of
+        :code:`option`.
+        '''
+
+        return QStyle.alignedRect(
+            option.direction, self.alignment,
+            self._style.naturalSize(), option.rect)
+
+    def _switchPainter(self, option):
+
+        key = (option.font.key(), option.palette.cacheKey())
+
+        if self._switch_painter is None or key != self._painter_key:
+
+            size = self._style.naturalSize()
+
+            self._switch_painter = SlideSwitchPainter(
+                self._style, size.width(), size.height(),
+                font=option.font, palette=option.palette, pixmap_cache=True)
+
+            self._painter_key = key
+
+        return self._switch_painter
+
+    def paint(self, painter, option, index):
+
+        # the view passes the same option to every item: change a copy
+        option = QStyleOptionViewItem(option)
+
+        self.initStyleOption(option, index)
+
+        widget = option.widget
+
+        style = widget.style() if widget is not None else QApplication.style()
+
+        # background, selection and focus only; the value itself is drawn
+        # as a switch below
+        option.text = ''
+
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, widget)
+
+        checked = bool(index.data(self.role))
+
+        enabled = bool(option.state & QStyle.State_Enabled)
+
+        rect = self.switchRect(option)
+
+        switch_painter = self._switchPainter(option)
+
+        dpr = painter.device().devicePixelRatioF()
+
+        painter.save()
+
+        switch_painter.paint(
+            painter, rect.x(), rect.y(),
+            switch_painter.geometry.travel[checked],
+            checked, enabled, dpr)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+
+        return self._style.naturalSize()
+
+    def createEditor(self, parent, option, index):
+
+        # the value is toggled in place, there is nothing to edit
+        return None
+
+    def editorEvent(self, event, model, option, index):
+
+        flags = index.flags()
+
+        if not (flags & Qt.ItemIsEditable) or not (flags & Qt.ItemIsEnabled):
+
+            return False
+
+        event_type = event.type()
+
+        if event_type in (QEvent.MouseButtonPress,
+                          QEvent.MouseButtonDblClick,
+                          QEvent.MouseButtonRelease):
+
+            if (event.button() != Qt.LeftButton
+                    or not self.switchRect(option).contains(event.pos())):
+
+                return False
+
+            if event_type != QEvent.MouseButtonRelease:
+
+                # swallow presses so that the view does not start editing
+                return True
+
+        elif event_type == QEvent.KeyPress:
+
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+
+                return False
+
+        else:
+
+            return False
+
+        return model.setData(index, not bool(index.data(self.role)),
+                             self.role)
+
+
+def _viewDelegates():
+    '''
+    (view, delegates) for every live item view: its item delegate and
+    its column delegates.
+    '''
+
+    for widget in QApplication.allWidgets():
+
+        if not isinstance(widget, QAbstractItemView):
+
+            continue
+
+        delegates = [widget.itemDelegate()]
+
+        model = widget.model()
+
+        if model is not None:
+
+            for column in range(model.columnCount()):
+
+                delegate = widget.itemDelegateForColumn(column)
+
+                if delegate is not None:
+
+                    delegates.append(delegate)
+
+        yield widget, delegates
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+'''
+Thread-safe, rate-limited state feed for slide switches.
+
+Calling :code:`SlideSwitch.setChecked` through queued signals for every
+state update coming from worker threads floods the GUI event loop when
+updates arrive thousands of times per second. :code:`SlideSwitchFeeder`
+accepts updates from any thread, keeps only the latest status per switch
+and applies what is pending on the GUI thread in one
+:code:`SlideSwitchGroup.setStates` call, at most :code:`max_rate` times per
+second.
+'''
+
+import threading
+
+from PyQt5.QtCore import QElapsedTimer, QObject, QTimer, Qt, pyqtSignal
+
+
+class SlideSwitchFeeder(QObject):
+    '''
+    Feeds statuses into a :code:`SlideSwitchGroup` from any thread.
+
+    Switches are addressed by their index in the group. The feeder must
+    be created on the GUI thread; :code:`push()` and :code:`pushMany()`
+    may be called from any thread.
+    '''
+
+    # emitted from the pushing thread, delivered on the GUI thread
+    _wake = pyqtSignal()
+
+    def __init__(self, group, parent=None, max_rate=60.0, animate=False):
+        '''
+        Constructor of the SlideSwitchFeeder object.
+
+        Parameters
+        -----------
+        group : SlideSwitchGroup
+
+            The switches to feed.
+
+        parent : QObject
+
+            The parent object for the feeder
+
+            Default = None
+
+        max_rate : float
+
+            Maximum number of times per second pending statuses are
+            applied. The default matches one application per frame of a
+            60 Hz display.
+
+            Default = 60.0
+
+        animate : bool
+
+            If True, changed switches animate to their new status.
+
+            Default = False
+        '''
+
+        super(SlideSwitchFeeder, self).__init__(parent)
+
+        self._group = group
+
+        self.animate = animate
+
+        self._lock = threading.Lock()
+
+        # index -> latest status not applied yet
+        self._pending = {}
+
+        self._scheduled = False
+
+        self._received = 0
+
+        self._applied = 0
+
+        self._flushes = 0
+
+        self._interval = 0
+
+        self.setMaxRate(max_rate)
+
+        self._clock = QElapsedTimer()
+
+        self._clock.start()
+
+        self._last_flush = None
+
+        self._timer = QTimer(self)
+
+        self._timer.setSingleShot(True)
+
+        self._timer.timeout.connect(self.flush)
+
+        self._wake.connect(self._schedule, Qt.QueuedConnection)
+
+    def setMaxRate(self, max_rate):
+        '''
+        Apply pending statuses at most :code:`max_rate` times per second.
+        '''
+
+        if max_rate <= 0:
+
+            raise ValueError('Input argument "max_rate" must be positive')
+
+        self._interval = int(round(1000.0 / max_rate))
+
+    def push(self, index, checked):
+        '''
+        Queue the status of the switch at :code:`index`. Thread-safe. An
+        older status of the same switch that is still pending is dropped.
+        '''
+
+        self._checkIndex(index)
+
+        with self._lock:
+
+            self._pending[index] = bool(checked)
+
+            self._received += 1
+
+            wake = not self._scheduled
+
+            self._scheduled = True
+
+        if wake:
+
+            self._wake.emit()
+
+    def pushMany(self, states):
+        '''
+        Queue several statuses at once from an index -> status mapping.
+        Thread-safe. Nothing is queued if an index is out of range.
+        '''
+
+        for index in states:
+
+            self._checkIndex(index)
+
+        with self._lock:
+
+            pending = self._pending
+
+            for index, checked in states.items():
+
+                pending[index] = bool(checked)
+
+            self._received += len(states)
+
+            wake = not self._scheduled
+
+            self._scheduled = True
+
+        if wake:
+
+            self._wake.emit()
+
+    def flush(self):
+        '''
+        Apply every pending status now. Must run on the GUI thread.
+        '''
+
+        with self._lock:
+
+            pending = self._pending
+
+            self._pending = {}
+
+            self._scheduled = False
+
+        self._last_flush = self._clock.elapsed()
+
+        # the group may have shrunk since the statuses were pushed
+        count = self._group.count()
+
+        if any(not 0 <= index < count for index in pending):
+
+            pending = dict((index, checked)
+                           for index, checked in pending.items()
+                           if 0 <= index < count)
+
+        if not pending:
+
+            return
+
+        self._group.setStates(pending, animate=self.animate)
+
+        with self._lock:
+
+            self._applied += len(pending)
+
+            self._flushes += 1
+
+    def receivedCount(self):
+
+        return self._received
+
+    def appliedCount(self):
+
+        return self._applied
+
+    def counters(self):
+        '''
+        Return the counters of the feeder as a dict.
+
+        :code:`received` counts every pushed status, :code:`applied` the
+        statuses handed to the group after coalescing, :code:`coalesced`
+        those replaced by a newer status before being applied,
+        :code:`pending` those waiting and :code:`flushes` the number of
+        times statuses were applied.
+        '''
+
+        with self._lock:
+
+            pending = len(self._pending)
+
+            return {
+                'received': self._received,
+                'applied': self._applied,
+                'coalesced': self._received - self._applied - pending,
+                'pending': pending,
+                'flushes': self._flushes,
+            }
+
+    def _checkIndex(self, index):
+
+        # checked on the pushing thread: an exception raised in flush(),
+        # a timer slot, would abort the application
+        if not 0 <= index < self._group.count():
+
+            raise ValueError(
+                'Input argument "index"'
+                + ' must be the index of a switch of the group')
+
+    def _schedule(self):
+
+        if self._timer.isActive():
+
+            return
+
+        if self._last_flush is None:
+
+            delay = 0
+
+        else:
+
+            delay = max(
+                0, self._last_flush + self._interval - self._clock.elapsed())
+
+        self._timer.start(delay)
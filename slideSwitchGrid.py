@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+'''
+Grid layout and painting shared by the widgets drawing many switches.
+
+:code:`SlideSwitchBank` and :code:`SlideSwitchPanel` both lay switches out
+row by row in cells of one size and draw the visible cells from a single
+:code:`paintEvent`. :code:`SlideSwitchGrid` holds that layout and the loop
+over the cells exposed by a paint event; subclasses only paint one cell.
+'''
+
+from PyQt5.QtCore import QRect, QSize
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+from slideSwitch import SlideSwitchPainter, SlideSwitchStyle
+
+
+class SlideSwitchGrid(QWidget):
+    '''
+    Base class of the widgets painting a grid of slide switches.
+
+    Cells are numbered row by row, starting at 0. Subclasses keep one
+    byte per switch in :code:`_states`. By default every switch is
+    painted at rest in the style of the grid; subclasses with thumb
+    animations or styles of their own override :code:`_cellPainter()`.
+    '''
+
+    def __init__(self, parent=None, columns=16, style=None,
+                 color_palette=None, cell_size=None, spacing=4):
+        '''
+        Constructor of the SlideSwitchGrid object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the grid
+
+            Default = None
+
+        columns : int
+
+            Number of switches per row.
+
+            Default = 16
+
+        style : SlideSwitchStyle
+
+            The style of the switches. If not given, a default style is
+            built from :code:`color_palette`.
+
+            Default = None
+
+        color_palette : QPalette
+
+            The colour palette used when :code:`style` is not given. See
+            :code:`SlideSwitch`.
+
+            Default = None, i.e., the inherited palette is used.
+
+        cell_size : QSize
+
+            Size of a single switch. If not given, it is derived from the
+            radii and direction of :code:`style`.
+
+            Default = None
+
+        spacing : int
+
+            Space between neighbouring switches, in pixels.
+
+            Default = 4
+        '''
+
+        super(SlideSwitchGrid, self).__init__(parent=parent)
+
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+        if style is None:
+
+            style = SlideSwitchStyle.fromColorPalette(
+                color_palette, self.palette())
+
+        self._style = style
+
+        self._columns = max(1, columns)
+
+        self._cell_size = cell_size
+
+        self._spacing = spacing
+
+        self._states = bytearray()
+
+    def count(self):
+
+        return len(self._states)
+
+    def columns(self):
+
+        return self._columns
+
+    def switchStyle(self):
+
+        return self._style
+
+    def cellSize(self):
+
+        if self._cell_size is not None:
+
+            return self._cell_size
+
+        return self._naturalCellSize()
+
+    def _naturalCellSize(self):
+        '''
+        Cell size when none is given: the natural size of the switches.
+        '''
+
+        return self._style.naturalSize()
+
+    def cellRect(self, index):
+        '''
+        Rectangle of the switch at :code:`index`, in widget coordinates.
+        '''
+
+        size = self.cellSize()
+
+        row, column = divmod(index, self._columns)
+
+        return QRect(
+            column * (size.width() + self._spacing),
+            row * (size.height() + self._spacing),
+            size.width(),
+            size.height(),
+        )
+
+    def indexAt(self, pos):
+        '''
+        Index of the switch under :code:`pos`, or -1 if there is none.
+        '''
+
+        size = self.cellSize()
+
+        step_x = size.width() + self._spacing
+
+        step_y = size.height() + self._spacing
+
+        x = pos.x()
+
+        y = pos.y()
+
+        if x < 0 or y < 0:
+
+            return -1
+
+        column, local_x = divmod(x, step_x)
+
+        row, local_y = divmod(y, step_y)
+
+        if (column >= self._columns
+                or local_x >= size.width() or local_y >= size.height()):
+
+            return -1
+
+        index = int(row * self._columns + column)
+
+        return index if index < len(self._states) else -1
+
+    def sizeHint(self):
+
+        size = self.cellSize()
+
+        count = len(self._states)
+
+        rows = -(-count // self._columns)
+
+        columns = min(self._columns, count)
+
+        return QSize(
+            max(0, columns * (size.width() + self._spacing) - self._spacing),
+            max(0, rows * (size.height() + self._spacing) - self._spacing),
+        )
+
+    def paintEvent(self, event):
+
+        count = len(self._states)
+
+        if not count:
+
+            return
+
+        size = self.cellSize()
+
+        step_x = size.width() + self._spacing
+
+        step_y = size.height() + self._spacing
+
+        rect = event.rect()
+
+        first_column = max(0, rect.left() // step_x)
+
+        last_column = min(self._columns - 1, rect.right() // step_x)
+
+        first_row = max(0, rect.top() // step_y)
+
+        last_row = rect.bottom() // step_y
+
+        # thumb animations expose a part of a single cell; only then is it
+        # worth testing the track and the thumb against the exposed rect
+        if first_column == last_column and first_row == last_row:
+
+            exposed = rect
+
+        else:
+
+            exposed = None
+
+        paint_cell = self._cellPainter(
+            self.isEnabled(), self.devicePixelRatioF(), exposed)
+
+        p = QPainter(self)
+
+        for row in range(first_row, last_row + 1):
+
+            base = row * self._columns
+
+            if base >= count:
+
+                break
+
+            y = row * step_y
+
+            for column in range(first_column, last_column + 1):
+
+                index = base + column
+
+                if index >= count:
+
+                    break
+
+                paint_cell(p, index, column * step_x, y)
+
+    def _cellPainter(self, enabled, dpr, exposed):
+        '''
+        Return the function :code:`paint_cell(p, index, x, y)` painting
+        the switch at :code:`index` with its top left corner at
+        (:code:`x`, :code:`y`) during one paint event. :code:`exposed` is
+        the rectangle to repaint when it lies within a single cell,
+        otherwise None.
+        '''
+
+        size = self.cellSize()
+
+        painter = SlideSwitchPainter.shared(
+            self._style, size.width(), size.height(), self.font(),
+            self.palette(), pixmap_cache=True)
+
+        paint = painter.paint
+
+        travel = painter.geometry.travel
+
+        states = self._states
+
+        def paintCell(p, index, x, y):
+
+            checked = states[index]
+
+            paint(p, x, y, travel[checked], checked, enabled, dpr,
+                  exposed=exposed)
+
+        return paintCell
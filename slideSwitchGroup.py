@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+'''
+Bulk operations on many slide switches.
+
+Setting switches one by one with :code:`SlideSwitch.setChecked` emits
+:code:`toggled` for every switch and runs every connected slot.
+:code:`SlideSwitchGroup` changes any number of switches with their
+signals suspended and then emits a single :code:`statesChanged` listing
+the switches that actually changed. The repaints of all the switches are
+posted while the states are applied, so Qt paints them in one pass.
+
+Switches that are not in a :code:`QButtonGroup` yet are put into small
+non-exclusive button groups owned by the group. Without a button group,
+Qt looks through every sibling widget each time a button is unchecked,
+which makes unchecking thousands of sibling switches quadratic; adding
+buttons to one big button group is quadratic as well.
+'''
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QButtonGroup
+
+# switches per internal QButtonGroup
+_BUTTON_GROUP_SIZE = 64
+
+
+class SlideSwitchGroup(QObject):
+    '''
+    An ordered collection of :code:`SlideSwitch` objects changed in bulk.
+    '''
+
+    # the switches whose status changed, in group order
+    statesChanged = pyqtSignal(list)
+
+    def __init__(self, switches=(), parent=None):
+        '''
+        Constructor of the SlideSwitchGroup object.
+
+        Parameters
+        -----------
+        switches : iterable of SlideSwitch
+
+            The switches of the group, in order.
+
+            Default = ()
+
+        parent : QObject
+
+            The parent object for the group
+
+            Default = None
+        '''
+
+        super(SlideSwitchGroup, self).__init__(parent)
+
+        self._button_groups = []
+
+        self._switches = []
+
+        # default cap of applyStates() on simultaneous animations
+        self.max_animations = 64
+
+        for switch in switches:
+
+            self.addSwitch(switch)
+
+    def switches(self):
+
+        return list(self._switches)
+
+    def addSwitch(self, switch):
+
+        self._switches.append(switch)
+
+        if switch.group() is None:
+
+            groups = self._button_groups
+
+            if not groups or len(groups[-1].buttons()) >= _BUTTON_GROUP_SIZE:
+
+                button_group = QButtonGroup(self)
+
+                button_group.setExclusive(False)
+
+                groups.append(button_group)
+
+            groups[-1].addButton(switch)
+
+    def removeSwitch(self, switch):
+
+        self._switches.remove(switch)
+
+        button_group = switch.group()
+
+        if button_group in self._button_groups:
+
+            button_group.removeButton(switch)
+
+    def count(self):
+
+        return len(self._switches)
+
+    def states(self):
+        '''
+        Statuses of the switches, in group order.
+        '''
+
+        return [switch.isChecked() for switch in self._switches]
+
+    def setStates(self, values, animate=False):
+        '''
+        Set the statuses of many switches at once.
+
+        Parameters
+        -----------
+        values : sequence of bool or dict
+
+            Either one status per switch, in group order, or a mapping
+            from index to status for the switches to change.
+
+        animate : bool
+
+            If True, the thumbs of the changed switches travel to their new
+            ends, otherwise they jump there.
+
+            Default = False
+
+        Returns
+        -----------
+        list
+
+            The switches whose status changed. :code:`statesChanged` is
+            emitted with the same list if it is not empty.
+        '''
+
+        if isinstance(values, dict):
+
+            items = sorted(values.items())
+
+        else:
+
+            if len(values) != len(self._switches):
+
+                raise ValueError(
+                    'Input argument "values" must have one status'
+                    + ' per switch of the group')
+
+            items = enumerate(values)
+
+        switches = self._switches
+
+        changed = []
+
+        for index, checked in items:
+
+            switch = switches[index]
+
+            checked = bool(checked)
+
+            if switch.isChecked() != checked:
+
+                switch.setState(checked, animate=animate, notify=False)
+
+                changed.append(switch)
+
+        if changed:
+
+            self.statesChanged.emit(changed)
+
+        return changed
+
+    def applyStates(self, values, max_animations=None):
+        '''
+        Bring the group to a complete state vector, animating what changed.
+
+        Only the switches whose status differs from :code:`values` are
+        touched. They travel to their new ends through their usual
+        animation, unless the cap on simultaneous animations is reached,
+        in which case the remaining ones jump there. Signals are
+        suspended and :code:`statesChanged` is emitted once.
+
+        Parameters
+        -----------
+        values : sequence of bool
+
+            One status per switch, in group order, e.g. the bytes of
+            :code:`SlideSwitchStateModel.states()`.
+
+        max_animations : int
+
+            Maximum number of switches of the group animating at once,
+            animations still running included.
+
+            Default = None, i.e., :code:`max_animations` of the group is
+            used.
+
+        Returns
+        -----------
+        dict
+
+            The diff: :code:`changed`, :code:`on` and :code:`off` list
+            the indices of the switches that changed, were turned on and
+            were turned off, :code:`animated` and :code:`snapped` those
+            that animate and those that jumped.
+        '''
+
+        switches = self._switches
+
+        if len(values) != len(switches):
+
+            raise ValueError(
+                'Input argument "values" must have one status'
+                + ' per switch of the group')
+
+        if max_animations is None:
+
+            max_animations = self.max_animations
+
+        changed = []
+
+        for index, checked in enumerate(values):
+
+            if switches[index].isChecked() != bool(checked):
+
+                changed.append(index)
+
+        diff = {
+            'changed': changed,
+            'on': [],
+            'off': [],
+            'animated': [],
+            'snapped': [],
+        }
+
+        if not changed:
+
+            return diff
+
+        budget = max_animations - sum(
+            1 for switch in switches if switch.isAnimating())
+
+        changed_switches = []
+
+        for index in changed:
+
+            switch = switches[index]
+
+            checked = bool(values[index])
+
+            animate = budget > 0
+
+            switch.setState(checked, animate=animate, notify=False)
+
+            if animate and switch.isAnimating():
+
+                budget -= 1
+
+                diff['animated'].append(index)
+
+            else:
+
+                diff['snapped'].append(index)
+
+            diff['on' if checked else 'off'].append(index)
+
+            changed_switches.append(switch)
+
+        self.statesChanged.emit(changed_switches)
+
+        return diff
+
+    def setAll(self, checked, animate=False):
+        '''
+        Set every switch of the group to :code:`checked`.
+        '''
+
+        return self.setStates([checked] * len(self._switches),
+                              animate=animate)
@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+'''
+Opt-in paint and animation instrumentation for slide switches.
+
+When enabled, :code:`SlideSwitchMetrics` counts paints and records paint
+durations in a histogram, tracks animation starts, completions and
+interruptions and counts thumb offset updates, per switch and in
+aggregate. Snapshots are available from Python, are emitted periodically
+through the :code:`updated` signal and can be dumped in the Prometheus
+text format to a local file for a monitoring agent to scrape.
+
+Instrumentation is installed by replacing a few :code:`SlideSwitch`
+methods with instrumented wrappers and removed by restoring the
+originals, so while it is disabled slide switches run exactly the
+uninstrumented code.
+'''
+
+import os
+import time
+import weakref
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from slideSwitch import SlideSwitch
+
+# upper bounds of the paint duration histogram buckets, in seconds
+PAINT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001,
+    0.0025, 0.005, 0.01, 0.025, 0.05, float('inf'),
+)
+
+
+class SlideSwitchCounters(object):
+    '''
+    Counters of one switch, or of all of them.
+    '''
+
+    __slots__ = (
+        'paints', 'paint_seconds', 'paint_buckets',
+        'anim_starts', 'anim_completions', 'anim_interruptions',
+        'offset_updates', '_anim_target',
+    )
+
+    def __init__(self):
+
+        self.paints = 0
+
+        self.paint_seconds = 0.0
+
+        # non-cumulative counts, one per entry of PAINT_BUCKETS
+        self.paint_buckets = [0] * len(PAINT_BUCKETS)
+
+        self.anim_starts = 0
+
+        self.anim_completions = 0
+
+        self.anim_interruptions = 0
+
+        self.offset_updates = 0
+
+        # end offset of the animation in flight, None if there is none
+        self._anim_target = None
+
+    def recordPaint(self, seconds):
+
+        self.paints += 1
+
+        self.paint_seconds += seconds
+
+        for i, bound in enumerate(PAINT_BUCKETS):
+
+            if seconds <= bound:
+
+                self.paint_buckets[i] += 1
+
+                break
+
+    def asDict(self):
+
+        return {
+            'paints': self.paints,
+            'paint_seconds': self.paint_seconds,
+            'paint_buckets': list(zip(PAINT_BUCKETS, self.paint_buckets)),
+            'anim_starts': self.anim_starts,
+            'anim_completions': self.anim_completions,
+            'anim_interruptions': self.anim_interruptions,
+            'offset_updates': self.offset_updates,
+        }
+
+
+class SlideSwitchMetrics(QObject):
+    '''
+    Collects :code:`SlideSwitchCounters` for every slide switch while
+    enabled. Use the application wide :code:`instance()`.
+    '''
+
+    # aggregate snapshot, see aggregate(); emitted every interval
+    updated = pyqtSignal(dict)
+
+    _instance = None
+
+    def __init__(self, parent=None):
+
+        super(SlideSwitchMetrics, self).__init__(parent)
+
+        self._enabled = False
+
+        self._originals = {}
+
+        self._switches = weakref.WeakKeyDictionary()
+
+        self._total = SlideSwitchCounters()
+
+        self._prometheus_path = None
+
+        self._last_dump = None
+
+        self._last_offset_updates = 0
+
+        self._offset_rate = 0.0
+
+        self._timer = QTimer(self)
+
+        self._timer.timeout.connect(self._periodic)
+
+    @classmethod
+    def instance(cls):
+
+        if cls._instance is None:
+
+            cls._instance = cls()
+
+        return cls._instance
+
+    def isEnabled(self):
+
+        return self._enabled
+
+    def enable(self, interval=1000, prometheus_path=None):
+        '''
+        Start collecting.
+
+        Parameters
+        -----------
+        interval : int
+
+            Time between two :code:`updated` emissions (and Prometheus
+            dumps), in milliseconds. 0 disables the periodic part.
+
+            Default = 1000
+
+        prometheus_path : str
+
+            File the aggregate counters are written to, in the Prometheus
+            text format, every interval. The file is replaced atomically.
+
+            Default = None, i.e., nothing is written.
+        '''
+
+        self._prometheus_path = prometheus_path
+
+        if not self._enabled:
+
+            self._install()
+
+            self._enabled = True
+
+        self._last_dump = time.time()
+
+        self._last_offset_updates = self._total.offset_updates
+
+        if interval > 0:
+
+            self._timer.start(interval)
+
+        else:
+
+            self._timer.stop()
+
+    def disable(self):
+        '''
+        Stop collecting and restore the uninstrumented methods. The
+        counters collected so far are kept.
+        '''
+
+        self._timer.stop()
+
+        if self._enabled:
+
+            self._uninstall()
+
+            self._enabled = False
+
+    def reset(self):
+
+        self._switches = weakref.WeakKeyDictionary()
+
+        self._total = SlideSwitchCounters()
+
+        self._last_offset_updates = 0
+
+        self._offset_rate = 0.0
+
+    def switchCounters(self, switch):
+        '''
+        Counters of :code:`switch` as a dict (all zero if it was never
+        seen).
+        '''
+
+        counters = self._switches.get(switch)
+
+        if counters is None:
+
+            counters = SlideSwitchCounters()
+
+        return counters.asDict()
+
+    def aggregate(self):
+        '''
+        Counters summed over every switch as a dict, with the number of
+        switches seen and the offset update rate of the last interval.
+        '''
+
+        snapshot = self._total.asDict()
+
+        snapshot['switches'] = len(self._switches)
+
+        snapshot['offset_updates_per_second'] = self._offset_rate
+
+        return snapshot
+
+    def prometheusText(self):
+        '''
+        The aggregate counters in the Prometheus text exposition format.
+        '''
+
+        total = self._total
+
+        lines = []
+
+        def metric(name, kind, help_text, value):
+
+            lines.append('# HELP {0} {1}'.format(name, help_text))
+
+            lines.append('# TYPE {0} {1}'.format(name, kind))
+
+            lines.append('{0} {1}'.format(name, value))
+
+        metric('slide_switch_instances', 'gauge',
+               'Slide switches seen by the instrumentation.',
+               len(self._switches))
+
+        metric('slide_switch_paints_total', 'counter',
+               'Paint events of slide switches.', total.paints)
+
+        name = 'slide_switch_paint_duration_seconds'
+
+        lines.append('# HELP {0} {1}'.format(
+            name, 'Duration of slide switch paint events.'))
+
+        lines.append('# TYPE {0} histogram'.format(name))
+
+        cumulative = 0
+
+        for bound, count in zip(PAINT_BUCKETS, total.paint_buckets):
+
+            cumulative += count
+
+            le = '+Inf' if bound == float('inf') else repr(bound)
+
+            lines.append('{0}_bucket{{le="{1}"}} {2}'.format(
+                name, le, cumulative))
+
+        lines.append('{0}_sum {1!r}'.format(name, total.paint_seconds))
+
+        lines.append('{0}_count {1}'.format(name, total.paints))
+
+        metric('slide_switch_animation_starts_total', 'counter',
+               'Thumb animations started.', total.anim_starts)
+
+        metric('slide_switch_animation_completions_total', 'counter',
+               'Thumb animations that reached their end.',
+               total.anim_completions)
+
+        metric('slide_switch_animation_interruptions_total', 'counter',
+               'Thumb animations stopped or retargeted before their end.',
+               total.anim_interruptions)
+
+        metric('slide_switch_offset_updates_total', 'counter',
+               'Thumb offset updates.', total.offset_updates)
+
+        metric('slide_switch_offset_updates_per_second', 'gauge',
+               'Thumb offset updates per second over the last interval.',
+               repr(self._offset_rate))
+
+        return '\n'.join(lines) + '\n'
+
+    def dumpPrometheus(self, path):
+        '''
+        Write :code:`prometheusText()` to :code:`path` atomically.
+        '''
+
+        tmp_path = '{0}.tmp{1}'.format(path, os.getpid())
+
+        with open(tmp_path, 'w') as f:
+
+            f.write(self.prometheusText())
+
+        os.replace(tmp_path, path)
+
+    def _counters(self, switch):
+
+        counters = self._switches.get(switch)
+
+        if counters is None:
+
+            counters = self._switches[switch] = SlideSwitchCounters()
+
+        return counters
+
+    def _periodic(self):
+
+        now = time.time()
+
+        elapsed = now - self._last_dump
+
+        if elapsed > 0:
+
+            self._offset_rate = (
+                (self._total.offset_updates - self._last_offset_updates)
+                / elapsed)
+
+        self._last_dump = now
+
+        self._last_offset_updates = self._total.offset_updates
+
+        if self._prometheus_path:
+
+            self.dumpPrometheus(self._prometheus_path)
+
+        self.updated.emit(self.aggregate())
+
+    def _install(self):
+
+        originals = self._originals = {
+            'paintEvent': SlideSwitch.paintEvent,
+            '_setOffset': SlideSwitch._setOffset,
+            '_animateTo': SlideSwitch._animateTo,
+            '_stopAnimation': SlideSwitch._stopAnimation,
+        }
+
+        metrics = self
+
+        clock = time.perf_counter
+
+        def paintEvent(switch, event):
+
+            start = clock()
+
+            originals['paintEvent'](switch, event)
+
+            seconds = clock() - start
+
+            metrics._counters(switch).recordPaint(seconds)
+
+            metrics._total.recordPaint(seconds)
+
+        def _setOffset(switch, value):
+
+            originals['_setOffset'](switch, value)
+
+            counters = metrics._counters(switch)
+
+            total = metrics._total
+
+            counters.offset_updates += 1
+
+            total.offset_updates += 1
+
+            if counters._anim_target is not None \
+                    and value == counters._anim_target:
+
+                counters._anim_target = None
+
+                counters.anim_completions += 1
+
+                total.anim_completions += 1
+
+        def _animateTo(switch, end, duration=None):
+
+            counters = metrics._counters(switch)
+
+            total = metrics._total
+
+            if counters._anim_target is not None:
+
+                counters.anim_interruptions += 1
+
+                total.anim_interruptions += 1
+
+            counters._anim_target = end
+
+            counters.anim_starts += 1
+
+            total.anim_starts += 1
+
+            originals['_animateTo'](switch, end, duration)
+
+        def _stopAnimation(switch):
+
+            counters = metrics._counters(switch)
+
+            total = metrics._total
+
+            if counters._anim_target is not None:
+
+                counters._anim_target = None
+
+                counters.anim_interruptions += 1
+
+                total.anim_interruptions += 1
+
+            originals['_stopAnimation'](switch)
+
+        SlideSwitch.paintEvent = paintEvent
+
+        SlideSwitch._setOffset = _setOffset
+
+        SlideSwitch._animateTo = _animateTo
+
+        SlideSwitch._stopAnimation = _stopAnimation
+
+    def _uninstall(self):
+
+        for name, method in self._originals.items():
+
+            setattr(SlideSwitch, name, method)
+
+        self._originals = {}
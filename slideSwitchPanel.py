@@ -0,0 +1,574 @@
+# -*- coding: utf-8 -*-
+
+'''
+A panel of slide switches whose widgets are created lazily.
+
+Screens with thousands of switches spread over tabs and scroll areas
+spend most of their startup constructing widgets nobody sees yet.
+:code:`SlideSwitchPanel` only records the style, status and constructor
+arguments of each switch. Cells are painted with :code:`SlideSwitchPainter`
+until the real :code:`SlideSwitch` widget is created, which happens right
+after its cell is painted for the first time, i.e. when it first becomes
+visible. Until then :code:`switch()` hands out a :code:`SlideSwitchProxy`
+that keeps the status.
+'''
+
+from functools import partial
+
+from PyQt5.QtCore import QRect, QTimer, pyqtSignal
+
+from slideSwitch import SlideSwitch, SlideSwitchPainter
+from slideSwitchGrid import SlideSwitchGrid
+
+
+class SlideSwitchProxy(object):
+    '''
+    Stand-in for a switch of a :code:`SlideSwitchPanel` whose widget has
+    not been created yet. It forwards to the widget once it exists.
+    '''
+
+    __slots__ = ('panel', 'index')
+
+    def __init__(self, panel, index):
+
+        self.panel = panel
+
+        self.index = index
+
+    def widget(self):
+        '''
+        The :code:`SlideSwitch` of this switch, or None if it has not been
+        created yet.
+        '''
+
+        return self.panel._widgets[self.index]
+
+    def materialize(self):
+        '''
+        Create the widget now and return it.
+        '''
+
+        return self.panel.materialize(self.index)
+
+    def isChecked(self):
+
+        return self.panel.isChecked(self.index)
+
+    def setChecked(self, checked):
+
+        self.panel.setChecked(self.index, checked)
+
+    def setState(self, checked, animate=False, notify=True):
+
+        self.panel.setChecked(self.index, checked, animate, notify)
+
+    def toggle(self):
+
+        self.panel.setChecked(self.index, not self.isChecked())
+
+    def isEnabled(self):
+
+        return self.panel.isSwitchEnabled(self.index)
+
+    def setEnabled(self, enabled):
+
+        self.panel.setSwitchEnabled(self.index, enabled)
+
+
+class SlideSwitchPanel(SlideSwitchGrid):
+    '''
+    Grid of slide switches, created as widgets when first shown.
+
+    Cells are numbered row by row, starting at 0, in the order the
+    switches were added. :code:`toggled(index, checked)` is emitted for
+    every status change, whether the widget exists or not.
+    '''
+
+    toggled = pyqtSignal(int, bool)
+
+    def __init__(self, parent=None, columns=16, style=None,
+                 color_palette=None, cell_size=None, spacing=4):
+        '''
+        Constructor of the SlideSwitchPanel object.
+
+        Parameters
+        -----------
+        parent : QObject
+
+            The parent object for the panel
+
+            Default = None
+
+        columns : int
+
+            Number of switches per row.
+
+            Default = 16
+
+        style : SlideSwitchStyle
+
+            The style of switches added without a style of their own. If
+            not given, a default style is built from :code:`color_palette`.
+
+            Default = None
+
+        color_palette : QPalette
+
+            The colour palette used when :code:`style` is not given. See
+            :code:`SlideSwitch`.
+
+            Default = None, i.e., the inherited palette is used.
+
+        cell_size : QSize
+
+            Size of a single switch. If not given, cells are as large as
+            the largest switch, from the radii and direction of the
+            styles in use, and each switch keeps its own natural size,
+            centred in its cell.
+
+            Default = None
+
+        spacing : int
+
+            Space between neighbouring switches, in pixels.
+
+            Default = 4
+        '''
+
+        super(SlideSwitchPanel, self).__init__(
+            parent=parent, columns=columns, style=style,
+            color_palette=color_palette, cell_size=cell_size,
+            spacing=spacing)
+
+        # per switch: style, font (None for the font of the panel), extra
+        # SlideSwitch arguments (shared dicts), status, enabled status and
+        # widget (None until created)
+        self._styles = []
+
+        self._fonts = []
+
+        self._kwargs = []
+
+        self._enabled = bytearray()
+
+        self._widgets = []
+
+        self._materialized = 0
+
+        # natural cell size for the styles in use, None until computed
+        self._natural_size = None
+
+        # (style, font key) -> painter of the placeholder cells
+        self._switch_painters = {}
+
+        self._pending = set()
+
+        self._materialize_timer = QTimer(self)
+
+        self._materialize_timer.setSingleShot(True)
+
+        self._materialize_timer.timeout.connect(self._materializePending)
+
+    def addSwitch(self, checked=False, enabled=True, style=None, font=None,
+                  **kwargs):
+        '''
+        Record a switch and return its index. No widget is created.
+
+        Parameters
+        -----------
+        checked : bool
+
+            The initial status.
+
+            Default = False
+
+        enabled : bool
+
+            Whether the switch is enabled.
+
+            Default = True
+
+        style : SlideSwitchStyle
+
+            The style of the switch.
+
+            Default = None, i.e., the style of the panel is used.
+
+        font : QFont
+
+            The font of the thumb texts, resolved against the font of the
+            panel.
+
+            Default = None, i.e., the font of the panel is used.
+
+        Any other keyword argument (e.g. :code:`animate_dur` or
+        :code:`pixmap_cache`) is passed to :code:`SlideSwitch` when the
+        widget is created.
+        '''
+
+        return self.addSwitches(
+            1, checked, enabled, style, font, **kwargs)[0]
+
+    def addSwitches(self, count, checked=False, enabled=True, style=None,
+                    font=None, **kwargs):
+        '''
+        Record :code:`count` alike switches at once and return their
+        indices. See :code:`addSwitch()`.
+        '''
+
+        start = len(self._states)
+
+        style = self._style if style is None else style
+
+        self._styles.extend([style] * count)
+
+        if self._natural_size is not None:
+
+            self._natural_size = self._natural_size.expandedTo(
+                style.naturalSize())
+
+        self._fonts.extend([font] * count)
+
+        # one dict shared by the whole batch
+        self._kwargs.extend([kwargs] * count)
+
+        self._states.extend((b'\x01' if checked else b'\x00') * count)
+
+        self._enabled.extend((b'\x01' if enabled else b'\x00') * count)
+
+        self._widgets.extend([None] * count)
+
+        self.updateGeometry()
+
+        self.update()
+
+        return range(start, start + count)
+
+    def setSwitchStyle(self, style):
+        '''
+        Use :code:`style`, a :code:`SlideSwitchStyle`, for every switch,
+        including those added with a style of their own.
+        '''
+
+        self.mapSwitchStyles(lambda old_style: style)
+
+    def setPalette(self, palette):
+        '''
+        Give every switch the colours of :code:`palette`, keeping the
+        other fields of its style.
+        '''
+
+        self.mapSwitchStyles(lambda style: style.withPalette(palette))
+
+    def mapSwitchStyles(self, function):
+        '''
+        Replace the style of the panel and of every switch, created or
+        not, by :code:`function(style)`, called once per distinct style.
+        '''
+
+        styles = {}
+
+        def mapped(style):
+
+            new_style = styles.get(style)
+
+            if new_style is None:
+
+                new_style = styles[style] = function(style)
+
+            return new_style
+
+        self._style = mapped(self._style)
+
+        self._styles = [mapped(style) for style in self._styles]
+
+        self._switch_painters = {}
+
+        self._natural_size = None
+
+        for index, widget in enumerate(self._widgets):
+
+            if widget is not None:
+
+                widget.setSwitchStyle(self._styles[index])
+
+                # the cell size may follow the style
+                widget.setGeometry(self.switchRect(index))
+
+        self.updateGeometry()
+
+        self.update()
+
+    def switchRect(self, index):
+        '''
+        Rectangle of the switch at :code:`index` inside its cell, in
+        panel coordinates.
+        '''
+
+        cell = self.cellRect(index)
+
+        if self._cell_size is not None:
+
+            return cell
+
+        size = self._styles[index].naturalSize()
+
+        return QRect(
+            cell.x() + (cell.width() - size.width()) // 2,
+            cell.y() + (cell.height() - size.height()) // 2,
+            size.width(),
+            size.height(),
+        )
+
+    def switch(self, index):
+        '''
+        The :code:`SlideSwitch` at :code:`index` if it has been created,
+        otherwise a :code:`SlideSwitchProxy` for it.
+        '''
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            return widget
+
+        return SlideSwitchProxy(self, index)
+
+    def isMaterialized(self, index):
+
+        return self._widgets[index] is not None
+
+    def materializedCount(self):
+
+        return self._materialized
+
+    def materialize(self, index):
+        '''
+        Create the widget of the switch at :code:`index` if needed and
+        return it.
+        '''
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            return widget
+
+        widget = SlideSwitch(self, style=self._styles[index],
+                             **self._kwargs[index])
+
+        font = self._fonts[index]
+
+        if font is not None:
+
+            widget.setFont(font)
+
+        widget.setGeometry(self.switchRect(index))
+
+        widget.setState(bool(self._states[index]), notify=False)
+
+        widget.setEnabled(bool(self._enabled[index]))
+
+        widget.toggled.connect(partial(self._widgetToggled, index))
+
+        self._widgets[index] = widget
+
+        self._materialized += 1
+
+        self._pending.discard(index)
+
+        widget.show()
+
+        return widget
+
+    def materializeAll(self):
+
+        for index in range(len(self._states)):
+
+            self.materialize(index)
+
+    def isChecked(self, index):
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            return widget.isChecked()
+
+        return bool(self._states[index])
+
+    def setChecked(self, index, checked, animate=False, notify=True):
+        '''
+        Set the status of the switch at :code:`index`, created or not.
+        Emits :code:`toggled` if the status changes and :code:`notify`
+        is True.
+        '''
+
+        checked = bool(checked)
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            widget.setState(checked, animate=animate, notify=notify)
+
+            return
+
+        if bool(self._states[index]) == checked:
+
+            return
+
+        self._states[index] = checked
+
+        self.update(self.cellRect(index))
+
+        if notify:
+
+            self.toggled.emit(index, checked)
+
+    def isSwitchEnabled(self, index):
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            return widget.isEnabled()
+
+        return bool(self._enabled[index]) and self.isEnabled()
+
+    def setSwitchEnabled(self, index, enabled):
+
+        self._enabled[index] = bool(enabled)
+
+        widget = self._widgets[index]
+
+        if widget is not None:
+
+            widget.setEnabled(enabled)
+
+        else:
+
+            self.update(self.cellRect(index))
+
+    def states(self):
+        '''
+        Statuses of all the switches, one byte (0 or 1) per switch.
+        '''
+
+        for index, widget in enumerate(self._widgets):
+
+            if widget is not None:
+
+                self._states[index] = widget.isChecked()
+
+        return bytes(self._states)
+
+    def _widgetToggled(self, index, checked):
+
+        self._states[index] = checked
+
+        self.toggled.emit(index, checked)
+
+    def _naturalCellSize(self):
+
+        size = self._natural_size
+
+        if size is None:
+
+            # the panel style sizes the cells of an empty panel
+            size = self._style.naturalSize()
+
+            for style in set(self._styles):
+
+                size = size.expandedTo(style.naturalSize())
+
+            self._natural_size = size
+
+        return size
+
+    def _switchPainter(self, style, font=None):
+
+        key = (style, None if font is None else font.key())
+
+        painter = self._switch_painters.get(key)
+
+        if painter is None:
+
+            if self._cell_size is not None:
+
+                size = self._cell_size
+
+            else:
+
+                size = style.naturalSize()
+
+            # the font the widget will have: its own resolved against ours
+            font = self.font() if font is None else font.resolve(self.font())
+
+            painter = self._switch_painters[key] = SlideSwitchPainter(
+                style, size.width(), size.height(),
+                font=font, palette=self.palette(), pixmap_cache=True)
+
+        return painter
+
+    def _materializePending(self):
+
+        pending = sorted(self._pending)
+
+        self._pending.clear()
+
+        for index in pending:
+
+            self.materialize(index)
+
+    def changeEvent(self, event):
+
+        super(SlideSwitchPanel, self).changeEvent(event)
+
+        self._switch_painters = {}
+
+    def paintEvent(self, event):
+
+        super(SlideSwitchPanel, self).paintEvent(event)
+
+        if self._pending and not self._materialize_timer.isActive():
+
+            self._materialize_timer.start(0)
+
+    def _cellPainter(self, enabled, dpr, exposed):
+
+        styles = self._styles
+
+        fonts = self._fonts
+
+        states = self._states
+
+        switch_enabled = self._enabled
+
+        widgets = self._widgets
+
+        pending = self._pending
+
+        cell = self.cellSize()
+
+        def paintCell(p, index, x, y):
+
+            if widgets[index] is not None:
+
+                return
+
+            # drawn like the widget until the widget is created, at the
+            # place switchRect() gives it
+            painter = self._switchPainter(styles[index], fonts[index])
+
+            checked = states[index]
+
+            painter.paint(
+                p, x + (cell.width() - painter.width) // 2,
+                y + (cell.height() - painter.height) // 2,
+                painter.geometry.travel[checked], checked,
+                enabled and switch_enabled[index], dpr)
+
+            pending.add(index)
+
+        return paintCell
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+
+'''
+Headless rendering of slide switch appearances.
+
+Documentation screenshots and dashboard thumbnails only need pictures of
+switches, not widgets. The functions here draw switches straight into
+:code:`QImage` objects with :code:`SlideSwitchPainter`, so nothing is
+constructed or shown, and pack the pictures into sprite sheets. Large
+batches can be spread over several processes.
+
+A switch is described by a spec, a sequence of up to five items::
+
+    (style, checked, enabled, text, size)
+
+:code:`style` is a :code:`SlideSwitchStyle`. :code:`checked` and
+:code:`enabled` default to False and True. :code:`text`, if not None,
+replaces the thumb text of the style for the rendered status.
+:code:`size` is a :code:`QSize` or a :code:`(width, height)` tuple and
+defaults to :code:`style.naturalSize()`.
+
+If no :code:`QGuiApplication` exists, one is created on the
+:code:`offscreen` platform (unless :code:`QT_QPA_PLATFORM` says
+otherwise).
+'''
+
+import multiprocessing
+import os
+import sys
+
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter
+from PyQt5.QtGui import QPalette
+
+from slideSwitch import SlideSwitchPainter
+
+# application created by _ensureApplication(), kept alive for the process
+_application = None
+
+
+def _ensureApplication():
+
+    global _application
+
+    if QGuiApplication.instance() is None:
+
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+        _application = QGuiApplication([sys.argv[0] if sys.argv else ''])
+
+
+def _normalizeSpec(spec):
+    '''
+    Return :code:`(style, checked, enabled, text, size)` for :code:`spec`,
+    with the defaults filled in and :code:`size` as a :code:`QSize`.
+    '''
+
+    spec = tuple(spec)
+
+    if not 1 <= len(spec) <= 5:
+
+        raise ValueError(
+            'Input argument "spec"'
+            + ' must have between 1 and 5 items')
+
+    style, checked, enabled, text, size = \
+        spec + (False, True, None, None)[len(spec) - 1:]
+
+    if size is None:
+
+        size = style.naturalSize()
+
+    elif not isinstance(size, QSize):
+
+        size = QSize(*size)
+
+    return style, bool(checked), bool(enabled), text, size
+
+
+def renderSwitch(spec, dpr=1.0, font=None, palette=None,
+                 background=Qt.transparent):
+    '''
+    Render one switch into a new :code:`QImage`.
+
+    Parameters
+    -----------
+    spec : sequence
+
+        :code:`(style, checked, enabled, text, size)`, see the module
+        documentation.
+
+    dpr : float
+
+        Device pixel ratio of the image. The image is
+        :code:`size * dpr` pixels large.
+
+        Default = 1.0
+
+    font : QFont
+
+        Font the thumb text is derived from.
+
+        Default = None, i.e., the application font is used.
+
+    palette : QPalette
+
+        Palette providing the colours of disabled switches.
+
+        Default = None, i.e., the application palette is used.
+
+    background : QColor or Qt.GlobalColor
+
+        Colour the image is filled with before painting.
+
+        Default = Qt.transparent
+    '''
+
+    _ensureApplication()
+
+    style, checked, enabled, text, size = _normalizeSpec(spec)
+
+    if text is not None:
+
+        texts = list(style.thumb_texts)
+
+        texts[checked] = text
+
+        style = style.replace(thumb_texts=tuple(texts))
+
+    painter = SlideSwitchPainter(
+        style, size.width(), size.height(), font=font, palette=palette)
+
+    image = QImage(
+        max(1, int(round(size.width() * dpr))),
+        max(1, int(round(size.height() * dpr))),
+        QImage.Format_ARGB32_Premultiplied)
+
+    image.setDevicePixelRatio(dpr)
+
+    image.fill(background)
+
+    p = QPainter(image)
+
+    painter.paint(p, 0, 0, painter.geometry.travel[checked],
+                  checked, enabled, dpr)
+
+    p.end()
+
+    return image
+
+
+def renderSwitches(specs, dpr=1.0, font=None, palette=None,
+                   background=Qt.transparent, processes=1):
+    '''
+    Render every spec of :code:`specs`, see :code:`renderSwitch()`, and
+    return the images in the same order.
+
+    Parameters
+    -----------
+    processes : int
+
+        Number of worker processes. 1 renders in the calling process;
+        None uses one process per CPU core. Workers are started with the
+        :code:`spawn` method, so scripts using them must guard their
+        entry point with :code:`if __name__ == '__main__':`.
+
+        Default = 1
+
+    The other arguments are those of :code:`renderSwitch()`.
+    '''
+
+    specs = list(specs)
+
+    if processes is None:
+
+        processes = os.cpu_count() or 1
+
+    if processes < 1:
+
+        raise ValueError(
+            'Input argument "processes"'
+            + ' must be None or a positive integer')
+
+    if processes == 1 or len(specs) < 2:
+
+        return [renderSwitch(spec, dpr, font, palette, background)
+                for spec in specs]
+
+    _ensureApplication()
+
+    font = QFont() if font is None else font
+
+    palette = QGuiApplication.palette() if palette is None else palette
+
+    # QFont and QPalette do not pickle, so workers rebuild them from the
+    # font description and the two colours the painter reads
+    settings = (
+        dpr,
+        font.toString(),
+        palette.shadow().color().rgba(),
+        palette.mid().color().rgba(),
+        QColor(background).rgba(),
+    )
+
+    # a few chunks per process keep the workers busy until the end
+    chunk_size = max(1, -(-len(specs) // (processes * 4)))
+
+    chunks = [(settings, specs[i:i + chunk_size])
+              for i in range(0, len(specs), chunk_size)]
+
+    pool = multiprocessing.get_context('spawn').Pool(
+        min(processes, len(chunks)))
+
+    try:
+
+        results = pool.map(_renderChunk, chunks)
+
+    finally:
+
+        pool.close()
+
+        pool.join()
+
+    images = []
+
+    for chunk in results:
+
+        for width, height, data in chunk:
+
+            image = QImage(data, width, height, 4 * width,
+                           QImage.Format_ARGB32_Premultiplied).copy()
+
+            image.setDevicePixelRatio(dpr)
+
+            images.append(image)
+
+    return images
+
+
+def _renderChunk(args):
+    '''
+    Worker of :code:`renderSwitches()`: render a chunk of specs and return
+    the raw pixels of each image.
+    '''
+
+    (dpr, font_description, shadow, mid, background), specs = args
+
+    _ensureApplication()
+
+    font = QFont()
+
+    font.fromString(font_description)
+
+    palette = QPalette(QGuiApplication.palette())
+
+    palette.setColor(QPalette.Shadow, QColor.fromRgba(shadow))
+
+    palette.setColor(QPalette.Mid, QColor.fromRgba(mid))
+
+    background = QColor.fromRgba(background)
+
+    results = []
+
+    for spec in specs:
+
+        image = renderSwitch(spec, dpr, font, palette, background)
+
+        # scanlines of ARGB32 images are 4 * width bytes, without padding
+        results.append((image.width(), image.height(),
+                        bytes(image.constBits().asstring(image.byteCount()))))
+
+    return results
+
+
+def packSpriteSheets(images, max_width=2048, max_height=2048, spacing=0,
+                     background=Qt.transparent):
+    '''
+    Pack :code:`images` into as few sprite sheets as needed.
+
+    Images are placed left to right in rows (shelves) as tall as their
+    tallest image; a new sheet is started when a sheet is full. Images
+    larger than a sheet get a sheet of their own.
+
+    Parameters
+    -----------
+    images : sequence of QImage
+
+        The images to pack, e.g. from :code:`renderSwitches()`. Sizes are
+        taken in pixels, regardless of the device pixel ratio.
+
+    max_width : int
+
+        Maximum width of a sheet, in pixels.
+
+        Default = 2048
+
+    max_height : int
+
+        Maximum height of a sheet, in pixels.
+
+        Default = 2048
+
+    spacing : int
+
+        Space between neighbouring images, in pixels.
+
+        Default = 0
+
+    background : QColor or Qt.GlobalColor
+
+        Colour of the parts of the sheets not covered by images.
+
+        Default = Qt.transparent
+
+    Returns :code:`(sheets, placements)`, where :code:`sheets` is a list
+    of :code:`QImage` and :code:`placements[i]` is the
+    :code:`(sheet index, QRect)` of :code:`images[i]`.
+    '''
+
+    placements = []
+
+    # (width, height) of each sheet
+    extents = []
+
+    x = y = shelf_height = 0
+
+    # whether the current sheet holds an image larger than a sheet
+    full = False
+
+    for image in images:
+
+        width = image.width()
+
+        height = image.height()
+
+        oversized = width > max_width or height > max_height
+
+        if extents and x > 0 and x + width > max_width:
+
+            # next shelf
+            x = 0
+
+            y += shelf_height + spacing
+
+            shelf_height = 0
+
+        occupied = x > 0 or y > 0
+
+        if (not extents or full
+                or (occupied and (oversized or y + height > max_height))):
+
+            extents.append([0, 0])
+
+            x = y = shelf_height = 0
+
+        full = oversized
+
+        extent = extents[-1]
+
+        placements.append((len(extents) - 1, QRect(x, y, width, height)))
+
+        extent[0] = max(extent[0], x + width)
+
+        extent[1] = max(extent[1], y + height)
+
+        shelf_height = max(shelf_height, height)
+
+        x += width + spacing
+
+    sheets = []
+
+    for width, height in extents:
+
+        sheet = QImage(max(1, width), max(1, height),
+                       QImage.Format_ARGB32_Premultiplied)
+
+        sheet.fill(background)
+
+        sheets.append(sheet)
+
+    painters = [QPainter(sheet) for sheet in sheets]
+
+    for image, (index, rect) in zip(images, placements):
+
+        # draw pixel for pixel, ignoring the device pixel ratio
+        source = QImage(image)
+
+        source.setDevicePixelRatio(1.0)
+
+        painters[index].drawImage(rect.topLeft(), source)
+
+    for p in painters:
+
+        p.end()
+
+    return sheets, placements
+
+
+def renderSpriteSheets(specs, path_pattern=None, max_width=2048,
+                       max_height=2048, spacing=0, dpr=1.0, font=None,
+                       palette=None, background=Qt.transparent,
+                       processes=1):
+    '''
+    Render :code:`specs` and pack them into sprite sheets, see
+    :code:`renderSwitches()` and :code:`packSpriteSheets()`.
+
+    If :code:`path_pattern` is given, e.g. :code:`'switches_{0}.png'`,
+    sheet :code:`i` is saved to :code:`path_pattern.format(i)`.
+
+    Returns :code:`(sheets, placements)` like :code:`packSpriteSheets()`.
+    '''
+
+    images = renderSwitches(specs, dpr, font, palette,
+                            Qt.transparent, processes)
+
+    sheets, placements = packSpriteSheets(
+        images, max_width, max_height, spacing, background)
+
+    if path_pattern is not None:
+
+        for i, sheet in enumerate(sheets):
+
+            if not sheet.save(path_pattern.format(i)):
+
+                raise IOError(
+                    'Cannot save sprite sheet to '
+                    + path_pattern.format(i))
+
+    return sheets, placements
@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+
+'''
+Compact binary snapshots of switch states.
+
+A snapshot file holds, after a fixed header, the ids of the switches and
+two packed bitsets (checked and enabled, one bit per switch)::
+
+    offset  size  content
+    0       4     magic b'SSWS'
+    4       2     format version (little endian)
+    6       2     reserved, 0
+    8       4     number of switches n
+    12      4     length of the id block in bytes
+    16      ...   ids, UTF-8, separated by newlines
+    ...     n/8   checked bits, bit i of byte i // 8 is switch i
+    ...     n/8   enabled bits, same layout
+
+Files are written to a temporary file next to the target and moved into
+place with :code:`os.replace`, so readers never see a partial snapshot.
+:code:`SlideSwitchSnapshot` memory-maps a file read-only; a process
+holding a mapping keeps seeing the snapshot it opened even when another
+process replaces the file, and :code:`reload()` switches to the new one.
+'''
+
+import mmap
+import os
+import struct
+import tempfile
+
+MAGIC = b'SSWS'
+
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHHII')
+
+# maps 0/1 bytes to '0'/'1' characters and back
+_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+_FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def packBits(flags):
+    '''
+    Pack a sequence of 0/1 bytes (or booleans) into a bitset, bit i of
+    byte i // 8 being flag i.
+    '''
+
+    if not isinstance(flags, (bytes, bytearray)) \
+            or flags.translate(None, b'\x00\x01'):
+
+        flags = bytearray(1 if flag else 0 for flag in flags)
+
+    if not flags:
+
+        return b''
+
+    size = (len(flags) + 7) // 8
+
+    return int(flags.translate(_TO_DIGITS)[::-1], 2).to_bytes(size, 'little')
+
+
+def unpackBits(bits, count):
+    '''
+    Inverse of :code:`packBits()`: :code:`count` 0/1 bytes.
+    '''
+
+    if not count:
+
+        return b''
+
+    digits = format(int.from_bytes(bits, 'little'), '0{0}b'.format(
+        8 * len(bits)))[::-1][:count]
+
+    return digits.encode('ascii').translate(_FROM_DIGITS)
+
+
+def _createTemporary(path):
+    '''
+    Create and open a new file next to :code:`path` for writing. Unlike
+    :code:`tempfile.mkstemp`, which makes it readable by its owner only,
+    the file gets the mode :code:`open()` would give it, i.e. 0o666
+    minus the umask, applied by the system. Returns (fd, path).
+    '''
+
+    directory = os.path.dirname(os.path.abspath(path))
+
+    prefix = '.' + os.path.basename(path) + '.'
+
+    flags = (os.O_WRONLY | os.O_CREAT | os.O_EXCL
+             | getattr(os, 'O_BINARY', 0))
+
+    for _ in range(tempfile.TMP_MAX):
+
+        tmp_path = os.path.join(directory, prefix + os.urandom(6).hex())
+
+        try:
+
+            return os.open(tmp_path, flags, 0o666), tmp_path
+
+        except FileExistsError:
+
+            continue
+
+    raise FileExistsError('No usable temporary file name for ' + path)
+
+
+def writeSnapshot(path, ids, checked, enabled=None):
+    '''
+    Atomically write a snapshot.
+
+    Parameters
+    -----------
+    path : str
+
+        The snapshot file.
+
+    ids : sequence of str
+
+        One unique id per switch, without newlines.
+
+    checked : sequence of bool or bytes
+
+        One status per switch, e.g. :code:`SlideSwitchBank.states()`.
+
+    enabled : sequence of bool or bytes
+
+        One enabled status per switch.
+
+        Default = None, i.e., every switch is enabled.
+    '''
+
+    ids = list(ids)
+
+    count = len(ids)
+
+    if enabled is None:
+
+        enabled = b'\x01' * count
+
+    if len(checked) != count or len(enabled) != count:
+
+        raise ValueError(
+            'Input arguments "checked" and "enabled"'
+            + ' must have one status per id')
+
+    id_block = '\n'.join(ids).encode('utf-8')
+
+    if (len(set(ids)) != count
+            or (count and id_block.count(b'\n') != count - 1)):
+
+        raise ValueError(
+            'Input argument "ids"'
+            + ' must be unique and must not contain newlines')
+
+    fd, tmp_path = _createTemporary(path)
+
+    try:
+
+        with os.fdopen(fd, 'wb') as f:
+
+            # a replaced snapshot keeps its mode
+            try:
+
+                mode = os.stat(path).st_mode & 0o7777
+
+            except OSError:
+
+                mode = None
+
+            if mode is not None:
+
+                if hasattr(os, 'fchmod'):
+
+                    os.fchmod(f.fileno(), mode)
+
+                else:
+
+                    os.chmod(tmp_path, mode)
+
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, count, len(id_block)))
+
+            f.write(id_block)
+
+            f.write(packBits(checked))
+
+            f.write(packBits(enabled))
+
+            f.flush()
+
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+
+    except BaseException:
+
+        if os.path.exists(tmp_path):
+
+            os.remove(tmp_path)
+
+        raise
+
+
+def snapshotGroup(path, group, ids=None):
+    '''
+    Write the statuses of the switches of a :code:`SlideSwitchGroup`.
+    Switches are identified by :code:`ids` or, if not given, by their
+    object names (their index in the group for unnamed switches).
+    '''
+
+    switches = group.switches()
+
+    if ids is None:
+
+        ids = [switch.objectName() or str(index)
+               for index, switch in enumerate(switches)]
+
+    writeSnapshot(
+        path, ids,
+        [switch.isChecked() for switch in switches],
+        [switch.isEnabled() for switch in switches])
+
+
+class SlideSwitchSnapshot(object):
+    '''
+    A memory-mapped, read-only snapshot file.
+    '''
+
+    def __init__(self, path):
+        '''
+        Constructor of the SlideSwitchSnapshot object.
+
+        Parameters
+        -----------
+        path : str
+
+            The snapshot file, as written by :code:`writeSnapshot()`.
+        '''
+
+        self.path = path
+
+        self._file = None
+
+        self._map = None
+
+        self.reload()
+
+    def reload(self):
+        '''
+        Map the current file at :code:`path`, e.g. after another process
+        has replaced it.
+        '''
+
+        self.close()
+
+        try:
+
+            self._open()
+
+        except BaseException:
+
+            self.close()
+
+            raise
+
+    def _open(self):
+
+        self._file = open(self.path, 'rb')
+
+        if not os.fstat(self._file.fileno()).st_size:
+
+            # an empty file cannot be mapped
+            raise ValueError('Not a slide switch snapshot: ' + self.path)
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = self._map
+
+        if len(data) < _HEADER.size:
+
+            raise ValueError('Not a slide switch snapshot: ' + self.path)
+
+        magic, version, _, count, id_length = _HEADER.unpack_from(data, 0)
+
+        if magic != MAGIC:
+
+            raise ValueError('Not a slide switch snapshot: ' + self.path)
+
+        if version != VERSION:
+
+            raise ValueError(
+                'Unsupported snapshot version {0}: {1}'.format(
+                    version, self.path))
+
+        self.count = count
+
+        bit_length = (count + 7) // 8
+
+        self._ids_at = _HEADER.size
+
+        self._checked_at = self._ids_at + id_length
+
+        self._enabled_at = self._checked_at + bit_length
+
+        if len(data) < self._enabled_at + bit_length:
+
+            raise ValueError('Truncated slide switch snapshot: ' + self.path)
+
+        self._ids = None
+
+        self._index = None
+
+    def close(self):
+
+        if self._map is not None:
+
+            self._map.close()
+
+            self._map = None
+
+        if self._file is not None:
+
+            self._file.close()
+
+            self._file = None
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+    def __len__(self):
+
+        return self.count
+
+    def ids(self):
+
+        if self._ids is None:
+
+            block = self._map[self._ids_at:self._checked_at]
+
+            self._ids = block.decode('utf-8').split('\n') \
+                if self.count else []
+
+        return self._ids
+
+    def indexOf(self, switch_id):
+        '''
+        Index of :code:`switch_id` in the snapshot, or -1.
+        '''
+
+        if self._index is None:
+
+            self._index = dict(
+                (switch_id, index) for index, switch_id in
+                enumerate(self.ids()))
+
+        return self._index.get(switch_id, -1)
+
+    def isChecked(self, index):
+
+        return self._bit(self._checked_at, index)
+
+    def isEnabled(self, index):
+
+        return self._bit(self._enabled_at, index)
+
+    def _bit(self, offset, index):
+
+        if not 0 <= index < self.count:
+
+            raise IndexError('Snapshot index out of range')
+
+        return bool(self._map[offset + (index >> 3)] >> (index & 7) & 1)
+
+    def states(self):
+        '''
+        Checked statuses, one byte (0 or 1) per switch.
+        '''
+
+        bit_length = (self.count + 7) // 8
+
+        return unpackBits(
+            self._map[self._checked_at:self._checked_at + bit_length],
+            self.count)
+
+    def enabledStates(self):
+        '''
+        Enabled statuses, one byte (0 or 1) per switch.
+        '''
+
+        bit_length = (self.count + 7) // 8
+
+        return unpackBits(
+            self._map[self._enabled_at:self._enabled_at + bit_length],
+            self.count)
+
+    def restoreGroup(self, group, ids=None):
+        '''
+        Apply the snapshot to a :code:`SlideSwitchGroup` without
+        animations and with a single :code:`statesChanged` notification.
+        Switches are matched by :code:`ids` (or object names, as in
+        :code:`snapshotGroup()`); switches missing from the snapshot are
+        left alone.
+
+        Returns the switches whose checked status changed.
+        '''
+
+        switches = group.switches()
+
+        if ids is None:
+
+            ids = [switch.objectName() or str(index)
+                   for index, switch in enumerate(switches)]
+
+        states = self.states()
+
+        enabled_states = self.enabledStates()
+
+        values = {}
+
+        for index, switch_id in enumerate(ids):
+
+            position = self.indexOf(switch_id)
+
+            if position < 0:
+
+                continue
+
+            values[index] = states[position]
+
+            enabled = bool(enabled_states[position])
+
+            switch = switches[index]
+
+            if switch.isEnabled() != enabled:
+
+                switch.setEnabled(enabled)
+
+        return group.setStates(values, animate=False)
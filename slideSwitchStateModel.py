@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+'''
+Switch states kept in one compact array.
+
+The status of a :code:`SlideSwitch` lives in the checked flag of its
+button, so operations over many switches (invert all, apply a mask, count
+the switches that are on) are Python loops over widgets.
+:code:`SlideSwitchStateModel` keeps the statuses in a :code:`bytearray`,
+one byte (0 or 1) per entry, and runs such operations over the whole
+array at once, through NumPy when it is installed and through big integer
+arithmetic otherwise. Switches and :code:`SlideSwitchBank` cells bound to
+entries act as views: they show the status of their entry, write clicks
+back to it and are only touched when their entry changes.
+'''
+
+from bisect import bisect_left
+from functools import partial
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+
+class SlideSwitchStateModel(QObject):
+    '''
+    Fixed-size array of switch statuses with bound views.
+
+    Operations changing statuses return the sorted indices of the entries
+    that changed (a NumPy array when NumPy is used, else a list) and emit
+    :code:`statesChanged` once with the same indices, unless nothing
+    changed.
+    '''
+
+    # indices of the entries whose status changed
+    statesChanged = pyqtSignal(object)
+
+    def __init__(self, count, parent=None, use_numpy=None):
+        '''
+        Constructor of the SlideSwitchStateModel object.
+
+        Parameters
+        -----------
+        count : int
+
+            Number of entries. All are off at first.
+
+        parent : QObject
+
+            The parent object for the model
+
+            Default = None
+
+        use_numpy : bool
+
+            Whether to run the operations through NumPy.
+
+            Default = None, i.e., NumPy is used if it can be imported.
+        '''
+
+        super(SlideSwitchStateModel, self).__init__(parent)
+
+        if use_numpy is None:
+
+            use_numpy = numpy is not None
+
+        elif use_numpy and numpy is None:
+
+            raise ValueError(
+                'Input argument "use_numpy"'
+                + ' cannot be True, NumPy is not installed')
+
+        self._states = bytearray(count)
+
+        # a writable NumPy view sharing the memory of the bytearray
+        self._array = numpy.frombuffer(self._states, dtype=numpy.uint8) \
+            if use_numpy else None
+
+        self._ones = None
+
+        # index -> (SlideSwitch, slot connected to its toggled signal)
+        self._views = {}
+
+        # (start, stop, bank, slot) for each bound SlideSwitchBank
+        self._banks = []
+
+    def __len__(self):
+
+        return len(self._states)
+
+    def size(self):
+
+        return len(self._states)
+
+    def isChecked(self, index):
+
+        return bool(self._states[index])
+
+    def setChecked(self, index, checked, animate=False):
+
+        checked = bool(checked)
+
+        if bool(self._states[index]) == checked:
+
+            return []
+
+        self._states[index] = checked
+
+        changed = [index]
+
+        self._updateViews(changed, animate)
+
+        self.statesChanged.emit(changed)
+
+        return changed
+
+    def states(self):
+        '''
+        Copy of all the statuses, one byte (0 or 1) per entry.
+        '''
+
+        return bytes(self._states)
+
+    def setStates(self, values, animate=False):
+        '''
+        Replace all the statuses by :code:`values`, one status per entry.
+        '''
+
+        return self._replace(self._flags(values), animate)
+
+    def setMask(self, mask, checked=True, animate=False):
+        '''
+        Set the entries selected by :code:`mask` (one flag per entry) to
+        :code:`checked`; the other entries keep their status.
+        '''
+
+        mask = self._flags(mask)
+
+        if self._array is not None:
+
+            mask = numpy.frombuffer(mask, dtype=numpy.uint8)
+
+            if checked:
+
+                new = self._array | mask
+
+            else:
+
+                new = self._array & (mask ^ 1)
+
+            return self._replace(new, animate)
+
+        old = int.from_bytes(self._states, 'big')
+
+        mask = int.from_bytes(mask, 'big')
+
+        if checked:
+
+            new = old | mask
+
+        else:
+
+            new = old & (mask ^ self._onesInt())
+
+        return self._replace(new.to_bytes(len(self._states), 'big'), animate)
+
+    def invert(self, mask=None, animate=False):
+        '''
+        Invert every status, or the statuses selected by :code:`mask`.
+        '''
+
+        if mask is None:
+
+            mask = b'\x01' * len(self._states)
+
+        else:
+
+            mask = self._flags(mask)
+
+        if self._array is not None:
+
+            return self._replace(
+                self._array ^ numpy.frombuffer(mask, dtype=numpy.uint8),
+                animate)
+
+        new = int.from_bytes(self._states, 'big') ^ int.from_bytes(mask, 'big')
+
+        return self._replace(new.to_bytes(len(self._states), 'big'), animate)
+
+    def count(self, checked=True):
+        '''
+        Number of entries whose status is :code:`checked`.
+        '''
+
+        on = self._states.count(1)
+
+        return on if checked else len(self._states) - on
+
+    def where(self, checked=True):
+        '''
+        Sorted indices of the entries whose status is :code:`checked`.
+        '''
+
+        if self._array is not None:
+
+            return numpy.flatnonzero(self._array == (1 if checked else 0))
+
+        return self._find(self._states, 1 if checked else 0)
+
+    def diff(self, values):
+        '''
+        Sorted indices of the entries whose status differs from
+        :code:`values` (one status per entry). Nothing is changed.
+        '''
+
+        values = self._flags(values)
+
+        if self._array is not None:
+
+            return numpy.flatnonzero(
+                self._array != numpy.frombuffer(values, dtype=numpy.uint8))
+
+        return self._find(self._xor(values), 1)
+
+    def bind(self, index, switch):
+        '''
+        Make :code:`switch` (a :code:`SlideSwitch`) show the entry at
+        :code:`index` and write its clicks back to the model.
+        '''
+
+        self.unbind(index)
+
+        switch.setState(bool(self._states[index]), notify=False)
+
+        slot = partial(self._viewToggled, index)
+
+        switch.toggled.connect(slot)
+
+        self._views[index] = (switch, slot)
+
+    def unbind(self, index):
+
+        view = self._views.pop(index, None)
+
+        if view is not None:
+
+            switch, slot = view
+
+            switch.toggled.disconnect(slot)
+
+    def bindBank(self, bank, start=0):
+        '''
+        Make the cells of :code:`bank` (a :code:`SlideSwitchBank`) show the
+        entries from :code:`start` on, cell i showing entry
+        :code:`start + i`.
+        '''
+
+        stop = start + bank.count()
+
+        if start < 0 or stop > len(self._states):
+
+            raise ValueError(
+                'Input argument "start"'
+                + ' must leave room for every cell of the bank')
+
+        self.unbindBank(bank)
+
+        blocked = bank.blockSignals(True)
+
+        for i in range(bank.count()):
+
+            bank.setChecked(i, self._states[start + i])
+
+        bank.blockSignals(blocked)
+
+        slot = partial(self._bankToggled, start)
+
+        bank.toggled.connect(slot)
+
+        self._banks.append((start, stop, bank, slot))
+
+    def unbindBank(self, bank):
+
+        for entry in self._banks:
+
+            if entry[2] is bank:
+
+                self._banks.remove(entry)
+
+                bank.toggled.disconnect(entry[3])
+
+                break
+
+    def _flags(self, values):
+        '''
+        :code:`values` as bytes of 0 and 1, one per entry.
+        '''
+
+        if numpy is not None and isinstance(values, numpy.ndarray):
+
+            values = (values != 0).astype(numpy.uint8).tobytes()
+
+        elif (not isinstance(values, (bytes, bytearray))
+                or values.translate(None, b'\x00\x01')):
+
+            values = bytes(bytearray(1 if value else 0 for value in values))
+
+        if len(values) != len(self._states):
+
+            raise ValueError(
+                'Input argument "values"'
+                + ' must have one status per entry of the model')
+
+        return values
+
+    def _onesInt(self):
+
+        if self._ones is None:
+
+            self._ones = int.from_bytes(b'\x01' * len(self._states), 'big')
+
+        return self._ones
+
+    def _xor(self, values):
+
+        size = len(self._states)
+
+        return (int.from_bytes(self._states, 'big')
+                ^ int.from_bytes(values, 'big')).to_bytes(size, 'big')
+
+    @staticmethod
+    def _find(data, value):
+
+        indices = []
+
+        needle = bytes(bytearray([value]))
+
+        index = data.find(needle)
+
+        while index >= 0:
+
+            indices.append(index)
+
+            index = data.find(needle, index + 1)
+
+        return indices
+
+    def _replace(self, new, animate):
+        '''
+        Store :code:`new` (bytes or a NumPy array) as the statuses, update
+        the views of the entries that changed and notify.
+        '''
+
+        if self._array is not None:
+
+            if not isinstance(new, numpy.ndarray):
+
+                new = numpy.frombuffer(new, dtype=numpy.uint8)
+
+            changed = numpy.flatnonzero(self._array != new)
+
+            self._array[:] = new
+
+        else:
+
+            changed = self._find(self._xor(new), 1)
+
+            self._states[:] = new
+
+        if len(changed):
+
+            self._updateViews(changed, animate)
+
+            self.statesChanged.emit(changed)
+
+        return changed
+
+    def _updateViews(self, changed, animate):
+
+        states = self._states
+
+        views = self._views
+
+        if views:
+
+            if len(changed) <= len(views):
+
+                indices = [int(index) for index in changed if index in views]
+
+            else:
+
+                # fewer views than changes: look the views up instead
+                indices = [index for index in views
+                           if self._contains(changed, index)]
+
+            for index in indices:
+
+                views[index][0].setState(
+                    bool(states[index]), animate=animate, notify=False)
+
+        for start, stop, bank, slot in self._banks:
+
+            first = bisect_left(changed, start)
+
+            last = bisect_left(changed, stop)
+
+            if first == last:
+
+                continue
+
+            blocked = bank.blockSignals(True)
+
+            for index in changed[first:last]:
+
+                index = int(index)
+
+                bank.setChecked(index - start, states[index], animate=animate)
+
+            bank.blockSignals(blocked)
+
+    @staticmethod
+    def _contains(changed, index):
+
+        position = bisect_left(changed, index)
+
+        return position < len(changed) and changed[position] == index
+
+    def _viewToggled(self, index, checked):
+
+        if bool(self._states[index]) != checked:
+
+            self._states[index] = checked
+
+            self.statesChanged.emit([index])
+
+    def _bankToggled(self, start, index, checked):
+
+        self._viewToggled(start + index, checked)
@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+
+'''
+Swipe-to-toggle over a container of slide switches.
+
+A :code:`SlideSwitch` only reacts to a click on itself, so setting a row
+of switches takes one click per switch. With :code:`SlideSwitchSwipe`
+installed on a container, pressing a switch and dragging into the next
+ones toggles the pressed switch and sets every switch the pointer crosses
+to that same new status, until the button is released.
+
+The press is left to the pressed switch, so a click still emits
+:code:`pressed`, :code:`released` and :code:`clicked` and the thumb can
+still be dragged with :code:`SlideSwitchDragger`. The gesture only takes
+over once the pointer enters another switch: the thumb drag in progress,
+if any, is cancelled and the pressed switch is released (:code:`released`
+is emitted) without a click.
+A thumb dragged past the end of its switch into a neighbouring one thus
+turns into a swipe.
+
+While the button is down Qt sends every move to the pressed switch, so
+the switch under the pointer is looked up in a spatial index: a uniform
+grid of buckets, each listing the rectangles of the switches it
+overlaps. A lookup only scans the few switches of one bucket, whatever
+the number of switches. The index is rebuilt once after any change of
+the layout (switches added, removed, moved, resized, shown or hidden),
+coalesced to one rebuild per event loop pass.
+'''
+
+from PyQt5 import sip
+from PyQt5.QtCore import QEvent, QObject, QPoint, QTimer, Qt, pyqtSignal
+
+from slideSwitch import SlideSwitch, SlideSwitchDragger
+
+# events of the container and of the switches that invalidate the index
+_CONTAINER_EVENTS = frozenset((
+    QEvent.ChildAdded,
+    QEvent.ChildRemoved,
+    QEvent.LayoutRequest,
+    QEvent.Resize,
+    QEvent.Show,
+))
+
+_SWITCH_EVENTS = frozenset((
+    QEvent.Move,
+    QEvent.Resize,
+    QEvent.Show,
+    QEvent.Hide,
+    QEvent.ParentChange,
+))
+
+_PRESS_EVENTS = frozenset((
+    QEvent.MouseButtonPress,
+    QEvent.MouseButtonDblClick,
+))
+
+
+class SlideSwitchSwipe(QObject):
+    '''
+    Press-and-drag gesture setting many slide switches of a container.
+
+    Once the pointer leaves the pressed switch for another one, the
+    pressed switch is toggled and every enabled switch crossed afterwards
+    is set to its new status, emitting :code:`toggled` as if it were
+    clicked. :code:`swipeFinished` lists the switches changed by the
+    gesture once the button is released. Presses that never reach
+    another switch are plain clicks or thumb drags of the pressed switch.
+    '''
+
+    # the switches whose status changed, in the order they were crossed
+    swipeFinished = pyqtSignal(list)
+
+    def __init__(self, container, parent=None, animate=True):
+        '''
+        Constructor of the SlideSwitchSwipe object.
+
+        Parameters
+        -----------
+        container : QWidget
+
+            The widget whose descendant slide switches take part in the
+            gesture, e.g. a :code:`SlideSwitchPanel` or the widget of a
+            scroll area.
+
+        parent : QObject
+
+            The parent object for the gesture
+
+            Default = None, i.e., :code:`container`.
+
+        animate : bool
+
+            Whether switches set by the gesture animate like after a
+            click.
+
+            Default = True
+        '''
+
+        super(SlideSwitchSwipe, self).__init__(
+            container if parent is None else parent)
+
+        self._container = container
+
+        self.animate = animate
+
+        self._enabled = True
+
+        # (bucket column, bucket row) -> [(x0, y0, x1, y1, switch), ...]
+        self._buckets = {}
+
+        # switch -> its top left corner in container coordinates
+        self._origins = {}
+
+        self._bucket_w = 1
+
+        self._bucket_h = 1
+
+        # sampling step along the pointer path, in pixels
+        self._step = 1
+
+        self._dirty = True
+
+        self._refresh_timer = QTimer(self)
+
+        self._refresh_timer.setSingleShot(True)
+
+        self._refresh_timer.timeout.connect(self._refreshIfDirty)
+
+        # gesture state: pressed switch, whether the gesture has taken
+        # over from it, its origin, the status being set, the last
+        # pointer position, the last switch hit and the switches changed
+        # so far
+        self._switch = None
+
+        self._active = False
+
+        self._origin = None
+
+        self._state = False
+
+        self._last = None
+
+        self._last_hit = None
+
+        self._changed = []
+
+        container.installEventFilter(self)
+
+        self.refresh()
+
+    def container(self):
+
+        return self._container
+
+    def isEnabled(self):
+
+        return self._enabled
+
+    def setEnabled(self, enabled):
+        '''
+        Turn the gesture on or off. Switches react to clicks as usual
+        while it is off.
+        '''
+
+        self._enabled = bool(enabled)
+
+        if not enabled:
+
+            self._switch = None
+
+            self._active = False
+
+    def isSwiping(self):
+        '''
+        Whether a gesture has taken over from the pressed switch.
+        '''
+
+        return self._active
+
+    def switchAt(self, pos):
+        '''
+        The visible slide switch under :code:`pos` (container
+        coordinates), or None.
+        '''
+
+        if self._dirty:
+
+            self.refresh()
+
+        return self._hit(pos.x(), pos.y())
+
+    def refresh(self):
+        '''
+        Rebuild the spatial index now. Changes of the layout schedule a
+        rebuild by themselves; call this after moving switches by other
+        means, e.g. reparenting them into a nested widget.
+        '''
+
+        self._dirty = False
+
+        container = self._container
+
+        entries = []
+
+        origins = {}
+
+        min_side = None
+
+        max_w = max_h = 1
+
+        for switch in container.findChildren(SlideSwitch):
+
+            # also catches presses and layout changes of the switch
+            switch.installEventFilter(self)
+
+            if not switch.isVisibleTo(container):
+
+                continue
+
+            if switch.parentWidget() is container:
+
+                origin = switch.pos()
+
+            else:
+
+                origin = switch.mapTo(container, QPoint(0, 0))
+
+            x0 = origin.x()
+
+            y0 = origin.y()
+
+            w = switch.width()
+
+            h = switch.height()
+
+            if w <= 0 or h <= 0:
+
+                continue
+
+            entries.append((x0, y0, x0 + w, y0 + h, switch))
+
+            origins[switch] = (x0, y0)
+
+            max_w = max(max_w, w)
+
+            max_h = max(max_h, h)
+
+            side = min(w, h)
+
+            min_side = side if min_side is None else min(min_side, side)
+
+        # buckets as large as the largest switch: a switch overlaps at
+        # most four buckets
+        buckets = {}
+
+        for entry in entries:
+
+            x0, y0, x1, y1 = entry[:4]
+
+            for column in range(x0 // max_w, (x1 - 1) // max_w + 1):
+
+                for row in range(y0 // max_h, (y1 - 1) // max_h + 1):
+
+                    bucket = buckets.get((column, row))
+
+                    if bucket is None:
+
+                        buckets[(column, row)] = [entry]
+
+                    else:
+
+                        bucket.append(entry)
+
+        self._buckets = buckets
+
+        self._origins = origins
+
+        self._bucket_w = max_w
+
+        self._bucket_h = max_h
+
+        self._step = max(1, (min_side or 2) // 2)
+
+        if self._switch is not None:
+
+            self._origin = origins.get(self._switch, self._origin)
+
+    def eventFilter(self, obj, event):
+
+        etype = event.type()
+
+        if obj is self._container:
+
+            if etype in _CONTAINER_EVENTS:
+
+                self._invalidate()
+
+            return False
+
+        if etype in _SWITCH_EVENTS:
+
+            self._invalidate()
+
+            return False
+
+        if not self._enabled:
+
+            return False
+
+        if etype in _PRESS_EVENTS:
+
+            if (event.button() == Qt.LeftButton
+                    and isinstance(obj, SlideSwitch) and obj.isEnabled()):
+
+                # the switch gets the press too, see the module doc
+                self._begin(obj, event.pos())
+
+        elif obj is self._switch:
+
+            if etype == QEvent.MouseMove:
+
+                self._extend(event.pos())
+
+                return self._active
+
+            if (etype == QEvent.MouseButtonRelease
+                    and event.button() == Qt.LeftButton):
+
+                self._extend(event.pos())
+
+                return self._finish()
+
+        return False
+
+    def _invalidate(self):
+
+        if not self._dirty:
+
+            self._dirty = True
+
+            self._refresh_timer.start(0)
+
+    def _refreshIfDirty(self):
+
+        if self._dirty:
+
+            self.refresh()
+
+    def _hit(self, x, y):
+
+        bucket = self._buckets.get((x // self._bucket_w, y // self._bucket_h))
+
+        if bucket:
+
+            for x0, y0, x1, y1, switch in bucket:
+
+                if x0 <= x < x1 and y0 <= y < y1:
+
+                    return switch
+
+        return None
+
+    def _begin(self, switch, pos):
+
+        if self._dirty:
+
+            self.refresh()
+
+        origin = self._origins.get(switch)
+
+        if origin is None:
+
+            origin = switch.mapTo(self._container, QPoint(0, 0))
+
+            origin = (origin.x(), origin.y())
+
+        self._switch = switch
+
+        self._origin = origin
+
+        self._active = False
+
+        self._state = not switch.isChecked()
+
+        self._changed = []
+
+        self._last = (origin[0] + pos.x(), origin[1] + pos.y())
+
+        self._last_hit = switch
+
+    def _extend(self, pos):
+        '''
+        Set the switches on the way from the last pointer position to
+        :code:`pos` (coordinates of the pressed switch).
+        '''
+
+        if self._dirty:
+
+            self.refresh()
+
+        x = self._origin[0] + pos.x()
+
+        y = self._origin[1] + pos.y()
+
+        last_x, last_y = self._last
+
+        dx = x - last_x
+
+        dy = y - last_y
+
+        # sample the path densely enough not to jump over a switch
+        steps = max(abs(dx), abs(dy)) // self._step + 1
+
+        for i in range(1, steps + 1):
+
+            switch = self._hit(last_x + dx * i // steps,
+                               last_y + dy * i // steps)
+
+            if switch is not None and switch is not self._last_hit:
+
+                if not self._active:
+
+                    self._takeOver()
+
+                self._set(switch)
+
+        self._last = (x, y)
+
+    def _takeOver(self):
+        '''
+        Take the pointer from the pressed switch: no thumb drag and no
+        click, and the switch takes the new status like the others.
+        '''
+
+        switch = self._switch
+
+        self._active = True
+
+        if sip.isdeleted(switch):
+
+            return
+
+        dragger = SlideSwitchDragger._instance
+
+        if dragger is not None:
+
+            dragger.cancel(switch)
+
+        if switch.isDown():
+
+            switch.setDown(False)
+
+            switch.released.emit()
+
+        self._set(switch)
+
+    def _set(self, switch):
+
+        self._last_hit = switch
+
+        if sip.isdeleted(switch) or not switch.isEnabled():
+
+            return
+
+        if switch.isChecked() != self._state:
+
+            switch.setState(self._state, animate=self.animate)
+
+            self._changed.append(switch)
+
+    def _finish(self):
+        '''
+        End the gesture. Returns whether it had taken over, i.e. whether
+        the release is its own rather than the pressed switch's.
+        '''
+
+        active = self._active
+
+        changed = self._changed
+
+        self._switch = None
+
+        self._active = False
+
+        self._last_hit = None
+
+        self._changed = []
+
+        if active:
+
+            self.swipeFinished.emit(changed)
+
+        return active
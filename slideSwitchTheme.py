@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+'''
+Named colour themes for slide switches.
+
+Giving every switch its own :code:`QPalette` and calling
+:code:`SlideSwitch.setPalette` and :code:`update()` one switch at a time
+makes a theme change over thousands of switches visibly slow. A
+:code:`SlideSwitchTheme` holds the track, thumb and text colours once;
+applying it maps each distinct :code:`SlideSwitchStyle` in use to its
+themed (interned, hence shared) counterpart a single time and restyles
+all the targets in one pass, with the updates of their windows suspended
+so that each window repaints once.
+
+:code:`SlideSwitchThemeRegistry.instance()` keeps themes by name and
+switches every slide switch of the application at runtime (switches,
+banks, panels and the delegates of item views), e.g. between a day and
+a night theme.
+'''
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from slideSwitch import SlideSwitch
+from slideSwitchDelegate import SlideSwitchDelegate
+from slideSwitchGrid import SlideSwitchGrid
+from slideSwitchPanel import SlideSwitchPanel
+
+
+class SlideSwitchTheme(object):
+    '''
+    Track, thumb and text colours of slide switches, as ARGB integers in
+    the order (off, on), like :code:`SlideSwitchStyle`.
+    '''
+
+    __slots__ = ('track_colors', 'thumb_colors', 'text_colors')
+
+    def __init__(self, track_colors, thumb_colors, text_colors):
+
+        self.track_colors = tuple(track_colors)
+
+        self.thumb_colors = tuple(thumb_colors)
+
+        self.text_colors = tuple(text_colors)
+
+    @classmethod
+    def fromPalette(cls, palette):
+        '''
+        Theme with the colours :code:`SlideSwitchStyle.fromPalette` takes
+        from :code:`palette`.
+        '''
+
+        track_colors = (
+            palette.shadow().color().rgba(),
+            palette.highlight().color().rgba(),
+        )
+
+        text_colors = (
+            palette.text().color().rgba(),
+            palette.highlightedText().color().rgba(),
+        )
+
+        return cls(track_colors, track_colors, text_colors)
+
+    def restyle(self, style):
+        '''
+        The (interned) style :code:`style` takes under this theme.
+        '''
+
+        return style.replace(
+            track_colors=self.track_colors,
+            thumb_colors=self.thumb_colors,
+            text_colors=self.text_colors,
+        )
+
+    def apply(self, targets=None):
+        '''
+        Apply the theme, see :code:`applyThemes()`. Returns the number of
+        targets restyled.
+        '''
+
+        return applyThemes([(self, targets)])
+
+
+def applyThemes(assignments):
+    '''
+    Apply several themes in one pass.
+
+    Parameters
+    -----------
+    assignments : iterable of (SlideSwitchTheme, targets)
+
+        Targets are an iterable of objects with :code:`switchStyle()` and
+        :code:`setSwitchStyle()` (:code:`SlideSwitch`,
+        :code:`SlideSwitchBank`, :code:`SlideSwitchPanel`,
+        :code:`SlideSwitchDelegate`) or :code:`SlideSwitchGroup` objects,
+        whose switches are used. None stands for every slide switch,
+        bank, panel and delegate of the application. Every switch of a
+        panel, created or not, is themed along with the panel.
+
+    The windows of the widgets restyled repaint once, after every target
+    has been restyled; views repaint the cells of their delegates.
+    Returns the number of targets restyled.
+    '''
+
+    resolved = []
+
+    for theme, targets in assignments:
+
+        if targets is None:
+
+            targets = _allTargets()
+
+        else:
+
+            expanded = []
+
+            for target in targets:
+
+                if hasattr(target, 'switches'):
+
+                    expanded.extend(target.switches())
+
+                else:
+
+                    expanded.append(target)
+
+            targets = expanded
+
+        resolved.append((theme, targets))
+
+    windows = []
+
+    for theme, targets in resolved:
+
+        for target in targets:
+
+            if isinstance(target, QWidget):
+
+                window = target.window()
+
+                if window not in windows and window.updatesEnabled():
+
+                    windows.append(window)
+
+    for window in windows:
+
+        window.setUpdatesEnabled(False)
+
+    count = 0
+
+    try:
+
+        for theme, targets in resolved:
+
+            # each distinct style is themed once
+            styles = {}
+
+            def restyle(style):
+
+                new_style = styles.get(style)
+
+                if new_style is None:
+
+                    new_style = styles[style] = theme.restyle(style)
+
+                return new_style
+
+            for target in targets:
+
+                if isinstance(target, SlideSwitchPanel):
+
+                    target.mapSwitchStyles(restyle)
+
+                else:
+
+                    target.setSwitchStyle(restyle(target.switchStyle()))
+
+                count += 1
+
+    finally:
+
+        for window in windows:
+
+            # re-enabling updates repaints the whole window once
+            window.setUpdatesEnabled(True)
+
+    return count
+
+
+def _allTargets():
+    '''
+    Every slide switch, bank, panel and delegate of the application. The
+    switches of panels are left to their panel.
+    '''
+
+    targets = []
+
+    for widget in QApplication.allWidgets():
+
+        if isinstance(widget, SlideSwitchGrid):
+
+            targets.append(widget)
+
+        elif (isinstance(widget, SlideSwitch)
+                and not isinstance(widget.parentWidget(), SlideSwitchPanel)):
+
+            targets.append(widget)
+
+    targets.extend(SlideSwitchDelegate.instances())
+
+    return targets
+
+
+class SlideSwitchThemeRegistry(QObject):
+    '''
+    Themes by name and the theme of the application. Use the application
+    wide :code:`instance()`.
+    '''
+
+    # name of the theme applied to every switch
+    themeChanged = pyqtSignal(str)
+
+    _instance = None
+
+    def __init__(self, parent=None):
+
+        super(SlideSwitchThemeRegistry, self).__init__(parent)
+
+        self._themes = {}
+
+        self._current = None
+
+    @classmethod
+    def instance(cls):
+
+        if cls._instance is None:
+
+            cls._instance = cls()
+
+        return cls._instance
+
+    def register(self, name, theme):
+        '''
+        Store :code:`theme` (a :code:`SlideSwitchTheme`, or a
+        :code:`QPalette` to take the colours from) under :code:`name`,
+        replacing any theme of that name.
+        '''
+
+        if not isinstance(theme, SlideSwitchTheme):
+
+            theme = SlideSwitchTheme.fromPalette(theme)
+
+        self._themes[name] = theme
+
+        return theme
+
+    def theme(self, name):
+
+        try:
+
+            return self._themes[name]
+
+        except KeyError:
+
+            raise ValueError('Unknown theme "{0}"'.format(name))
+
+    def names(self):
+
+        return sorted(self._themes)
+
+    def currentTheme(self):
+        '''
+        Name of the theme last applied to every switch, or None.
+        '''
+
+        return self._current
+
+    def apply(self, name, targets=None):
+        '''
+        Apply the theme :code:`name` to :code:`targets` (see
+        :code:`applyThemes()`), or to every slide switch of the
+        application if None, which also makes it the current theme.
+        Returns the number of targets restyled.
+        '''
+
+        count = applyThemes([(self.theme(name), targets)])
+
+        if targets is None:
+
+            self._current = name
+
+            self.themeChanged.emit(name)
+
+        return count